@@ -4,6 +4,15 @@ import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle
 import time
 import matplotlib.animation as animation
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithm.bfs_final import distance_field
+from algorithm.search_trace import SearchTrace
+
+# Số landmark mặc định cho heuristic ALT
+DEFAULT_LANDMARKS = 8
 
 def manhattan_distance(p1, p2):
     """
@@ -15,120 +24,146 @@ def manhattan_distance(p1, p2):
     """
     return abs(p1[0] - p2[0]) + abs(p1[1] - p2[1])
 
-def find_path(maze_obj, return_search_steps=False):
+def find_path(maze_obj, return_search_steps=False, heuristic=None, stats=None):
     """
     Tìm đường đi từ điểm bắt đầu đến điểm kết thúc trong mê cung
     sử dụng thuật toán A* với heuristic là Manhattan Distance
     
+    Các ô được đánh chỉ số tuyến tính trên lưới có thêm viền tường; g_score và heuristic là
+    mảng int32, mỗi phần tử của hàng đợi ưu tiên là một số nguyên duy nhất
+    (f << 2*bits) | (g << bits) | count, với count là số thứ tự lần đẩy vào hàng đợi,
+    và pushed[count] cho biết ô tương ứng. Thứ tự so sánh giống hệt bộ (f_score, g_score, count)
+    nên đường đi, thứ tự thăm và frontier giống hệt bản dùng tuple
+    
     maze_obj: instance của lớp Maze
     return_search_steps: bool - nếu True, hàm sẽ trả về thêm các bước tìm kiếm
+    heuristic: mảng int32 phẳng trên lưới có viền (height+2)*(width+2) thay cho Manhattan,
+               phải nhất quán (consistent), ví dụ heuristic ALT của alt_heuristic
+    stats: dict hoặc None - nếu là dict, hàm ghi số ô đã mở rộng vào stats["expansions"]
+           (chỉ là một biến đếm, không cần ghi lại các bước)
     
     Trả về:
     - path: list các tọa độ (x, y) thể hiện đường đi từ điểm bắt đầu đến điểm kết thúc
            hoặc None nếu không tìm thấy đường đi
     - search_steps: list các tọa độ (x, y) theo thứ tự được thăm (nếu return_search_steps=True)
-    - frontier_history: list các list tọa độ (x, y) thể hiện frontier tại mỗi bước (nếu return_search_steps=True)
+    - frontier_history: SearchTrace - vết sự kiện push/pop/visit của open set, frontier_history[i] là
+      list các tọa độ (x, y) trong frontier sau bước i, dựng lại khi cần (nếu return_search_steps=True)
     """
-    maze = maze_obj.maze  
-    start = maze_obj.start
-    end = maze_obj.end
-    height, width = maze.shape  
-    
-    # Tạo ma trận visited để theo dõi các ô đã thăm
-    visited = np.zeros((height, width), dtype=bool)
-    
-    # Tạo ma trận parent để lưu trữ đường đi
-    parent = np.zeros((height, width, 2), dtype=int)
-    parent.fill(-1)  # Khởi tạo tất cả các giá trị là -1
-    
-    # Tạo ma trận g_score để lưu trữ chi phí từ điểm bắt đầu đến mỗi ô
-    g_score = np.full((height, width), np.inf)
-    g_score[start] = 0
-
-    # Tạo ma trận f_score để lưu trữ chi phí ước tính từ mỗi ô đến đích
-    f_score = np.full((height, width), np.inf)
-    f_score[start] = manhattan_distance(start, end)
-    
-    # Khởi tạo hàng đợi ưu tiên cho A*
-    # Mỗi phần tử trong hàng đợi là (f_score, g_score, vị trí)
-    # Sử dụng g_score trong trường hợp f_score bằng nhau
-    # Ưu tiên xét điểm gần điểm xuất phát hơn
-    # Thêm biến đếm để tránh so sánh vị trí khi f_score và g_score bằng nhau
-    # Nếu hai điểm có f_score và g_score bằng nhau, điểm nào có score nhỏ hơn xét trc
+    grid = np.asarray(maze_obj.maze)
+    start = tuple(maze_obj.start)
+    end = tuple(maze_obj.end)
+    height, width = grid.shape
+    padded_width = width + 2
+    
+    # closed = 1 cho tường, viền và các ô đã thăm
+    padded = np.ones((height + 2, padded_width), dtype=np.uint8)
+    padded[1:-1, 1:-1] = grid != 0
+    closed = bytearray(padded.tobytes())
+    num_open = height*width - int(np.count_nonzero(grid))
+    
+    # Heuristic Manhattan tới đích của mọi ô, tính một lần bằng NumPy
+    if heuristic is None:
+        rows = np.abs(np.arange(-1, height + 1, dtype=np.int32) - end[0])
+        cols = np.abs(np.arange(-1, width + 1, dtype=np.int32) - end[1])
+        heuristic = (rows[:, None] + cols[None, :]).ravel()
+    heuristic = memoryview(heuristic)
+    
+    # Tạo mảng g_score để lưu trữ chi phí từ điểm bắt đầu đến mỗi ô
+    g_score_arr = np.full(len(closed), np.iinfo(np.int32).max, dtype=np.int32)
+    g_score = memoryview(g_score_arr)
+    parent = memoryview(np.full(len(closed), -1, dtype=np.int32))
+    
+    # Mỗi ô được mở rộng nhiều nhất một lần và đẩy tối đa 4 hàng xóm,
+    # nên số lần đẩy vào hàng đợi bị chặn bởi 4*num_open + 1
+    capacity = 4*num_open + 1
+    pushed = memoryview(np.empty(capacity, dtype=np.int32))
+    bits = capacity.bit_length()
+    count_mask = (1 << bits) - 1
+    f_shift = 2*bits
+    
+    start_index = (start[0] + 1)*padded_width + start[1] + 1
+    end_index = (end[0] + 1)*padded_width + end[1] + 1
+    g_score[start_index] = 0
     count = 0
-    open_set = [(f_score[start], 0, count, start)]
-    heapq.heapify(open_set)
+    pushed[0] = start_index
+    open_set = [heuristic[start_index] << f_shift]
     
-    # Các hướng có thể di chuyển
-    directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+    # Các hướng có thể di chuyển: lên, phải, xuống, trái
+    offsets = (-padded_width, 1, padded_width, -1)
     
-    # Lưu các bước tìm kiếm và lịch sử frontier
+    # Lưu các bước tìm kiếm và vết sự kiện của frontier
     search_steps = [start] if return_search_steps else None
-    frontier_history = [[start]] if return_search_steps else None
+    frontier_history = SearchTrace(padded_width) if return_search_steps else None
+    if return_search_steps:
+        frontier_history.push(start_index)
+        frontier_history.mark()
+    
+    def to_position(index):
+        x, y = divmod(index, padded_width)
+        return (x - 1, y - 1)
         
     # A* để tìm đường đi
     found = False
-    while open_set and not found:
+    expansions = 0
+    heappop = heapq.heappop
+    heappush = heapq.heappush
+    while open_set:
         # Lấy node có f_score thấp nhất từ hàng đợi ưu tiên
-        _, _, _, current = heapq.heappop(open_set)
-        current_x, current_y = current
+        current = pushed[heappop(open_set) & count_mask]
+        if return_search_steps:
+            frontier_history.pop(current)
         
         # Nếu đã thăm node này rồi, bỏ qua
-        if visited[current_x, current_y]:
+        if closed[current]:
             continue
             
         # Đánh dấu đã thăm
-        visited[current_x, current_y] = True
+        closed[current] = 1
+        expansions += 1
         
         # Thêm vào search_steps
-        if return_search_steps and current != start:
-            search_steps.append(current)
+        if return_search_steps:
+            frontier_history.visit(current)
+            if current != start_index:
+                search_steps.append(to_position(current))
         
         # Kiểm tra nếu đã đến đích
-        if current == end:
+        if current == end_index:
             found = True
             break
         
-        # Kiểm tra các hướng có thể di chuyển
-        for dx, dy in directions:
-            next_x, next_y = current_x + dx, current_y + dy
-            next_pos = (next_x, next_y)
+        # Chi phí từ start đến các ô kề qua current
+        tentative_g_score = g_score[current] + 1
+        for offset in offsets:
+            next_index = current + offset
             
-            # Kiểm tra xem ô kế tiếp có hợp lệ không
-            if (0 <= next_x < height and 0 <= next_y < width and
-                    maze[next_x, next_y] == 0 and not visited[next_x, next_y]):
-                
-                # Tính toán g_score mới (chi phí từ start đến next_pos qua current)
-                tentative_g_score = g_score[current_x, current_y] + 1
+            # Nếu ô kế tiếp hợp lệ và tìm thấy đường đi tốt hơn đến nó
+            if not closed[next_index] and tentative_g_score < g_score[next_index]:
+                parent[next_index] = current
+                g_score[next_index] = tentative_g_score
                 
-                # Nếu tìm thấy đường đi tốt hơn đến next_pos
-                if tentative_g_score < g_score[next_x, next_y]:
-                    # Cập nhật parent
-                    parent[next_x, next_y] = [current_x, current_y]
-                    
-                    # Cập nhật g_score và f_score
-                    g_score[next_x, next_y] = tentative_g_score
-                    f_score[next_x, next_y] = tentative_g_score + manhattan_distance(next_pos, end)
-                    
-                    # Thêm vào hàng đợi ưu tiên
-                    count += 1
-                    heapq.heappush(open_set, (f_score[next_x, next_y], tentative_g_score, count, next_pos))
+                # Thêm vào hàng đợi ưu tiên với khóa nguyên (f, g, count)
+                count += 1
+                pushed[count] = next_index
+                heappush(open_set, ((tentative_g_score + heuristic[next_index]) << f_shift)
+                         | (tentative_g_score << bits) | count)
+                if return_search_steps:
+                    frontier_history.push(next_index)
         
-        # Lưu trạng thái frontier sau mỗi bước
+        # Kết thúc một bước: frontier sau bước này được dựng lại từ vết khi cần
         if return_search_steps:
-            # Chuyển đổi open_set thành list các tọa độ
-            current_frontier = [pos for _, _, _, pos in open_set]
-            frontier_history.append(current_frontier)
+            frontier_history.mark()
+    
+    if stats is not None:
+        stats["expansions"] = expansions
     
     # Tái tạo đường đi nếu tìm thấy
     if found:
         path = []
-        current = end
-        while current != start:
-            path.append(current)
-            current_x, current_y = current
-            parent_x, parent_y = parent[current_x, current_y]
-            current = (parent_x, parent_y)
+        current = end_index
+        while current != start_index:
+            path.append(to_position(current))
+            current = parent[current]
             
         path.append(start)
         path.reverse()  # Đảo ngược để có đường đi từ start đến end
@@ -141,6 +176,206 @@ def find_path(maze_obj, return_search_steps=False):
             return None, search_steps, frontier_history
         return None
 
+def select_landmarks(maze_obj, num_landmarks=DEFAULT_LANDMARKS):
+    """
+    Chọn landmark bằng phương pháp điểm xa nhất (farthest-point) và tính trước khoảng cách BFS
+    chính xác từ mỗi landmark tới mọi ô
+    
+    Landmark đầu tiên là ô xa maze_obj.start nhất; mỗi landmark tiếp theo là ô có khoảng cách
+    tới landmark gần nhất đã chọn lớn nhất. Mỗi bước là một lần bfs_final.distance_field
+    
+    maze_obj: instance của lớp Maze
+    num_landmarks: int - số landmark
+    
+    Trả về:
+    - landmarks: list các tọa độ (x, y)
+    - distances: mảng int32 (num_landmarks, (height+2)*(width+2)) trên lưới có viền,
+      -1 với tường và các ô không tới được từ landmark
+    """
+    distance, _ = distance_field(maze_obj)
+    height, width = distance.shape
+    reachable = distance >= 0
+    nearest = np.where(reachable, distance, -1)
+    
+    landmarks = []
+    distances = np.full((num_landmarks, height + 2, width + 2), -1, dtype=np.int32)
+    for i in range(num_landmarks):
+        landmark = np.unravel_index(int(np.argmax(nearest)), nearest.shape)
+        landmark = (int(landmark[0]), int(landmark[1]))
+        landmarks.append(landmark)
+        distance, _ = distance_field(maze_obj, landmark)
+        distances[i, 1:-1, 1:-1] = distance
+        nearest = np.where(reachable, np.minimum(nearest, distance), -1)
+    return landmarks, distances.reshape(num_landmarks, -1)
+
+def landmark_distances(maze_obj, num_landmarks=DEFAULT_LANDMARKS):
+    """
+    select_landmarks được lưu trong cache của Maze: các truy vấn sau trên cùng lưới dùng lại
+    bảng khoảng cách, tự tính lại khi lưới thay đổi
+    """
+    return maze_obj.cached(("landmarks", num_landmarks),
+                           lambda m: select_landmarks(m, num_landmarks))
+
+def alt_heuristic(maze_obj, end=None, num_landmarks=DEFAULT_LANDMARKS):
+    """
+    Heuristic ALT (A*, Landmarks, Triangle inequality) tới end cho mọi ô trên lưới có viền
+    
+    Với mỗi landmark L, bất đẳng thức tam giác cho d(v, end) >= |d(L, v) - d(L, end)|.
+    Heuristic là giá trị lớn nhất của các cận này và khoảng cách Manhattan; landmark không tới
+    được end bị bỏ qua. Mọi cận đều nhất quán nên giá trị lớn nhất cũng nhất quán
+    
+    Trả về: mảng int32 phẳng dùng được cho find_path(..., heuristic=...)
+    """
+    end = tuple(maze_obj.end if end is None else end)
+    _, distances = landmark_distances(maze_obj, num_landmarks)
+    height, width = np.asarray(maze_obj.maze).shape
+    padded_width = width + 2
+    end_index = (end[0] + 1)*padded_width + end[1] + 1
+    
+    rows = np.abs(np.arange(-1, height + 1, dtype=np.int32) - end[0])
+    cols = np.abs(np.arange(-1, width + 1, dtype=np.int32) - end[1])
+    heuristic = (rows[:, None] + cols[None, :]).ravel()
+    for landmark_distance in distances:
+        to_end = landmark_distance[end_index]
+        if to_end < 0:
+            continue
+        bound = np.abs(landmark_distance - to_end)
+        bound[landmark_distance < 0] = 0
+        np.maximum(heuristic, bound, out=heuristic)
+    return heuristic
+
+def find_path_alt(maze_obj, return_search_steps=False, num_landmarks=DEFAULT_LANDMARKS, stats=None):
+    """
+    Tìm đường đi bằng A* với heuristic ALT thay cho Manhattan
+    
+    Bảng khoảng cách landmark được tính một lần cho mỗi lưới (lưu trong cache của Maze), nên
+    các truy vấn lặp lại trên cùng mê cung chỉ tốn chi phí dựng heuristic và tìm kiếm
+    
+    Trả về: giống find_path
+    """
+    heuristic = alt_heuristic(maze_obj, num_landmarks=num_landmarks)
+    return find_path(maze_obj, return_search_steps=return_search_steps, heuristic=heuristic, stats=stats)
+
+def find_path_bucket(maze_obj, return_search_steps=False, stats=None):
+    """
+    Tìm đường đi bằng A* với hàng đợi bucket (Dial) thay cho heapq
+    
+    Mọi cạnh có chi phí 1 và Manhattan là heuristic nhất quán nên f_score của các ô được lấy ra
+    không bao giờ giảm: hàng đợi là một list các bucket đánh chỉ số theo f_score, con trỏ bucket
+    chỉ tiến về phía trước, mỗi lần đẩy/lấy là O(1). Trong cùng một bucket ô được đẩy sau
+    được lấy trước (LIFO), ưu tiên đi sâu theo hướng đích. Đường đi vẫn là ngắn nhất nhưng
+    thứ tự thăm có thể khác find_path
+    
+    maze_obj: instance của lớp Maze
+    return_search_steps: bool - nếu True, hàm sẽ trả về thêm các bước tìm kiếm
+    stats: dict hoặc None - nếu là dict, hàm ghi số ô đã mở rộng vào stats["expansions"]
+           (chỉ là một biến đếm, không cần ghi lại các bước)
+    
+    Trả về: giống find_path
+    """
+    grid = np.asarray(maze_obj.maze)
+    start = tuple(maze_obj.start)
+    end = tuple(maze_obj.end)
+    height, width = grid.shape
+    padded_width = width + 2
+    
+    # closed = 1 cho tường, viền và các ô đã thăm
+    padded = np.ones((height + 2, padded_width), dtype=np.uint8)
+    padded[1:-1, 1:-1] = grid != 0
+    closed = bytearray(padded.tobytes())
+    
+    rows = np.abs(np.arange(-1, height + 1, dtype=np.int32) - end[0])
+    cols = np.abs(np.arange(-1, width + 1, dtype=np.int32) - end[1])
+    heuristic = memoryview((rows[:, None] + cols[None, :]).ravel())
+    g_score = memoryview(np.full(len(closed), np.iinfo(np.int32).max, dtype=np.int32))
+    parent = memoryview(np.full(len(closed), -1, dtype=np.int32))
+    
+    start_index = (start[0] + 1)*padded_width + start[1] + 1
+    end_index = (end[0] + 1)*padded_width + end[1] + 1
+    g_score[start_index] = 0
+    
+    # buckets[f - base_f] chứa các ô có f_score = f; current là bucket đang xét
+    base_f = heuristic[start_index]
+    buckets = [[start_index]]
+    current_bucket = 0
+    offsets = (-padded_width, 1, padded_width, -1)
+    
+    search_steps = [start] if return_search_steps else None
+    frontier_history = SearchTrace(padded_width) if return_search_steps else None
+    if return_search_steps:
+        frontier_history.push(start_index)
+        frontier_history.mark()
+    
+    def to_position(index):
+        x, y = divmod(index, padded_width)
+        return (x - 1, y - 1)
+    
+    found = False
+    expansions = 0
+    bucket = buckets[0]
+    while True:
+        # Tiến tới bucket khác rỗng tiếp theo
+        while not bucket:
+            current_bucket += 1
+            if current_bucket == len(buckets):
+                break
+            bucket = buckets[current_bucket]
+        if not bucket:
+            break
+        current = bucket.pop()
+        if return_search_steps:
+            frontier_history.pop(current)
+        
+        if closed[current]:
+            continue
+        closed[current] = 1
+        expansions += 1
+        
+        if return_search_steps:
+            frontier_history.visit(current)
+            if current != start_index:
+                search_steps.append(to_position(current))
+        
+        if current == end_index:
+            found = True
+            break
+        
+        tentative_g_score = g_score[current] + 1
+        for offset in offsets:
+            next_index = current + offset
+            if not closed[next_index] and tentative_g_score < g_score[next_index]:
+                parent[next_index] = current
+                g_score[next_index] = tentative_g_score
+                f = tentative_g_score + heuristic[next_index] - base_f
+                while f >= len(buckets):
+                    buckets.append([])
+                buckets[f].append(next_index)
+                if return_search_steps:
+                    frontier_history.push(next_index)
+        
+        if return_search_steps:
+            frontier_history.mark()
+    
+    if stats is not None:
+        stats["expansions"] = expansions
+    
+    if found:
+        path = []
+        current = end_index
+        while current != start_index:
+            path.append(to_position(current))
+            current = parent[current]
+        path.append(start)
+        path.reverse()
+        
+        if return_search_steps:
+            return path, search_steps, frontier_history
+        return path
+    else:
+        if return_search_steps:
+            return None, search_steps, frontier_history
+        return None
+
 def print_maze_with_path(maze_obj, path):
     """
     In mê cung ra màn hình console với đường đi được biểu diễn bằng '-'
@@ -152,7 +387,7 @@ def print_maze_with_path(maze_obj, path):
         print("Không tìm thấy đường đi!")
         return
         
-    maze = maze_obj.maze.copy()
+    maze = np.array(maze_obj.maze)
     
     # Đánh dấu đường đi bằng giá trị 2
     for x, y in path:
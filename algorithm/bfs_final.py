@@ -0,0 +1,614 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.patches import Rectangle
+import time
+import matplotlib.animation as animation
+
+# Các hướng di chuyển dùng cho mảng hướng cha: lên, phải, xuống, trái
+# parent_dir[x, y] = d nghĩa là ô cha của (x, y) là (x - DIRECTIONS[d][0], y - DIRECTIONS[d][1])
+DIRECTIONS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+# BFS theo tầng chuyển sang mở rộng dày đặc (mặt nạ trên toàn lưới) khi frontier chiếm
+# nhiều hơn tỉ lệ này trên tổng số ô; frontier nhỏ được mở rộng thưa theo mảng chỉ số
+DENSE_FRONTIER_FRACTION = 1 / 16
+
+class QueueFrontierHistory:
+    """
+    Lịch sử frontier của BFS được đọc lười từ mảng hàng đợi
+    Sau bước thứ k (k ô đã được lấy ra), hàng đợi chính là đoạn queue[k:tails[k]] của mảng,
+    nên không cần sao chép toàn bộ hàng đợi ở mỗi bước
+    Mỗi phần tử khi được truy cập là list các tọa độ (x, y), giống list frontier_history cũ
+    """
+    def __init__(self, queue, tails, width):
+        self.queue = queue
+        self.tails = tails
+        self.width = width
+
+    def __len__(self):
+        return len(self.tails)
+
+    def __getitem__(self, step):
+        if step < 0:
+            step += len(self.tails)
+        if not 0 <= step < len(self.tails):
+            raise IndexError("frontier_history index out of range")
+        rows, cols = np.divmod(self.queue[step:self.tails[step]], self.width)
+        return list(zip((rows - 1).tolist(), (cols - 1).tolist()))
+
+    def __iter__(self):
+        for step in range(len(self.tails)):
+            yield self[step]
+
+def find_path(maze_obj, return_search_steps=False, stats=None):
+    """
+    Tìm đường đi từ điểm bắt đầu đến điểm kết thúc trong mê cung
+    sử dụng thuật toán BFS (Breadth-First Search)
+    
+    Các ô được đánh chỉ số tuyến tính trên lưới có thêm viền tường, hàng đợi là mảng int32
+    cấp phát trước (mỗi ô vào hàng đợi nhiều nhất một lần nên không bao giờ bị tràn)
+    
+    maze_obj: instance của lớp Maze
+    return_search_steps: bool - nếu True, hàm sẽ trả về thêm các bước tìm kiếm
+    stats: dict hoặc None - nếu là dict, hàm ghi số ô đã mở rộng vào stats["expansions"]
+           (chỉ là một biến đếm, không cần ghi lại các bước)
+    
+    Trả về:
+    - path: list các tọa độ (x, y) thể hiện đường đi từ điểm bắt đầu đến điểm kết thúc
+           hoặc None nếu không tìm thấy đường đi
+    - search_steps: list các tọa độ (x, y) theo thứ tự được thăm (nếu return_search_steps=True)
+    - frontier_history: hàng đợi (list tọa độ (x, y)) tại mỗi bước (nếu return_search_steps=True)
+    """
+    grid = np.asarray(maze_obj.maze)
+    start = maze_obj.start
+    end = maze_obj.end
+    height, width = grid.shape
+    padded_width = width + 2
+    
+    # blocked = 1 cho tường, viền và các ô đã vào hàng đợi
+    padded = np.ones((height + 2, padded_width), dtype=np.uint8)
+    padded[1:-1, 1:-1] = grid != 0
+    blocked = bytearray(padded.tobytes())
+    
+    # Các hướng có thể di chuyển: lên, phải, xuống, trái
+    offsets = (-padded_width, 1, padded_width, -1)
+    
+    start_index = (start[0] + 1)*padded_width + start[1] + 1
+    end_index = (end[0] + 1)*padded_width + end[1] + 1
+    
+    capacity = height*width - int(np.count_nonzero(grid)) + 1
+    queue_arr = np.empty(capacity, dtype=np.int32)
+    queue = memoryview(queue_arr)
+    parent_arr = np.empty(len(blocked), dtype=np.int32)
+    parent = memoryview(parent_arr)
+    
+    queue[0] = start_index
+    blocked[start_index] = 1
+    head, tail = 0, 1
+    tails = [1] if return_search_steps else None
+    
+    # BFS để tìm đường đi
+    found = False
+    while head < tail:
+        current = queue[head]
+        head += 1
+        if current == end_index:
+            found = True
+            if return_search_steps:
+                tails.append(tail)
+            break
+        
+        for offset in offsets:
+            next_index = current + offset
+            if not blocked[next_index]:
+                blocked[next_index] = 1
+                parent[next_index] = current
+                queue[tail] = next_index
+                tail += 1
+        
+        if return_search_steps:
+            tails.append(tail)
+    
+    # Các ô đã thăm chính là các ô đã được lấy ra khỏi hàng đợi
+    if stats is not None:
+        stats["expansions"] = head
+    
+    if return_search_steps:
+        rows, cols = np.divmod(queue_arr[:head], padded_width)
+        search_steps = list(zip((rows - 1).tolist(), (cols - 1).tolist()))
+        frontier_history = QueueFrontierHistory(queue_arr, tails, padded_width)
+    
+    # Tái tạo đường đi nếu tìm thấy
+    if found:
+        path = []
+        current = end_index
+        while current != start_index:
+            path.append(divmod(current, padded_width))
+            current = parent[current]
+        path.append(divmod(start_index, padded_width))
+        path = [(x - 1, y - 1) for x, y in reversed(path)]
+        
+        if return_search_steps:
+            return path, search_steps, frontier_history
+        return path
+    else:
+        if return_search_steps:
+            return None, search_steps, frontier_history
+        return None
+
+def _frontier_bfs(grid, start, stop=None):
+    """
+    BFS theo tầng: mở rộng toàn bộ frontier cùng lúc bằng các phép toán mảng NumPy
+    - các ô được đánh chỉ số tuyến tính trên lưới có viền tường nên phép dịch không bị tràn hàng
+    - frontier nhỏ: mảng chỉ số, hàng xóm = frontier + độ lệch, lọc bằng mặt nạ free,
+      giữ lần xuất hiện đầu tiên nên thứ tự frontier được giữ nguyên
+    - frontier lớn: mặt nạ bool trên toàn lưới, mỗi hướng là một phép dịch
+      AND với ô trống AND NOT đã thăm; cha được chọn theo thứ tự hướng và frontier mới
+      lấy từ np.flatnonzero nên theo thứ tự chỉ số, không theo thứ tự hàng đợi
+    distance luôn đúng. Cha của mỗi ô chỉ giống hệt BFS dùng hàng đợi khi mọi tầng đều
+    mở rộng thưa; sau một tầng dày đặc, đường đi vẫn ngắn nhất nhưng có thể khác find_path
+    
+    grid: mảng (height, width), 0 là đường đi
+    start: tọa độ (x, y) bắt đầu
+    stop: tọa độ (x, y) - nếu có, dừng ngay sau tầng chạm tới ô này
+    
+    Trả về (distance, parent_dir) trên lưới có viền và chiều rộng lưới có viền
+    """
+    height, width = grid.shape
+    padded_width = width + 2
+    free = np.zeros((height + 2, padded_width), dtype=bool)
+    free[1:-1, 1:-1] = grid == 0
+    free = free.ravel()
+    size = free.size
+    
+    distance = np.full(size, -1, dtype=np.int32)
+    parent_dir = np.full(size, -1, dtype=np.int8)
+    offsets = np.array([dx*padded_width + dy for dx, dy in DIRECTIONS], dtype=np.int64)
+    
+    start_index = (start[0] + 1)*padded_width + start[1] + 1
+    stop_index = None if stop is None else (stop[0] + 1)*padded_width + stop[1] + 1
+    free[start_index] = False
+    distance[start_index] = 0
+    frontier = np.array([start_index], dtype=np.int64)
+    dense_limit = max(1, int(free.sum() * DENSE_FRONTIER_FRACTION))
+    
+    level = 0
+    while len(frontier):
+        if stop_index is not None and distance[stop_index] >= 0:
+            break
+        level += 1
+        if len(frontier) < dense_limit:
+            # Mở rộng thưa: mỗi ô frontier sinh 4 hàng xóm theo đúng thứ tự hướng
+            neighbors = (frontier[:, None] + offsets).ravel()
+            dirs = np.tile(np.arange(4, dtype=np.int8), len(frontier))
+            keep = free[neighbors]
+            neighbors = neighbors[keep]
+            dirs = dirs[keep]
+            _, first = np.unique(neighbors, return_index=True)
+            first.sort()
+            frontier = neighbors[first]
+            parent_dir[frontier] = dirs[first]
+        else:
+            # Mở rộng dày đặc: dịch mặt nạ frontier theo từng hướng
+            frontier_mask = np.zeros(size, dtype=bool)
+            frontier_mask[frontier] = True
+            reached = np.zeros(size, dtype=bool)
+            for d, offset in enumerate(offsets.tolist()):
+                hit = np.zeros(size, dtype=bool)
+                if offset > 0:
+                    hit[offset:] = frontier_mask[:-offset]
+                else:
+                    hit[:offset] = frontier_mask[-offset:]
+                hit &= free
+                hit &= ~reached
+                parent_dir[hit] = d
+                reached |= hit
+            frontier = np.flatnonzero(reached)
+        free[frontier] = False
+        distance[frontier] = level
+    
+    return distance, parent_dir, padded_width
+
+def distance_field(maze_obj, start=None):
+    """
+    Tính khoảng cách BFS từ một ô tới mọi ô của mê cung (BFS theo tầng, vector hóa)
+    
+    maze_obj: instance của lớp Maze
+    start: tọa độ (x, y) bắt đầu (mặc định là maze_obj.start)
+    
+    Trả về:
+    - distance: mảng int32 (height, width), số bước từ start tới mỗi ô, -1 nếu không tới được
+    - parent_dir: mảng int8 (height, width), hướng đi từ ô cha tới ô đó (chỉ số trong DIRECTIONS),
+      -1 với ô bắt đầu và các ô không tới được
+    """
+    grid = np.asarray(maze_obj.maze)
+    start = maze_obj.start if start is None else start
+    distance, parent_dir, padded_width = _frontier_bfs(grid, start)
+    height, width = grid.shape
+    distance = distance.reshape(height + 2, padded_width)[1:-1, 1:-1].copy()
+    parent_dir = parent_dir.reshape(height + 2, padded_width)[1:-1, 1:-1].copy()
+    return distance, parent_dir
+
+def walk_back(parent_dir, start, end):
+    """
+    Dựng lại đường đi từ start tới end bằng cách đi ngược theo mảng hướng cha
+    
+    Trả về list các tọa độ (x, y) từ start tới end, hoặc None nếu end không tới được
+    """
+    x, y = end
+    if parent_dir[x, y] < 0 and (x, y) != tuple(start):
+        return None
+    path = [(x, y)]
+    while (x, y) != tuple(start):
+        dx, dy = DIRECTIONS[parent_dir[x, y]]
+        x, y = x - dx, y - dy
+        path.append((x, y))
+    path.reverse()
+    return path
+
+def find_path_frontier(maze_obj):
+    """
+    Tìm đường đi ngắn nhất bằng BFS theo tầng (vector hóa), dừng ngay khi tới maze_obj.end
+    rồi đi ngược theo mảng hướng cha từ đích về điểm bắt đầu
+    Đường đi có cùng độ dài với find_path nhưng có thể khác ô nếu có tầng mở rộng dày đặc
+    
+    maze_obj: instance của lớp Maze
+    
+    Trả về: list các tọa độ (x, y) từ điểm bắt đầu đến điểm kết thúc, hoặc None nếu không có đường đi
+    """
+    grid = np.asarray(maze_obj.maze)
+    start = tuple(maze_obj.start)
+    end = tuple(maze_obj.end)
+    _, parent_dir, padded_width = _frontier_bfs(grid, start, stop=end)
+    
+    start_index = (start[0] + 1)*padded_width + start[1] + 1
+    current = (end[0] + 1)*padded_width + end[1] + 1
+    if parent_dir[current] < 0 and current != start_index:
+        return None
+    offsets = [dx*padded_width + dy for dx, dy in DIRECTIONS]
+    parent_dir = memoryview(parent_dir)
+    path = []
+    while current != start_index:
+        path.append(divmod(current, padded_width))
+        current -= offsets[parent_dir[current]]
+    path.append(divmod(start_index, padded_width))
+    return [(x - 1, y - 1) for x, y in reversed(path)]
+
+def print_maze_with_path(maze_obj, path):
+    """
+    In mê cung ra màn hình console với đường đi được biểu diễn bằng '-'
+    
+    maze_obj: instance của lớp Maze
+    path: list các tọa độ (x, y) thể hiện đường đi
+    """
+    if path is None:
+        print("Không tìm thấy đường đi!")
+        return
+        
+    maze = np.array(maze_obj.maze)
+    
+    # Đánh dấu đường đi bằng giá trị 2
+    for x, y in path:
+        maze[x, y] = 2
+    
+    # In mê cung với đường đi
+    for row in maze:
+        print(''.join('#' if cell == 1 else '-' if cell == 2 else ' ' for cell in row))
+
+def visualize_maze_with_path(maze_obj, path):
+    """
+    Trực quan hóa mê cung với đường đi được đánh dấu
+    Đường đi sẽ đi qua tâm của mỗi ô
+    
+    maze_obj: instance của lớp Maze
+    path: list các tọa độ (x, y) thể hiện đường đi
+    """
+    if path is None:
+        print("Không tìm thấy đường đi để hiển thị!")
+        return
+        
+    maze = maze_obj.maze
+    height, width = maze.shape
+    
+    # Tạo hình vẽ
+    fig, ax = plt.subplots(figsize=(10, 10))
+    
+    # Vẽ nền trắng cho toàn bộ mê cung
+    ax.set_facecolor('white')
+    
+    # Duyệt qua tất cả các ô trong mê cung
+    for i in range(height):
+        for j in range(width):
+            if maze[i, j] == 1:  # Nếu là tường
+                # Tạo hình chữ nhật tô đặc
+                rect = Rectangle((j - 0.5, i - 0.5), 1, 1, facecolor='navy', edgecolor='navy')
+                ax.add_patch(rect)
+    
+    # Vẽ đường đi
+    if path:
+        # Chuyển đổi tọa độ cho đường đi
+        path_x = [y for x, y in path]
+        path_y = [x for x, y in path]
+        
+        # Vẽ đường đi
+        ax.plot(path_x, path_y, 'r-', linewidth=2)
+        
+        # Vẽ điểm tròn ở mỗi ô trên đường đi
+        ax.plot(path_x, path_y, 'ro', markersize=3)
+    
+    # Đánh dấu điểm bắt đầu và kết thúc
+    start = maze_obj.start
+    end = maze_obj.end
+    ax.plot(start[1], start[0], 'go', markersize=8)
+    ax.plot(end[1], end[0], 'bo', markersize=8)
+    
+    # Thiết lập giới hạn trục
+    ax.set_xlim(-0.5, width - 0.5)
+    ax.set_ylim(-0.5, height - 0.5)
+    
+    # Ẩn các trục
+    ax.set_xticks([])
+    ax.set_yticks([])
+    
+    # Đảo ngược trục y để phù hợp với hiển thị mê cung
+    ax.invert_yaxis()
+    
+    # Thiết lập tỷ lệ bằng nhau trên cả hai trục
+    ax.set_aspect('equal')
+    
+    plt.title('Maze Solution (BFS)')
+    plt.tight_layout()
+    plt.show()
+
+def visualize_search_process(maze_obj, speed=100):
+    """
+    Hiển thị quá trình tìm kiếm BFS trong mê cung qua animation
+    
+    maze_obj: instance của lớp Maze
+    speed: số millisecond cho mỗi bước animation (càng nhỏ càng nhanh)
+    """
+    path, search_steps, frontier_history = find_path(maze_obj, return_search_steps=True)
+    
+    maze = maze_obj.maze
+    height, width = maze.shape
+    
+    # Tạo hình vẽ
+    fig, ax = plt.subplots(figsize=(10, 10))
+    # Vẽ nền trắng cho toàn bộ mê cung
+    ax.set_facecolor('white')
+
+    # Duyệt qua tất cả các ô trong mê cung
+    for i in range(height):
+        for j in range(width):
+            if maze[i, j] == 1:  # Nếu là tường
+                # Tạo hình chữ nhật tô đặc
+                rect = Rectangle((j - 0.5, i - 0.5), 1, 1, facecolor='navy', edgecolor='navy')
+                ax.add_patch(rect)
+    
+    # Đánh dấu điểm bắt đầu và kết thúc
+    start = maze_obj.start
+    end = maze_obj.end
+    ax.plot(start[1], start[0], 'go', markersize=8)
+    ax.plot(end[1], end[0], 'bo', markersize=8)
+    
+    # Khởi tạo plot rỗng cho vùng đã thăm (frontier)
+    frontier_plot, = ax.plot([], [], 'co', markersize=6, alpha=0.6)
+    
+    # Khởi tạo plot rỗng cho vùng đang thăm hiện tại
+    current_plot, = ax.plot([], [], 'mo', markersize=7, alpha=0.8)
+    
+    # Khởi tạo plot rỗng cho vùng đã thăm xong (explored)
+    explored_plot, = ax.plot([], [], 'yo', markersize=4, alpha=0.4)
+    
+    # Khởi tạo plot rỗng cho đường đi
+    path_plot, = ax.plot([], [], 'r-', linewidth=2)
+    path_markers, = ax.plot([], [], 'ro', markersize=4)
+    
+    # Thiết lập giới hạn trục
+    ax.set_xlim(-0.5, width - 0.5)
+    ax.set_ylim(-0.5, height - 0.5)
+    
+    # Ẩn các trục
+    ax.set_xticks([])
+    ax.set_yticks([])
+    
+    # Đảo ngược trục y để phù hợp với hiển thị mê cung
+    ax.invert_yaxis()
+    
+    # Thiết lập tỷ lệ bằng nhau trên cả hai trục
+    ax.set_aspect('equal')
+    
+    # Tạo tiêu đề với thông tin
+    title = ax.set_title('Tìm kiếm BFS: Bước 0')
+    
+    # Thêm chú thích
+    legend_elements = [
+        plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='g', markersize=8, label='Điểm bắt đầu'),
+        plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='b', markersize=8, label='Điểm kết thúc'),
+        plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='c', markersize=8, label='Đang trong hàng đợi'),
+        plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='m', markersize=8, label='Đang xét'),
+        plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='y', markersize=8, label='Đã xét'),
+        plt.Line2D([0], [0], color='r', label='Đường đi')
+    ]
+    ax.legend(handles=legend_elements, loc='upper right', fontsize='small')
+    
+    def init():
+        frontier_plot.set_data([], [])
+        current_plot.set_data([], [])
+        explored_plot.set_data([], [])
+        path_plot.set_data([], [])
+        path_markers.set_data([], [])
+        title.set_text('Tìm kiếm BFS: Bước 0')
+        return frontier_plot, current_plot, explored_plot, path_plot, path_markers, title
+    
+    # Tính toán tổng số frame: số bước tìm kiếm + số bước hiển thị đường đi
+    total_exploration_frames = len(search_steps)
+    total_path_frames = len(path) if path else 0
+    # Thêm một vài frame chuyển tiếp giữa quá trình thăm và hiển thị đường đi
+    transition_frames = 5
+    total_frames = total_exploration_frames + transition_frames + total_path_frames
+    
+    def update(frame):
+        # Phân chia quá trình animation thành hai giai đoạn: thăm và hiển thị đường đi
+        if frame < total_exploration_frames:
+            # Giai đoạn 1: Hiển thị quá trình thăm
+            
+            # Ô hiện tại đang xét (màu tím)
+            if frame > 0:
+                current_cell = search_steps[frame]
+                current_plot.set_data([current_cell[1]], [current_cell[0]])
+            else:
+                current_plot.set_data([], [])
+                
+            # Các ô đã xét xong (màu vàng)
+            if frame > 1:
+                explored_y = [y for x, y in search_steps[:frame-1]]
+                explored_x = [x for x, y in search_steps[:frame-1]]
+                explored_plot.set_data(explored_y, explored_x)
+            else:
+                explored_plot.set_data([], [])
+                
+            # Các ô trong frontier - nằm trong hàng đợi (màu xanh)
+            if frame < len(frontier_history):
+                current_frontier = frontier_history[frame]
+                if current_frontier:
+                    frontier_y = [y for x, y in current_frontier]
+                    frontier_x = [x for x, y in current_frontier]
+                    frontier_plot.set_data(frontier_y, frontier_x)
+                else:
+                    frontier_plot.set_data([], [])
+            else:
+                frontier_plot.set_data([], [])
+                
+            # Hiển thị số lượng ô trong frontier
+            frontier_count = len(frontier_history[frame]) if frame < len(frontier_history) else 0
+            title.set_text(f'Tìm kiếm BFS: Bước {frame+1}/{total_exploration_frames} - Frontier: {frontier_count} ô')
+            
+            # Không hiển thị đường đi trong giai đoạn này
+            path_plot.set_data([], [])
+            path_markers.set_data([], [])
+            
+        elif frame < total_exploration_frames + transition_frames:
+            # Giai đoạn chuyển tiếp: giữ nguyên trạng thái cuối cùng của quá trình thăm
+            # nhưng thay đổi tiêu đề để chuẩn bị cho hiển thị đường đi
+            transition_step = frame - total_exploration_frames + 1
+            
+            # Hiển thị tất cả các ô đã thăm
+            if search_steps:
+                explored_y = [y for x, y in search_steps]
+                explored_x = [x for x, y in search_steps]
+                explored_plot.set_data(explored_y, explored_x)
+            
+            # Xóa hiển thị ô hiện tại và frontier khi chuyển sang giai đoạn tiếp theo
+            current_plot.set_data([], [])
+            frontier_plot.set_data([], [])
+            
+            # Thay đổi tiêu đề trong giai đoạn chuyển tiếp
+            title.set_text(f'Hoàn thành tìm kiếm! Chuẩn bị hiển thị đường đi ({transition_step}/{transition_frames})')
+            
+            # Vẫn chưa hiển thị đường đi
+            path_plot.set_data([], [])
+            path_markers.set_data([], [])
+            
+        else:
+            # Giai đoạn 2: Hiển thị đường đi
+            # Đã thăm hết tất cả các ô, bây giờ hiển thị đường đi từng bước một
+            
+            # Tính số bước đường đi cần hiển thị trong frame hiện tại
+            path_frame = frame - (total_exploration_frames + transition_frames)
+            path_steps = min(path_frame + 1, total_path_frames)
+            
+            if path and path_steps > 0:
+                # Hiển thị đường đi dần dần từ xuất phát đến đích
+                path_y = [y for x, y in path[:path_steps]]
+                path_x = [x for x, y in path[:path_steps]]
+                path_plot.set_data(path_y, path_x)
+                path_markers.set_data(path_y, path_x)
+                
+                title.set_text(f'Hiển thị đường đi: {path_steps}/{total_path_frames} bước')
+            else:
+                title.set_text('Không tìm thấy đường đi!')
+                
+            # Vẫn giữ nguyên hiển thị các ô đã thăm
+            if search_steps:
+                explored_y = [y for x, y in search_steps]
+                explored_x = [x for x, y in search_steps]
+                explored_plot.set_data(explored_y, explored_x)
+            
+            # Không hiển thị ô hiện tại và frontier trong giai đoạn này
+            current_plot.set_data([], [])
+            frontier_plot.set_data([], [])
+            
+        return frontier_plot, current_plot, explored_plot, path_plot, path_markers, title
+    
+    # Tạo animation
+    anim = animation.FuncAnimation(fig, update, frames=total_frames, 
+                                   init_func=init, blit=True, interval=speed)
+    
+    plt.tight_layout()
+    plt.show()
+
+def bfs_find_path_and_visualize(maze_obj, show_animation=False, speed=100):
+    """
+    Tìm đường đi trong mê cung sử dụng BFS và hiển thị kết quả
+    
+    maze_obj: instance của lớp Maze
+    show_animation: bool - nếu True, hiển thị animation quá trình tìm kiếm
+    speed: số millisecond cho mỗi bước animation (càng nhỏ càng nhanh)
+    """
+    if show_animation:
+        print("\nHiển thị quá trình tìm kiếm BFS...")
+        visualize_search_process(maze_obj, speed)
+        return
+    
+    print("\nĐang tìm đường đi bằng thuật toán BFS...")
+    start_time = time.time()
+    path = find_path(maze_obj)
+    end_time = time.time()
+    
+    if path is not None:
+        print(f"Tìm thấy đường đi với {len(path)} bước:")
+        print(f"Độ dài đường đi: {len(path) - 1}")
+        print(f"Thời gian thực thi: {end_time - start_time:.5f} giây")
+        visualize_maze_with_path(maze_obj, path)
+    else:
+        print("Không tìm thấy đường đi trong mê cung!")
+        print(f"Thời gian thực thi: {end_time - start_time:.5f} giây")
+        # Hiển thị mê cung mà không có đường đi
+        visualize_maze_with_path(maze_obj, [])
+
+if __name__ == "__main__":
+    import sys
+    import os
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    # Import lớp Maze từ module maze
+    from maze.maze import Maze
+    
+    # Tạo mê cung mới
+    maze = Maze(5, complexity=0.03, algorithm="dfs_backtrack")
+    
+    # In mê cung ban đầu
+    print("Mê cung ban đầu:")
+    maze.print_maze()
+    print("\n")
+    
+    # Chọn chế độ hiển thị
+    show_animation = True  # Đặt thành True để xem animation, False để chỉ xem kết quả cuối cùng
+    
+    if show_animation:
+        # Hiển thị quá trình tìm kiếm với animation
+        visualize_search_process(maze, speed=100)  # speed càng nhỏ càng nhanh
+    else:
+        # Tìm đường đi và hiển thị kết quả cuối cùng
+        start_time = time.time()
+        path = find_path(maze)
+        end_time = time.time()
+        
+        if path:
+            print(f"Tìm thấy đường đi với {len(path)} bước:")
+            print(f"Độ dài đường đi: {len(path) - 1}")  # Trừ 1 vì đường đi bao gồm cả nút bắt đầu
+            print(f"Thời gian thực thi: {end_time - start_time:.5f} giây")
+            print_maze_with_path(maze, path)
+            visualize_maze_with_path(maze, path)
+        else:
+            print("Không tìm thấy đường đi!")
+            print(f"Thời gian thực thi: {end_time - start_time:.5f} giây")
\ No newline at end of file
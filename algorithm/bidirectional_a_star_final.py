@@ -0,0 +1,198 @@
+import numpy as np
+import heapq
+import time
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithm.bidirectional_bfs_final import FORWARD, BACKWARD, print_maze_with_path
+
+def find_path(maze_obj, return_search_steps=False, stats=None):
+    """
+    Tìm đường đi ngắn nhất bằng A* hai chiều (front-to-end): một A* lan từ điểm bắt đầu,
+    một A* lan từ điểm kết thúc, mỗi lượt mở rộng phía có hàng đợi nhỏ hơn
+    
+    Hai phía dùng thế vị trung bình của hai heuristic Manhattan (h_end: tới điểm kết thúc,
+    h_start: tới điểm bắt đầu), nhân 2 để giữ số nguyên:
+    - phía bắt đầu: khóa = 2*g + h_end - h_start
+    - phía kết thúc: khóa = 2*g + h_start - h_end
+    Hai thế vị đối nhau nên cả hai phía cùng nhất quán. Mỗi khi một ô đã có g_score ở cả hai phía,
+    tổng hai g_score là một đường đi ứng viên (best là ứng viên ngắn nhất). Điều kiện dừng:
+    khóa nhỏ nhất phía bắt đầu + khóa nhỏ nhất phía kết thúc >= 2*best, vì tổng này là cận dưới
+    (nhân 2) của mọi đường đi chưa tìm thấy nên không còn đường đi nào ngắn hơn best
+    
+    Khóa hàng đợi là số nguyên (khóa << 2*bits) | (g << bits) | count như a_star_final.find_path
+    
+    maze_obj: instance của lớp Maze
+    return_search_steps: bool - nếu True, hàm sẽ trả về thêm các bước tìm kiếm
+    stats: dict hoặc None - nếu là dict, hàm ghi số ô đã mở rộng vào stats["expansions"]
+           (chỉ là một biến đếm, không cần ghi lại các bước)
+    
+    Trả về:
+    - path: list các tọa độ (x, y) thể hiện đường đi từ điểm bắt đầu đến điểm kết thúc
+           hoặc None nếu không tìm thấy đường đi
+    - search_steps: list các tọa độ (x, y) theo thứ tự được thăm (nếu return_search_steps=True)
+    - search_sides: list cùng độ dài với search_steps, FORWARD (0) nếu ô được phía điểm bắt đầu
+      mở rộng, BACKWARD (1) nếu do phía điểm kết thúc (nếu return_search_steps=True)
+    """
+    grid = np.asarray(maze_obj.maze)
+    start = tuple(maze_obj.start)
+    end = tuple(maze_obj.end)
+    height, width = grid.shape
+    padded_width = width + 2
+    
+    padded = np.ones((height + 2, padded_width), dtype=np.uint8)
+    padded[1:-1, 1:-1] = grid != 0
+    walls = padded.tobytes()
+    num_open = height*width - int(np.count_nonzero(grid))
+    unreached = np.iinfo(np.int32).max
+    
+    capacity = 4*num_open + 1
+    bits = capacity.bit_length()
+    count_mask = (1 << bits) - 1
+    f_shift = 2*bits
+    
+    start_index = (start[0] + 1)*padded_width + start[1] + 1
+    end_index = (end[0] + 1)*padded_width + end[1] + 1
+    
+    def manhattan_to(target):
+        rows = np.abs(np.arange(-1, height + 1, dtype=np.int32) - target[0])
+        cols = np.abs(np.arange(-1, width + 1, dtype=np.int32) - target[1])
+        return (rows[:, None] + cols[None, :]).ravel()
+    
+    # Hiệu hai heuristic nằm trong [-(height + width), height + width], cộng thêm bias để khóa không âm
+    to_end = manhattan_to(end)
+    to_start = manhattan_to(start)
+    bias = height + width
+    potentials = (to_end - to_start + bias, to_start - to_end + bias)
+    
+    # Trạng thái của từng phía: [FORWARD] lan từ start về end, [BACKWARD] lan từ end về start
+    closed, g_score, parent, heuristic, pushed, open_sets, counts = [], [], [], [], [], [], []
+    for source, potential in ((start, potentials[FORWARD]), (end, potentials[BACKWARD])):
+        source_index = (source[0] + 1)*padded_width + source[1] + 1
+        closed.append(bytearray(walls))
+        g_score.append(memoryview(np.full(len(walls), unreached, dtype=np.int32)))
+        parent.append(memoryview(np.full(len(walls), -1, dtype=np.int32)))
+        heuristic.append(memoryview(potential))
+        pushed.append(memoryview(np.empty(capacity, dtype=np.int32)))
+        g_score[-1][source_index] = 0
+        pushed[-1][0] = source_index
+        open_sets.append([heuristic[-1][source_index] << f_shift])
+        counts.append(0)
+    
+    # Các hướng có thể di chuyển: lên, phải, xuống, trái
+    offsets = (-padded_width, 1, padded_width, -1)
+    
+    search_steps = [] if return_search_steps else None
+    search_sides = [] if return_search_steps else None
+    
+    def to_position(index):
+        x, y = divmod(index, padded_width)
+        return (x - 1, y - 1)
+    
+    best = 0 if start_index == end_index else unreached
+    meet = start_index if start_index == end_index else -1
+    expansions = 0
+    heappop = heapq.heappop
+    heappush = heapq.heappush
+    while open_sets[FORWARD] and open_sets[BACKWARD]:
+        # Điều kiện dừng: không còn đường đi nào ngắn hơn best
+        if (open_sets[FORWARD][0] >> f_shift) + (open_sets[BACKWARD][0] >> f_shift) - 2*bias >= 2*best:
+            break
+        
+        side = FORWARD if len(open_sets[FORWARD]) <= len(open_sets[BACKWARD]) else BACKWARD
+        open_set = open_sets[side]
+        side_closed = closed[side]
+        side_g = g_score[side]
+        other_g = g_score[1 - side]
+        side_parent = parent[side]
+        side_heuristic = heuristic[side]
+        side_pushed = pushed[side]
+        
+        current = side_pushed[heappop(open_set) & count_mask]
+        if side_closed[current]:
+            continue
+        side_closed[current] = 1
+        expansions += 1
+        if return_search_steps:
+            search_steps.append(to_position(current))
+            search_sides.append(side)
+        
+        tentative_g_score = side_g[current] + 1
+        for offset in offsets:
+            next_index = current + offset
+            if side_closed[next_index]:
+                continue
+            if tentative_g_score < side_g[next_index]:
+                side_parent[next_index] = current
+                side_g[next_index] = tentative_g_score
+                counts[side] += 1
+                side_pushed[counts[side]] = next_index
+                heappush(open_set, ((2*tentative_g_score + side_heuristic[next_index]) << f_shift)
+                         | (tentative_g_score << bits) | counts[side])
+            # Ô đã được phía kia chạm tới: cập nhật đường đi ứng viên tốt nhất
+            if other_g[next_index] != unreached:
+                length = side_g[next_index] + other_g[next_index]
+                if length < best:
+                    best = length
+                    meet = next_index
+    
+    if stats is not None:
+        stats["expansions"] = expansions
+    
+    if meet >= 0:
+        path_indices = []
+        current = meet
+        while current >= 0:
+            path_indices.append(current)
+            current = parent[FORWARD][current]
+        path_indices.reverse()
+        current = parent[BACKWARD][meet]
+        while current >= 0:
+            path_indices.append(current)
+            current = parent[BACKWARD][current]
+        path = [to_position(index) for index in path_indices]
+        
+        if return_search_steps:
+            return path, search_steps, search_sides
+        return path
+    else:
+        if return_search_steps:
+            return None, search_steps, search_sides
+        return None
+
+def visualize_search_process(maze_obj, speed=100):
+    """
+    Hiển thị quá trình tìm kiếm A* hai chiều qua animation, mỗi phía một màu
+    
+    maze_obj: instance của lớp Maze
+    speed: số millisecond cho mỗi bước animation (càng nhỏ càng nhanh)
+    """
+    from algorithm.bidirectional_bfs_final import visualize_search_process as visualize_bidirectional
+    visualize_bidirectional(maze_obj, speed, solver="Bidirectional A*", title="A* hai chiều")
+
+if __name__ == "__main__":
+    # Import lớp Maze từ module maze
+    from maze.maze import Maze
+    
+    # Tạo mê cung mới
+    maze = Maze(10, complexity=0.03, algorithm="dfs_backtrack")
+    
+    # In mê cung ban đầu
+    print("Mê cung ban đầu:")
+    maze.print_maze()
+    print("\n")
+    
+    start_time = time.time()
+    path, search_steps, search_sides = find_path(maze, return_search_steps=True)
+    end_time = time.time()
+    
+    if path:
+        print(f"Tìm thấy đường đi với {len(path)} bước:")
+        print(f"Số ô đã thăm: {len(search_steps)} (phía bắt đầu {search_sides.count(FORWARD)}, "
+              f"phía kết thúc {search_sides.count(BACKWARD)})")
+        print(f"Thời gian thực thi: {end_time - start_time:.5f} giây")
+        print_maze_with_path(maze, path)
+        visualize_search_process(maze, speed=50)
+    else:
+        print("Không tìm thấy đường đi!")
@@ -0,0 +1,231 @@
+import numpy as np
+import matplotlib.pyplot as plt
+import time
+import matplotlib.animation as animation
+
+# Nhãn phía tìm kiếm trong search_sides
+FORWARD = 0   # Lan từ maze_obj.start
+BACKWARD = 1  # Lan từ maze_obj.end
+
+def _walk_parents(parent, index):
+    """
+    Đi ngược theo mảng cha từ index tới ô gốc của phía tìm kiếm (ô có cha -1)
+    """
+    chain = [index]
+    while parent[index] >= 0:
+        index = parent[index]
+        chain.append(index)
+    return chain
+
+def find_path(maze_obj, return_search_steps=False, stats=None):
+    """
+    Tìm đường đi ngắn nhất bằng BFS hai chiều: lan đồng thời từ điểm bắt đầu và điểm kết thúc,
+    mỗi lượt mở rộng trọn một tầng của phía có frontier nhỏ hơn
+    
+    Khi một tầng chạm tới ô đã được phía kia thăm, tầng đó vẫn được mở rộng hết và chọn
+    điểm gặp có tổng khoảng cách nhỏ nhất, nên đường đi luôn ngắn nhất
+    
+    maze_obj: instance của lớp Maze
+    return_search_steps: bool - nếu True, hàm sẽ trả về thêm các bước tìm kiếm
+    stats: dict hoặc None - nếu là dict, hàm ghi số ô đã mở rộng vào stats["expansions"]
+           (chỉ là một biến đếm, không cần ghi lại các bước)
+    
+    Trả về:
+    - path: list các tọa độ (x, y) thể hiện đường đi từ điểm bắt đầu đến điểm kết thúc
+           hoặc None nếu không tìm thấy đường đi
+    - search_steps: list các tọa độ (x, y) theo thứ tự được thăm (nếu return_search_steps=True)
+    - search_sides: list cùng độ dài với search_steps, FORWARD (0) nếu ô được phía điểm bắt đầu
+      mở rộng, BACKWARD (1) nếu do phía điểm kết thúc (nếu return_search_steps=True)
+    """
+    grid = np.asarray(maze_obj.maze)
+    start = tuple(maze_obj.start)
+    end = tuple(maze_obj.end)
+    height, width = grid.shape
+    padded_width = width + 2
+    
+    # owner: 0 chưa thăm, 1 phía bắt đầu, 2 phía kết thúc, 3 tường/viền
+    padded = np.full((height + 2, padded_width), 3, dtype=np.uint8)
+    padded[1:-1, 1:-1] = np.where(grid != 0, 3, 0)
+    owner = bytearray(padded.tobytes())
+    parent = memoryview(np.full(len(owner), -1, dtype=np.int32))
+    distance = memoryview(np.zeros(len(owner), dtype=np.int32))
+    
+    # Các hướng có thể di chuyển: lên, phải, xuống, trái
+    offsets = (-padded_width, 1, padded_width, -1)
+    
+    start_index = (start[0] + 1)*padded_width + start[1] + 1
+    end_index = (end[0] + 1)*padded_width + end[1] + 1
+    owner[start_index] = 1
+    owner[end_index] = 2
+    
+    search_steps = [] if return_search_steps else None
+    search_sides = [] if return_search_steps else None
+    
+    def to_position(index):
+        x, y = divmod(index, padded_width)
+        return (x - 1, y - 1)
+    
+    frontiers = [[start_index], [end_index]]
+    best = None  # (độ dài, ô của phía đang mở rộng, ô của phía kia, phía đang mở rộng)
+    expansions = 0
+    if start_index == end_index:
+        best = (0, start_index, start_index, FORWARD)
+        expansions = 1
+        if return_search_steps:
+            search_steps.append(start)
+            search_sides.append(FORWARD)
+    
+    while best is None and frontiers[FORWARD] and frontiers[BACKWARD]:
+        # Mở rộng phía có frontier nhỏ hơn
+        side = FORWARD if len(frontiers[FORWARD]) <= len(frontiers[BACKWARD]) else BACKWARD
+        mine = side + 1
+        other = 2 - side
+        next_level = []
+        expansions += len(frontiers[side])
+        for current in frontiers[side]:
+            if return_search_steps:
+                search_steps.append(to_position(current))
+                search_sides.append(side)
+            next_distance = distance[current] + 1
+            for offset in offsets:
+                next_index = current + offset
+                next_owner = owner[next_index]
+                if next_owner == 0:
+                    owner[next_index] = mine
+                    parent[next_index] = current
+                    distance[next_index] = next_distance
+                    next_level.append(next_index)
+                elif next_owner == other:
+                    # Hai phía gặp nhau: ghi nhận điểm gặp tốt nhất của tầng này
+                    length = next_distance + distance[next_index]
+                    if best is None or length < best[0]:
+                        best = (length, current, next_index, side)
+        frontiers[side] = next_level
+    
+    if stats is not None:
+        stats["expansions"] = expansions
+    
+    if best is not None:
+        _, mine_index, other_index, side = best
+        if side == FORWARD:
+            forward_index, backward_index = mine_index, other_index
+        else:
+            forward_index, backward_index = other_index, mine_index
+        path_indices = _walk_parents(parent, forward_index)[::-1]
+        if backward_index != forward_index:
+            path_indices += _walk_parents(parent, backward_index)
+        path = [to_position(index) for index in path_indices]
+        
+        if return_search_steps:
+            return path, search_steps, search_sides
+        return path
+    else:
+        if return_search_steps:
+            return None, search_steps, search_sides
+        return None
+
+def print_maze_with_path(maze_obj, path):
+    """
+    In mê cung ra màn hình console với đường đi được biểu diễn bằng '-'
+    
+    maze_obj: instance của lớp Maze
+    path: list các tọa độ (x, y) thể hiện đường đi
+    """
+    if path is None:
+        print("Không tìm thấy đường đi!")
+        return
+        
+    maze = np.array(maze_obj.maze)
+    
+    # Đánh dấu đường đi bằng giá trị 2
+    for x, y in path:
+        maze[x, y] = 2
+    
+    # In mê cung với đường đi
+    for row in maze:
+        print(''.join('#' if cell == 1 else '-' if cell == 2 else ' ' for cell in row))
+
+def visualize_search_process(maze_obj, speed=100, solver="Bidirectional BFS", title="BFS hai chiều"):
+    """
+    Hiển thị quá trình tìm kiếm hai chiều qua animation, mỗi phía một màu
+    
+    maze_obj: instance của lớp Maze
+    speed: số millisecond cho mỗi bước animation (càng nhỏ càng nhanh)
+    solver: tên thuật toán hai chiều trong algorithm.solvers.REGISTRY (mặc định là BFS hai chiều)
+    title: tên thuật toán hiển thị trên tiêu đề
+    """
+    # Import trong hàm vì algorithm.solvers import module này
+    from algorithm.solvers import solve
+    result = solve(maze_obj, solver, record_steps=True)
+    path, search_steps, search_sides = result.path, result.search_steps, result.sides
+    
+    # Giá trị ảnh: 0 đường đi, 1 tường, 2 phía bắt đầu, 3 phía kết thúc, 4 đường đi tìm được
+    image = np.array(maze_obj.maze, dtype=np.uint8)
+    colors = plt.cm.colors.ListedColormap(['white', 'navy', 'lightskyblue', 'lightsalmon', 'red'])
+    
+    fig, ax = plt.subplots(figsize=(10, 10))
+    im = ax.imshow(image, cmap=colors, vmin=0, vmax=4)
+    start = maze_obj.start
+    end = maze_obj.end
+    ax.plot(start[1], start[0], 'go', markersize=8)
+    ax.plot(end[1], end[0], 'bo', markersize=8)
+    ax.set_xticks([])
+    ax.set_yticks([])
+    title_text = ax.set_title(f'Tìm kiếm {title}: Bước 0')
+    
+    legend_elements = [
+        plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='g', markersize=8, label='Điểm bắt đầu'),
+        plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='b', markersize=8, label='Điểm kết thúc'),
+        plt.Line2D([0], [0], marker='s', color='w', markerfacecolor='lightskyblue', markersize=8, label='Phía bắt đầu'),
+        plt.Line2D([0], [0], marker='s', color='w', markerfacecolor='lightsalmon', markersize=8, label='Phía kết thúc'),
+        plt.Line2D([0], [0], marker='s', color='w', markerfacecolor='r', markersize=8, label='Đường đi')
+    ]
+    ax.legend(handles=legend_elements, loc='upper right', fontsize='small')
+    
+    total_search_frames = len(search_steps)
+    total_frames = total_search_frames + (1 if path else 0)
+    
+    def update(frame):
+        if frame < total_search_frames:
+            x, y = search_steps[frame]
+            image[x, y] = 2 + search_sides[frame]
+            title_text.set_text(f'Tìm kiếm {title}: Bước {frame + 1}/{total_search_frames}')
+        else:
+            for x, y in path:
+                image[x, y] = 4
+            title_text.set_text(f'Đường đi: {len(path)} ô, đã thăm {total_search_frames} ô')
+        im.set_array(image)
+        return im, title_text
+    
+    anim = animation.FuncAnimation(fig, update, frames=total_frames, interval=speed, blit=False, repeat=False)
+    plt.tight_layout()
+    plt.show()
+
+if __name__ == "__main__":
+    import sys
+    import os
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    # Import lớp Maze từ module maze
+    from maze.maze import Maze
+    
+    # Tạo mê cung mới
+    maze = Maze(10, complexity=0.03, algorithm="dfs_backtrack")
+    
+    # In mê cung ban đầu
+    print("Mê cung ban đầu:")
+    maze.print_maze()
+    print("\n")
+    
+    start_time = time.time()
+    path, search_steps, search_sides = find_path(maze, return_search_steps=True)
+    end_time = time.time()
+    
+    if path:
+        print(f"Tìm thấy đường đi với {len(path)} bước:")
+        print(f"Số ô đã thăm: {len(search_steps)} (phía bắt đầu {search_sides.count(FORWARD)}, "
+              f"phía kết thúc {search_sides.count(BACKWARD)})")
+        print(f"Thời gian thực thi: {end_time - start_time:.5f} giây")
+        print_maze_with_path(maze, path)
+        visualize_search_process(maze, speed=50)
+    else:
+        print("Không tìm thấy đường đi!")
@@ -0,0 +1,367 @@
+import numpy as np
+import heapq
+import time
+
+# Các hướng có thể di chuyển: lên, phải, xuống, trái
+DIRECTIONS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+class CorridorGraph:
+    """
+    Đồ thị hành lang đã nén của một mê cung, lưu dưới dạng CSR
+
+    Nút là các ô trống có số ô kề trống khác 2 (ngã ba, ngã tư, ngõ cụt), cộng với một ô trên mỗi vòng
+    chỉ gồm ô bậc 2. Mỗi hành lang gồm các ô
+    bậc 2 nối hai nút được gộp thành một cạnh có trọng số bằng số bước đi. Các chỉ số ô dùng lưới
+    có thêm viền tường (x+1)*padded_width + y+1 giống các solver khác trong algorithm/
+
+    Thuộc tính:
+    - node_cells: int32 (num_nodes,) - chỉ số ô của từng nút
+    - node_id: int32 (số ô lưới có viền,) - số thứ tự nút của từng ô, -1 nếu không phải nút
+    - indptr, indices, weights: CSR các cạnh có hướng (mỗi hành lang cho hai cạnh)
+    - edge_corridor: int32 - hành lang ứng với mỗi cạnh; edge_reversed: bool - đi ngược thứ tự lưu
+    - corridor_ptr, corridor_cells: CSR các ô bên trong từng hành lang (theo thứ tự từ nút đầu)
+    - corridor_ends: int32 (num_corridors, 2) - nút đầu và nút cuối của từng hành lang
+    - cell_corridor, cell_offset: hành lang chứa ô và vị trí của ô trong hành lang (-1 nếu không có)
+    """
+
+    def __init__(self, padded_width, node_cells, node_id, indptr, indices, weights, edge_corridor,
+                 edge_reversed, corridor_ptr, corridor_cells, corridor_ends, cell_corridor, cell_offset):
+        self.padded_width = padded_width
+        self.node_cells = node_cells
+        self.node_id = node_id
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.edge_corridor = edge_corridor
+        self.edge_reversed = edge_reversed
+        self.corridor_ptr = corridor_ptr
+        self.corridor_cells = corridor_cells
+        self.corridor_ends = corridor_ends
+        self.cell_corridor = cell_corridor
+        self.cell_offset = cell_offset
+
+    @property
+    def num_nodes(self):
+        return len(self.node_cells)
+
+    @property
+    def num_edges(self):
+        return len(self.indices)
+
+    def corridor(self, corridor, reversed_=False):
+        """
+        Trả về list chỉ số các ô bên trong một hành lang, theo chiều đi từ nút đầu (hoặc ngược lại)
+        """
+        cells = self.corridor_cells[self.corridor_ptr[corridor]:self.corridor_ptr[corridor + 1]].tolist()
+        if reversed_:
+            cells.reverse()
+        return cells
+
+    def to_position(self, index):
+        x, y = divmod(int(index), self.padded_width)
+        return (x - 1, y - 1)
+
+def build_corridor_graph(grid):
+    """
+    Nén lưới mê cung thành đồ thị hành lang (xem CorridorGraph)
+
+    Bậc của các ô được tính bằng các lát cắt dịch chuyển trên toàn lưới. Mỗi hành lang chỉ được
+    đi một lần: với ô bậc 2, tổng chỉ số hai ô kề trừ đi ô vừa đi qua cho ra ô tiếp theo
+
+    grid: mảng (height, width), 0 là đường đi
+
+    Trả về: CorridorGraph
+    """
+    grid = np.asarray(grid)
+    height, width = grid.shape
+    padded_width = width + 2
+    is_open = np.zeros((height + 2, padded_width), dtype=bool)
+    is_open[1:-1, 1:-1] = grid == 0
+
+    index = np.arange(is_open.size, dtype=np.int64).reshape(is_open.shape)
+    degree = np.zeros(is_open.shape, dtype=np.int8)
+    neighbor_sum = np.zeros(is_open.shape, dtype=np.int64)
+    inner = (slice(1, -1), slice(1, -1))
+    for dx, dy in DIRECTIONS:
+        shifted = (slice(1 + dx, height + 1 + dx), slice(1 + dy, width + 1 + dy))
+        degree[inner] += is_open[shifted]
+        neighbor_sum[inner] += np.where(is_open[shifted], index[shifted], 0)
+
+    node_mask = is_open & (degree != 2)
+    node_list = np.flatnonzero(node_mask).tolist()
+
+    open_flat = is_open.ravel().tobytes()
+    is_node = bytearray(node_mask.ravel().tobytes())
+    next_sum = memoryview(neighbor_sum.ravel())
+    offsets = tuple(dx*padded_width + dy for dx, dy in DIRECTIONS)
+
+    cell_corridor = np.full(is_open.size, -1, dtype=np.int32)
+    cell_offset = np.full(is_open.size, -1, dtype=np.int32)
+    traced = bytearray(is_open.size)
+
+    sources, targets, lengths = [], [], []
+    corridor_cells = []
+    corridor_ptr = [0]
+
+    def trace_from(node):
+        for offset in offsets:
+            cell = node + offset
+            if not open_flat[cell]:
+                continue
+            if is_node[cell]:
+                # Hai nút kề nhau: cạnh dài 1 bước, không có ô bên trong
+                if node < cell:
+                    sources.append(node)
+                    targets.append(cell)
+                    lengths.append(1)
+                    corridor_ptr.append(len(corridor_cells))
+                continue
+            if traced[cell]:
+                continue
+
+            # Đi dọc hành lang tới nút tiếp theo
+            first = len(corridor_cells)
+            previous = node
+            while not is_node[cell]:
+                traced[cell] = 1
+                corridor_cells.append(cell)
+                cell, previous = next_sum[cell] - previous, cell
+            sources.append(node)
+            targets.append(cell)
+            lengths.append(len(corridor_cells) - first + 1)
+            corridor_ptr.append(len(corridor_cells))
+
+    for node in node_list:
+        trace_from(node)
+
+    # Các vòng chỉ gồm ô bậc 2 (không chạm nút nào): lấy một ô của mỗi vòng làm nút
+    for cell in np.flatnonzero(is_open.ravel() & (degree.ravel() == 2)).tolist():
+        if not traced[cell] and not is_node[cell]:
+            is_node[cell] = 1
+            node_list.append(cell)
+            trace_from(cell)
+
+    node_cells = np.array(node_list, dtype=np.int32)
+    node_id = np.full(is_open.size, -1, dtype=np.int32)
+    node_id[node_cells] = np.arange(len(node_cells), dtype=np.int32)
+
+    corridor_cells = np.array(corridor_cells, dtype=np.int32)
+    corridor_ptr = np.array(corridor_ptr, dtype=np.int32)
+    num_corridors = len(lengths)
+    corridor_lengths = np.diff(corridor_ptr)
+    corridor_of_cell = np.repeat(np.arange(num_corridors, dtype=np.int32), corridor_lengths)
+    cell_corridor[corridor_cells] = corridor_of_cell
+    cell_offset[corridor_cells] = np.arange(len(corridor_cells), dtype=np.int32) - corridor_ptr[corridor_of_cell]
+
+    # Mỗi hành lang cho hai cạnh có hướng, sắp xếp theo nút nguồn thành CSR
+    sources = node_id[np.array(sources, dtype=np.int64)]
+    targets = node_id[np.array(targets, dtype=np.int64)]
+    corridor_ends = np.stack([sources, targets], axis=1).astype(np.int32)
+    lengths = np.array(lengths, dtype=np.int32)
+    edge_source = np.concatenate([sources, targets])
+    edge_target = np.concatenate([targets, sources])
+    corridor_ids = np.arange(num_corridors, dtype=np.int32)
+    order = np.argsort(edge_source, kind="stable")
+    indptr = np.zeros(len(node_cells) + 1, dtype=np.int32)
+    np.cumsum(np.bincount(edge_source, minlength=len(node_cells)), out=indptr[1:])
+
+    return CorridorGraph(
+        padded_width=padded_width,
+        node_cells=node_cells,
+        node_id=node_id,
+        indptr=indptr,
+        indices=edge_target[order].astype(np.int32),
+        weights=np.concatenate([lengths, lengths])[order],
+        edge_corridor=np.concatenate([corridor_ids, corridor_ids])[order],
+        edge_reversed=np.concatenate([np.zeros(num_corridors, dtype=bool),
+                                      np.ones(num_corridors, dtype=bool)])[order],
+        corridor_ptr=corridor_ptr,
+        corridor_cells=corridor_cells,
+        corridor_ends=corridor_ends,
+        cell_corridor=cell_corridor,
+        cell_offset=cell_offset,
+    )
+
+def corridor_graph(maze_obj):
+    """
+    Đồ thị hành lang của mê cung, được lưu trong cache của Maze và tự tạo lại khi lưới thay đổi
+    """
+    return maze_obj.cached("corridor_graph", lambda m: build_corridor_graph(np.asarray(m.maze)))
+
+def _attachments(graph, cell, towards_cell):
+    """
+    Các nút mà một ô bám vào đồ thị: list (nút, số bước, các ô đi qua)
+
+    towards_cell=False: các ô theo chiều đi từ ô ra nút (dùng cho điểm bắt đầu)
+    towards_cell=True: các ô theo chiều đi từ nút vào ô (dùng cho điểm kết thúc)
+    Các ô đi qua không gồm ô của nút và chính ô đó
+    """
+    node = graph.node_id[cell]
+    if node >= 0:
+        return [(int(node), 0, [])]
+    corridor = graph.cell_corridor[cell]
+    offset = int(graph.cell_offset[cell])
+    cells = graph.corridor(corridor)
+    first, last = graph.corridor_ends[corridor].tolist()
+    to_first = cells[:offset][::-1]
+    to_last = cells[offset + 1:]
+    if towards_cell:
+        to_first.reverse()
+        to_last.reverse()
+    return [(first, offset + 1, to_first), (last, len(cells) - offset, to_last)]
+
+def find_path(maze_obj, return_search_steps=False, heuristic=True, stats=None):
+    """
+    Tìm đường đi ngắn nhất trên đồ thị hành lang rồi trải lại thành đường đi từng ô
+
+    maze_obj: instance của lớp Maze
+    return_search_steps: bool - nếu True, hàm sẽ trả về thêm các bước tìm kiếm
+    heuristic: bool - True dùng A* (khoảng cách Manhattan), False dùng Dijkstra
+    stats: dict hoặc None - nếu là dict, hàm ghi số nút đã mở rộng vào stats["expansions"]
+           (chỉ là một biến đếm, không cần ghi lại các bước)
+
+    Trả về:
+    - path: list các tọa độ (x, y) thể hiện đường đi từ điểm bắt đầu đến điểm kết thúc
+           hoặc None nếu không tìm thấy đường đi
+    - search_steps: list các nút (x, y) theo thứ tự được mở rộng (nếu return_search_steps=True)
+    """
+    graph = corridor_graph(maze_obj)
+    padded_width = graph.padded_width
+    start = tuple(maze_obj.start)
+    end = tuple(maze_obj.end)
+    start_index = (start[0] + 1)*padded_width + start[1] + 1
+    end_index = (end[0] + 1)*padded_width + end[1] + 1
+    search_steps = [] if return_search_steps else None
+    expansions = 0
+
+    def done(cells):
+        if stats is not None:
+            stats["expansions"] = expansions
+        path = [graph.to_position(cell) for cell in cells] if cells is not None else None
+        return (path, search_steps) if return_search_steps else path
+
+    if start_index == end_index:
+        return done([start_index])
+
+    sources = _attachments(graph, start_index, towards_cell=False)
+    goals = _attachments(graph, end_index, towards_cell=True)
+    # Hai điểm cùng nằm trên một hành lang: có thể đi thẳng dọc hành lang
+    best = np.iinfo(np.int64).max
+    best_cells = None
+    start_corridor = graph.cell_corridor[start_index]
+    if start_corridor >= 0 and start_corridor == graph.cell_corridor[end_index]:
+        cells = graph.corridor(start_corridor)
+        a, b = int(graph.cell_offset[start_index]), int(graph.cell_offset[end_index])
+        best = abs(a - b)
+        best_cells = cells[a:b + 1] if a <= b else cells[b:a + 1][::-1]
+
+    num_nodes = graph.num_nodes
+    indptr = memoryview(graph.indptr)
+    indices = memoryview(graph.indices)
+    weights = memoryview(graph.weights)
+    node_cells = memoryview(graph.node_cells)
+    unreached = np.iinfo(np.int32).max
+    g_score = memoryview(np.full(num_nodes, unreached, dtype=np.int32))
+    parent_edge = memoryview(np.full(num_nodes, -1, dtype=np.int32))
+    parent_node = memoryview(np.full(num_nodes, -1, dtype=np.int32))
+    closed = bytearray(num_nodes)
+    goal_cost = {}
+    for node, cost, cells in goals:
+        if node not in goal_cost or cost < goal_cost[node][0]:
+            goal_cost[node] = (cost, cells)
+
+    # Heuristic Manhattan tới ô đích, tính sẵn cho mọi nút
+    if heuristic:
+        rows, cols = np.divmod(graph.node_cells, padded_width)
+        h_score = memoryview((np.abs(rows - (end[0] + 1)) + np.abs(cols - (end[1] + 1))).astype(np.int32))
+    else:
+        h_score = memoryview(np.zeros(num_nodes, dtype=np.int32))
+
+    # Khóa hàng đợi nguyên (f << 2*bits) | (g << bits) | node như a_star_final.find_path
+    bits = max(num_nodes, len(graph.corridor_cells) + num_nodes + 2).bit_length()
+    mask = (1 << bits) - 1
+    f_shift = 2*bits
+
+    open_set = []
+    source_cells = {}
+    for node, cost, cells in sources:
+        if cost < g_score[node]:
+            g_score[node] = cost
+            source_cells[node] = cells
+            heapq.heappush(open_set, ((cost + h_score[node]) << f_shift) | (cost << bits) | node)
+
+    best_goal = -1
+    while open_set:
+        key = heapq.heappop(open_set)
+        if key >> f_shift >= best:
+            break
+        current = key & mask
+        if closed[current]:
+            continue
+        closed[current] = 1
+        expansions += 1
+        current_g = g_score[current]
+
+        if return_search_steps:
+            search_steps.append(graph.to_position(node_cells[current]))
+
+        if current in goal_cost and current_g + goal_cost[current][0] < best:
+            best = current_g + goal_cost[current][0]
+            best_goal = current
+
+        for edge in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[edge]
+            tentative_g_score = current_g + weights[edge]
+            if tentative_g_score < g_score[neighbor]:
+                g_score[neighbor] = tentative_g_score
+                parent_edge[neighbor] = edge
+                parent_node[neighbor] = current
+                heapq.heappush(open_set, ((tentative_g_score + h_score[neighbor]) << f_shift)
+                               | (tentative_g_score << bits) | neighbor)
+
+    if best_goal < 0:
+        return done(best_cells)
+
+    # Trải các cạnh trên đường đi thành các ô, đi ngược từ nút đích về nút nguồn
+    pieces = [goal_cost[best_goal][1]]
+    node = best_goal
+    while parent_edge[node] >= 0:
+        edge = parent_edge[node]
+        pieces.append([node_cells[node]])
+        pieces.append(graph.corridor(graph.edge_corridor[edge], graph.edge_reversed[edge]))
+        node = parent_node[node]
+    pieces.append([node_cells[node]])
+    pieces.append(source_cells[node])
+    cells = [cell for piece in reversed(pieces) for cell in piece]
+    if cells[0] != start_index:
+        cells.insert(0, start_index)
+    if cells[-1] != end_index:
+        cells.append(end_index)
+    return done(cells)
+
+if __name__ == "__main__":
+    import sys
+    import os
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    # Import lớp Maze từ module maze
+    from maze.maze import Maze
+
+    maze = Maze(200, complexity=0.05, algorithm="prim", record="off")
+
+    start_time = time.time()
+    graph = corridor_graph(maze)
+    build_time = time.time() - start_time
+    num_open = int(np.count_nonzero(np.asarray(maze.maze) == 0))
+    print(f"Số ô trống: {num_open}, số nút: {graph.num_nodes} ({num_open / graph.num_nodes:.1f}x), "
+          f"số cạnh: {graph.num_edges // 2}, thời gian nén: {build_time:.4f} giây")
+
+    start_time = time.time()
+    path, search_steps = find_path(maze, return_search_steps=True)
+    end_time = time.time()
+
+    if path:
+        print(f"Tìm thấy đường đi với {len(path)} bước:")
+        print(f"Số nút đã mở rộng: {len(search_steps)}")
+        print(f"Thời gian thực thi: {end_time - start_time:.5f} giây")
+    else:
+        print("Không tìm thấy đường đi!")
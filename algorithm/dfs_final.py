@@ -3,94 +3,109 @@ import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle
 import time
 import matplotlib.animation as animation
+import sys
+import os
 
-def find_path(maze_obj, return_search_steps=False):
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithm.search_trace import SearchTrace
+
+def find_path(maze_obj, return_search_steps=False, stats=None):
     """
     Tìm đường đi từ điểm bắt đầu đến điểm kết thúc trong mê cung
     sử dụng thuật toán DFS (Depth-First Search)
     
+    DFS đúng thứ tự đệ quy nhưng không dùng đệ quy hay stack: mỗi ô giữ một bộ đếm hướng tiếp theo
+    (int8, -1 là chưa thăm, 4 là đã thử hết hoặc là tường), còn mảng parent (int32) vừa dùng để
+    quay lui vừa để dựng lại đường đi. Mỗi ô được thăm đúng một lần, không có ô nào bị đẩy trùng,
+    và bộ nhớ là 5 byte/ô thay vì mảng visited bool + mảng parent (h, w, 2) int64 (17 byte/ô)
+    
     maze_obj: instance của lớp Maze
     return_search_steps: bool - nếu True, hàm sẽ trả về thêm các bước tìm kiếm
+    stats: dict hoặc None - nếu là dict, hàm ghi số ô đã mở rộng vào stats["expansions"]
+           (chỉ là một biến đếm, không cần ghi lại các bước)
     
     Trả về:
     - path: list các tọa độ (x, y) thể hiện đường đi từ điểm bắt đầu đến điểm kết thúc
            hoặc None nếu không tìm thấy đường đi
-    - search_steps: list các tọa độ (x, y) theo thứ tự được thăm (nếu return_search_steps=True)
+    - search_steps: list các tọa độ (x, y) theo thứ tự được thăm, mỗi ô một lần (nếu return_search_steps=True)
+    - frontier_history: SearchTrace của stack DFS (các ô trên nhánh đang đi từ điểm bắt đầu),
+      frontier_history[i] là stack khi thăm search_steps[i] (nếu return_search_steps=True)
     """
-    maze = maze_obj.maze  # Truy cập ma trận mê cung trực tiếp
-    start = maze_obj.start
-    end = maze_obj.end
-    height, width = maze.shape  # Lấy kích thước từ maze.shape
+    grid = np.asarray(maze_obj.maze)
+    start = tuple(maze_obj.start)
+    end = tuple(maze_obj.end)
+    height, width = grid.shape
+    padded_width = width + 2
     
-    # Tạo ma trận visited để theo dõi các ô đã thăm với kích thước đúng
-    visited = np.zeros((height, width), dtype=bool)
+    # next_direction = -1 cho ô trống chưa thăm, 4 cho tường và viền (không bao giờ đi vào)
+    padded = np.full((height + 2, padded_width), 4, dtype=np.int8)
+    padded[1:-1, 1:-1][grid == 0] = -1
+    next_direction = memoryview(padded.ravel())
+    parent = memoryview(np.full(padded.size, -1, dtype=np.int32))
     
-    # Tạo ma trận parent để lưu trữ đường đi
-    parent = np.zeros((height, width, 2), dtype=int)
-    parent.fill(-1)  # Khởi tạo tất cả các giá trị là -1
+    start_index = (start[0] + 1)*padded_width + start[1] + 1
+    end_index = (end[0] + 1)*padded_width + end[1] + 1
     
-    # Khởi tạo stack cho DFS
-    stack = [start]
-    visited[start] = True
+    # Các hướng có thể di chuyển: lên, phải, xuống, trái
+    offsets = (-padded_width, 1, padded_width, -1)
     
-    # Lưu các bước tìm kiếm nếu cần
+    # Lưu các bước tìm kiếm và vết của stack nếu cần
     search_steps = [start] if return_search_steps else None
+    frontier_history = SearchTrace(padded_width) if return_search_steps else None
+    if return_search_steps:
+        frontier_history.push(start_index)
+        frontier_history.visit(start_index)
+        frontier_history.mark()
     
-    # Các hướng có thể di chuyển: lên, phải, xuống, trái
-    directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+    def to_position(index):
+        x, y = divmod(index, padded_width)
+        return (x - 1, y - 1)
     
     # DFS để tìm đường đi
-    found = False
-    while stack and not found:
-        current_x, current_y = stack.pop()
-        current = (current_x, current_y) # Define current tuple
-
-        # Thêm vào search_steps nếu cần và không phải là điểm bắt đầu (đã được thêm lúc khởi tạo)
-        if return_search_steps and current != start and visited[current_x, current_y]: # Check visited to avoid re-adding if logic changes
-             # Check if already added to search_steps to prevent duplicates if a node is pushed multiple times before visiting
-            if search_steps[-1] != current: # Simple check, might need more robust for complex scenarios
-                search_steps.append(current)
-
-        # Kiểm tra nếu đã đến đích
-        if current == end:
-            found = True
-            break
+    current = start_index
+    next_direction[current] = 0
+    expansions = 1
+    found = current == end_index
+    while not found:
+        direction = next_direction[current]
+        if direction == 4:
+            # Đã thử hết 4 hướng: quay lui về ô cha
+            if current == start_index:
+                break
+            if return_search_steps:
+                frontier_history.pop(current)
+            current = parent[current]
+            continue
+        next_direction[current] = direction + 1
         
-        # Kiểm tra các hướng có thể di chuyển
-        for dx, dy in directions:
-            next_x, next_y = current_x + dx, current_y + dy
-            next_pos = (next_x, next_y)
-            
-            # Kiểm tra xem ô kế tiếp có hợp lệ không
-            if (0 <= next_x < height and 0 <= next_y < width and
-                    maze[next_x, next_y] == 0 and not visited[next_x, next_y]):
-                stack.append(next_pos)
-                visited[next_x, next_y] = True
-                parent[next_x, next_y] = [current_x, current_y]
-
-
+        next_index = current + offsets[direction]
+        if next_direction[next_index] < 0:
+            next_direction[next_index] = 0
+            parent[next_index] = current
+            current = next_index
+            expansions += 1
+            if return_search_steps:
+                search_steps.append(to_position(current))
+                frontier_history.push(current)
+                frontier_history.visit(current)
+                frontier_history.mark()
+            found = current == end_index
+    
+    if stats is not None:
+        stats["expansions"] = expansions
+    
     # Tái tạo đường đi nếu tìm thấy
+    path = None
     if found:
-        path = []
-        curr = end # Use a different variable name to avoid conflict
-        while curr != start and curr[0] != -1:
-            path.append(curr)
-            curr_x, curr_y = curr
-            parent_x, parent_y = parent[curr_x, curr_y]
-            curr = (parent_x, parent_y)
-            if parent_x == -1 or parent_y == -1: # Avoid infinite loop if start is not reachable
-                break
-        path.append(start)
+        path = [end]
+        while current != start_index:
+            current = parent[current]
+            path.append(to_position(current))
         path.reverse()
-        
-        if return_search_steps:
-            return path, search_steps
-        return path
-    else:
-        if return_search_steps:
-            # Ensure search_steps is returned even if no path is found
-            return None, search_steps if search_steps else [] 
-        return None
+    
+    if return_search_steps:
+        return path, search_steps, frontier_history
+    return path
 
 def print_maze_with_path(maze_obj, path):
     """
@@ -103,7 +118,7 @@ def print_maze_with_path(maze_obj, path):
         print("Không tìm thấy đường đi!")
         return
         
-    maze_display = maze_obj.maze.copy() # Use a different name to avoid confusion
+    maze_display = np.array(maze_obj.maze) # Use a different name to avoid confusion
     
     # Đánh dấu đường đi bằng giá trị 2
     for x, y in path:
@@ -188,7 +203,7 @@ def visualize_search_process(maze_obj, speed=100):
     maze_obj: instance của lớp Maze
     speed: số millisecond cho mỗi bước animation (càng nhỏ càng nhanh)
     """
-    path, search_steps = find_path(maze_obj, return_search_steps=True)
+    path, search_steps, _ = find_path(maze_obj, return_search_steps=True)
     
     if not search_steps: # Handle case where find_path might return None for search_steps
         print("No search steps to visualize.")
@@ -307,9 +322,6 @@ def visualize_search_process(maze_obj, speed=100):
     plt.show()
 
 if __name__ == "__main__":
-    import sys
-    import os
-    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     # Import lớp Maze từ module maze
     from maze.maze import Maze
     
@@ -0,0 +1,196 @@
+import numpy as np
+import heapq
+import time
+
+def path_cost(maze_obj, path):
+    """
+    Tổng chi phí của một đường đi: tổng chi phí các ô được đi vào (không tính ô bắt đầu)
+    Mê cung không có lớp chi phí thì mỗi ô có chi phí 1, tức là số bước đi
+
+    Trả về: int, hoặc None nếu path là None
+    """
+    if path is None:
+        return None
+    if maze_obj.costs is None:
+        return len(path) - 1
+    rows, cols = np.array(path[1:], dtype=np.int64).reshape(-1, 2).T
+    return int(np.asarray(maze_obj.costs)[rows, cols].sum(dtype=np.int64))
+
+def _search(maze_obj, use_heuristic, return_search_steps, stats=None):
+    """
+    Tìm đường đi có tổng chi phí nhỏ nhất trên lưới có chi phí địa hình
+
+    Hàng đợi là heap lười (không có decrease-key): một ô có thể được đẩy nhiều lần, bản cũ bị bỏ qua
+    khi lấy ra. Mỗi phần tử là một số nguyên (f << (g_bits + count_bits)) | (g << count_bits) | count,
+    với pushed[count] là ô tương ứng, giống cách a_star_final.find_path đóng gói (f, g, count)
+    """
+    grid = np.asarray(maze_obj.maze)
+    start = tuple(maze_obj.start)
+    end = tuple(maze_obj.end)
+    height, width = grid.shape
+    padded_width = width + 2
+
+    # closed = 1 cho tường, viền và các ô đã thăm
+    padded = np.ones((height + 2, padded_width), dtype=np.uint8)
+    padded[1:-1, 1:-1] = grid != 0
+    closed = bytearray(padded.tobytes())
+    num_open = height*width - int(np.count_nonzero(grid))
+
+    # Chi phí đi vào từng ô trên lưới có viền
+    cost_grid = np.ones((height + 2, padded_width), dtype=np.int32)
+    if maze_obj.costs is not None:
+        cost_grid[1:-1, 1:-1] = maze_obj.costs
+    costs = memoryview(cost_grid.ravel())
+    max_cost = int(cost_grid[1:-1, 1:-1][grid == 0].max()) if num_open else 1
+
+    # Heuristic Manhattan nhân với chi phí nhỏ nhất của ô trống vẫn là cận dưới nhất quán
+    if use_heuristic:
+        min_cost = int(cost_grid[1:-1, 1:-1][grid == 0].min()) if num_open else 1
+        rows = np.abs(np.arange(-1, height + 1, dtype=np.int64) - end[0])
+        cols = np.abs(np.arange(-1, width + 1, dtype=np.int64) - end[1])
+        heuristic = memoryview((min_cost*(rows[:, None] + cols[None, :])).ravel())
+    else:
+        heuristic = memoryview(np.zeros((height + 2)*padded_width, dtype=np.int64))
+
+    g_score = memoryview(np.full(len(closed), np.iinfo(np.int64).max, dtype=np.int64))
+    parent = memoryview(np.full(len(closed), -1, dtype=np.int32))
+
+    # Mỗi ô được mở rộng nhiều nhất một lần và đẩy tối đa 4 hàng xóm
+    capacity = 4*num_open + 1
+    pushed = memoryview(np.empty(capacity, dtype=np.int32))
+    count_bits = capacity.bit_length()
+    count_mask = (1 << count_bits) - 1
+    g_bits = (max_cost*max(num_open, 1)).bit_length()
+    f_shift = g_bits + count_bits
+
+    start_index = (start[0] + 1)*padded_width + start[1] + 1
+    end_index = (end[0] + 1)*padded_width + end[1] + 1
+    g_score[start_index] = 0
+    count = 0
+    pushed[0] = start_index
+    open_set = [heuristic[start_index] << f_shift]
+    offsets = (-padded_width, 1, padded_width, -1)
+
+    search_steps = [] if return_search_steps else None
+
+    def to_position(index):
+        x, y = divmod(index, padded_width)
+        return (x - 1, y - 1)
+
+    found = False
+    expansions = 0
+    heappop = heapq.heappop
+    heappush = heapq.heappush
+    while open_set:
+        current = pushed[heappop(open_set) & count_mask]
+        if closed[current]:
+            continue
+        closed[current] = 1
+        expansions += 1
+
+        if return_search_steps:
+            search_steps.append(to_position(current))
+
+        if current == end_index:
+            found = True
+            break
+
+        current_g = g_score[current]
+        for offset in offsets:
+            next_index = current + offset
+            if closed[next_index]:
+                continue
+            tentative_g_score = current_g + costs[next_index]
+            if tentative_g_score < g_score[next_index]:
+                g_score[next_index] = tentative_g_score
+                parent[next_index] = current
+                count += 1
+                pushed[count] = next_index
+                heappush(open_set, ((tentative_g_score + heuristic[next_index]) << f_shift)
+                         | (tentative_g_score << count_bits) | count)
+
+    if stats is not None:
+        stats["expansions"] = expansions
+
+    path = None
+    if found:
+        path = [end]
+        current = end_index
+        while current != start_index:
+            current = parent[current]
+            path.append(to_position(current))
+        path.reverse()
+
+    if return_search_steps:
+        return path, search_steps
+    return path
+
+def find_path(maze_obj, return_search_steps=False, stats=None):
+    """
+    Tìm đường đi có tổng chi phí nhỏ nhất bằng thuật toán Dijkstra
+    Chi phí đi vào mỗi ô lấy từ maze_obj.costs (mặc định mỗi ô có chi phí 1)
+
+    maze_obj: instance của lớp Maze
+    return_search_steps: bool - nếu True, hàm sẽ trả về thêm các bước tìm kiếm
+    stats: dict hoặc None - nếu là dict, hàm ghi số ô đã mở rộng vào stats["expansions"]
+           (chỉ là một biến đếm, không cần ghi lại các bước)
+
+    Trả về:
+    - path: list các tọa độ (x, y) thể hiện đường đi từ điểm bắt đầu đến điểm kết thúc
+           hoặc None nếu không tìm thấy đường đi
+    - search_steps: list các tọa độ (x, y) theo thứ tự được thăm (nếu return_search_steps=True)
+    """
+    return _search(maze_obj, use_heuristic=False, return_search_steps=return_search_steps, stats=stats)
+
+def find_path_a_star(maze_obj, return_search_steps=False, stats=None):
+    """
+    Tìm đường đi có tổng chi phí nhỏ nhất bằng A* trên lưới có chi phí địa hình
+    Heuristic là khoảng cách Manhattan nhân với chi phí nhỏ nhất của các ô trống
+
+    Trả về: giống find_path
+    """
+    return _search(maze_obj, use_heuristic=True, return_search_steps=return_search_steps, stats=stats)
+
+def print_maze_with_path(maze_obj, path):
+    """
+    In mê cung ra màn hình console với đường đi được biểu diễn bằng '-'
+    Các ô trống khác được in bằng chữ số chi phí (9 nếu chi phí lớn hơn 9)
+
+    maze_obj: instance của lớp Maze
+    path: list các tọa độ (x, y) thể hiện đường đi
+    """
+    if path is None:
+        print("Không tìm thấy đường đi!")
+        return
+
+    maze = np.array(maze_obj.maze)
+    costs = np.ones(maze.shape, dtype=np.int64) if maze_obj.costs is None else np.asarray(maze_obj.costs)
+    on_path = np.zeros(maze.shape, dtype=bool)
+    for x, y in path:
+        on_path[x, y] = True
+
+    for x, row in enumerate(maze):
+        print(''.join('#' if cell == 1 else '-' if on_path[x, y] else str(min(int(costs[x, y]), 9))
+                      for y, cell in enumerate(row)))
+
+if __name__ == "__main__":
+    import sys
+    import os
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    # Import lớp Maze từ module maze
+    from maze.maze import Maze
+
+    # Tạo mê cung nhiều vòng lặp với địa hình có chi phí 1-9
+    maze = Maze(10, complexity=0.5, algorithm="dfs_backtrack")
+    maze.random_costs(max_cost=9)
+
+    for name, solver in (("Dijkstra", find_path), ("A* có trọng số", find_path_a_star)):
+        start_time = time.time()
+        path, search_steps = solver(maze, return_search_steps=True)
+        end_time = time.time()
+        if path:
+            print(f"{name}: đường đi {len(path)} ô, chi phí {path_cost(maze, path)}, "
+                  f"số ô đã thăm {len(search_steps)}, thời gian {end_time - start_time:.5f} giây")
+        else:
+            print(f"{name}: không tìm thấy đường đi!")
+    print_maze_with_path(maze, path)
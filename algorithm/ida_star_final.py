@@ -0,0 +1,176 @@
+import numpy as np
+import time
+
+# Số ô tối đa của bảng chuyển vị (transposition table) trong mỗi vòng, giữ bộ nhớ bị chặn trên
+DEFAULT_TABLE_SIZE = 1 << 16
+
+def find_path(maze_obj, return_search_steps=False, table_size=DEFAULT_TABLE_SIZE, stats=None):
+    """
+    Tìm đường đi ngắn nhất bằng IDA* (Iterative Deepening A*) với heuristic Manhattan
+
+    Mỗi vòng là một lần DFS chỉ đi tiếp các ô có f = g + h không vượt ngưỡng; ngưỡng của vòng sau
+    là f nhỏ nhất đã bị cắt ở vòng trước. Trạng thái tìm kiếm chỉ gồm đường đi hiện tại, bộ đếm
+    hướng tiếp theo của từng ô trên đường đi và tập các ô đang nằm trên đường đi, nên bộ nhớ làm
+    việc là O(độ dài đường đi) thay vì các mảng (h, w) của A* (ngoài bản sao 1 byte/ô của lưới).
+
+    Trên mê cung có vòng lặp, số đường đi khác nhau tới cùng một ô tăng theo cấp số nhân. Một bảng
+    chuyển vị có kích thước cố định (table_size ô) ghi g nhỏ nhất đã gặp của các ô trong vòng hiện
+    tại, nhánh tới lại một ô với g không nhỏ hơn bị cắt. Khi bảng đầy, các ô mới không được ghi
+    nữa nên bộ nhớ vẫn bị chặn bởi O(độ dài đường đi + table_size)
+
+    Chỉ thực tế trên mê cung gần hoàn hảo (complexity ~ 0) hoặc lưới nhỏ: mỗi vòng duyệt lại toàn bộ
+    các vòng trước, và trên mê cung có vòng lặp số lần mở rộng tăng rất nhanh (mê cung Prim
+    complexity 0.05: size 200 cần ~951k lần mở rộng so với ~21k của A*, size 400 chạy hơn 5 phút).
+    Vì vậy data.py không chạy IDA* mặc định mà chỉ với --ida-star và kích thước bị giới hạn
+
+    maze_obj: instance của lớp Maze
+    return_search_steps: bool - nếu True, hàm sẽ trả về thêm các bước tìm kiếm
+                         (list này tăng theo số lần mở rộng, không còn là O(độ dài đường đi))
+    table_size: int - số ô tối đa của bảng chuyển vị, 0 là IDA* thuần (chỉ cắt các ô đang trên đường đi)
+    stats: dict hoặc None - nếu là dict, hàm ghi số lần mở rộng (gồm cả các lần lặp lại ở những vòng sau) vào stats["expansions"]
+           (chỉ là một biến đếm, không cần ghi lại các bước)
+
+    Trả về:
+    - path: list các tọa độ (x, y) thể hiện đường đi từ điểm bắt đầu đến điểm kết thúc
+           hoặc None nếu không tìm thấy đường đi
+    - search_steps: list các tọa độ (x, y) theo thứ tự được mở rộng, gồm cả các lần
+                    mở rộng lặp lại ở những vòng sau (nếu return_search_steps=True)
+    """
+    grid = np.asarray(maze_obj.maze)
+    start = tuple(maze_obj.start)
+    end = tuple(maze_obj.end)
+    height, width = grid.shape
+    padded_width = width + 2
+
+    # blocked = 1 cho tường và viền (bản sao 1 byte/ô, chỉ đọc)
+    padded = np.ones((height + 2, padded_width), dtype=np.uint8)
+    padded[1:-1, 1:-1] = grid != 0
+    blocked = padded.tobytes()
+    del padded
+
+    start_index = (start[0] + 1)*padded_width + start[1] + 1
+    end_index = (end[0] + 1)*padded_width + end[1] + 1
+    end_row, end_col = end[0] + 1, end[1] + 1
+
+    # Các hướng có thể di chuyển: lên, phải, xuống, trái
+    offsets = (-padded_width, 1, padded_width, -1)
+
+    search_steps = [] if return_search_steps else None
+    expansions = 0
+
+    def heuristic(index):
+        row, col = divmod(index, padded_width)
+        return abs(row - end_row) + abs(col - end_col)
+
+    def to_position(index):
+        x, y = divmod(index, padded_width)
+        return (x - 1, y - 1)
+
+    def finish(cells):
+        if stats is not None:
+            stats["expansions"] = expansions
+        path = [to_position(cell) for cell in cells] if cells is not None else None
+        return (path, search_steps) if return_search_steps else path
+
+    if start_index == end_index:
+        expansions = 1
+        if return_search_steps:
+            search_steps.append(start)
+        return finish([start_index])
+
+    threshold = heuristic(start_index)
+    while True:
+        # path[i] là ô ở độ sâu i (g = i), next_direction[i] là hướng sẽ thử tiếp theo của ô đó
+        path = [start_index]
+        next_direction = [0]
+        on_path = {start_index}
+        best_g = {start_index: 0}
+        next_threshold = None
+        expansions += 1
+        if return_search_steps:
+            search_steps.append(start)
+
+        while path:
+            direction = next_direction[-1]
+            current = path[-1]
+            if direction == 4:
+                # Đã thử hết 4 hướng: quay lui
+                on_path.discard(current)
+                path.pop()
+                next_direction.pop()
+                continue
+            next_direction[-1] = direction + 1
+
+            next_index = current + offsets[direction]
+            if blocked[next_index] or next_index in on_path:
+                continue
+            g_score = len(path)
+            f_score = g_score + heuristic(next_index)
+            if f_score > threshold:
+                if next_threshold is None or f_score < next_threshold:
+                    next_threshold = f_score
+                continue
+            known_g = best_g.get(next_index)
+            if known_g is not None:
+                if known_g <= g_score:
+                    continue
+                best_g[next_index] = g_score
+            elif len(best_g) < table_size:
+                best_g[next_index] = g_score
+
+            path.append(next_index)
+            expansions += 1
+            if return_search_steps:
+                search_steps.append(to_position(next_index))
+            if next_index == end_index:
+                return finish(path)
+            next_direction.append(0)
+            on_path.add(next_index)
+
+        # Không còn nhánh nào bị cắt: không có đường đi
+        if next_threshold is None:
+            return finish(None)
+        threshold = next_threshold
+
+def print_maze_with_path(maze_obj, path):
+    """
+    In mê cung ra màn hình console với đường đi được biểu diễn bằng '-'
+
+    maze_obj: instance của lớp Maze
+    path: list các tọa độ (x, y) thể hiện đường đi
+    """
+    if path is None:
+        print("Không tìm thấy đường đi!")
+        return
+
+    maze = np.array(maze_obj.maze)
+
+    # Đánh dấu đường đi bằng giá trị 2
+    for x, y in path:
+        maze[x, y] = 2
+
+    # In mê cung với đường đi
+    for row in maze:
+        print(''.join('#' if cell == 1 else '-' if cell == 2 else ' ' for cell in row))
+
+if __name__ == "__main__":
+    import sys
+    import os
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    # Import lớp Maze từ module maze
+    from maze.maze import Maze
+
+    # Tạo mê cung hoàn hảo (IDA* phù hợp nhất với mê cung ít vòng lặp)
+    maze = Maze(10, complexity=0, algorithm="dfs_backtrack")
+
+    start_time = time.time()
+    path, search_steps = find_path(maze, return_search_steps=True)
+    end_time = time.time()
+
+    if path:
+        print(f"Tìm thấy đường đi với {len(path)} bước:")
+        print(f"Số lần mở rộng (gồm cả lặp lại): {len(search_steps)}")
+        print(f"Thời gian thực thi: {end_time - start_time:.5f} giây")
+        print_maze_with_path(maze, path)
+    else:
+        print("Không tìm thấy đường đi!")
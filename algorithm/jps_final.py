@@ -0,0 +1,303 @@
+import numpy as np
+import heapq
+import time
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithm.search_trace import SearchTrace
+
+# Các hướng có thể di chuyển: lên, phải, xuống, trái
+DIRECTIONS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+# Hướng được xét tiếp sau khi tới một điểm nhảy theo từng hướng (đã cắt bỏ hướng quay lại):
+# tới theo chiều ngang thì xét hai hướng dọc và đi tiếp; tới theo chiều dọc thì ngược lại
+NEXT_DIRECTIONS = ((1, 3, 0), (0, 2, 1), (1, 3, 2), (0, 2, 3))
+
+def build_jump_tables(grid):
+    """
+    Tính trước các bảng độ dài đoạn chạy (run-length) cho Jump Point Search 4 hướng
+    
+    Trên lưới có thêm viền tường, với mỗi hướng d và mỗi ô c, stops[d][c] là số bước đi thẳng
+    từ c theo hướng d tới ô "sự kiện" đầu tiên (tính cả chính c): tường, hoặc ô có hàng xóm bắt buộc
+    (forced neighbor), hoặc - với hướng dọc - ô mà từ đó nhánh ngang gặp điểm nhảy. Nhờ vậy mỗi lần
+    nhảy chỉ là một lần tra bảng thay vì duyệt từng ô
+    
+    grid: mảng (height, width), 0 là đường đi
+    
+    Trả về dict gồm:
+    - open: mảng bool phẳng, True với ô trống
+    - stops: tuple 4 mảng int32 phẳng theo thứ tự DIRECTIONS
+    - row_segment: mảng int32 phẳng, hai ô cùng một đoạn ngang liền nhau có cùng giá trị
+    - width: chiều rộng lưới có viền
+    - num_open: số ô trống của lưới
+    """
+    height, width = grid.shape
+    padded = np.zeros((height + 2, width + 2), dtype=bool)
+    padded[1:-1, 1:-1] = grid == 0
+    is_open = padded
+    wall = ~is_open
+    
+    # Các ô kề theo 8 hướng (viền là tường nên phép roll chỉ làm sai lệch các ô viền)
+    up = np.roll(is_open, 1, axis=0)
+    down = np.roll(is_open, -1, axis=0)
+    left = np.roll(is_open, 1, axis=1)
+    right = np.roll(is_open, -1, axis=1)
+    up_left = np.roll(up, 1, axis=1)
+    up_right = np.roll(up, -1, axis=1)
+    down_left = np.roll(down, 1, axis=1)
+    down_right = np.roll(down, -1, axis=1)
+    
+    def distance_forward(event, axis):
+        # Số bước tới sự kiện đầu tiên phía sau (chỉ số tăng dần theo axis)
+        index = np.arange(event.shape[axis], dtype=np.int32)
+        index = index[:, None] if axis == 0 else index[None, :]
+        position = np.where(event, index, event.shape[axis])
+        position = np.flip(np.minimum.accumulate(np.flip(position, axis), axis=axis), axis)
+        return (position - index).astype(np.int32)
+    
+    def distance_backward(event, axis):
+        # Số bước tới sự kiện đầu tiên phía trước (chỉ số giảm dần theo axis)
+        index = np.arange(event.shape[axis], dtype=np.int32)
+        index = index[:, None] if axis == 0 else index[None, :]
+        position = np.maximum.accumulate(np.where(event, index, -1), axis=axis)
+        return (index - position).astype(np.int32)
+    
+    # Đi ngang: ô có hàng xóm dọc trống trong khi ô chéo phía sau bị chặn
+    forced_right = is_open & ((up & ~up_left) | (down & ~down_left))
+    forced_left = is_open & ((up & ~up_right) | (down & ~down_right))
+    stop_right = distance_forward(wall | forced_right, 1)
+    stop_left = distance_backward(wall | forced_left, 1)
+    
+    # Ô mà nhánh nhảy ngang (sang trái hoặc phải) gặp một điểm nhảy
+    columns = np.arange(width + 2)[None, :]
+    rows = np.arange(height + 2)[:, None]
+    right_target = np.clip(columns + 1 + np.roll(stop_right, -1, axis=1), 0, width + 1)
+    left_target = np.clip(columns - 1 - np.roll(stop_left, 1, axis=1), 0, width + 1)
+    has_jump = is_open & (is_open[rows, right_target] | is_open[rows, left_target])
+    
+    # Đi dọc: hàng xóm ngang bắt buộc, hoặc nhánh ngang gặp điểm nhảy
+    forced_down = is_open & ((left & ~up_left) | (right & ~up_right))
+    forced_up = is_open & ((left & ~down_left) | (right & ~down_right))
+    stop_down = distance_forward(wall | forced_down | has_jump, 0)
+    stop_up = distance_backward(wall | forced_up | has_jump, 0)
+    
+    # Mã đoạn ngang: vị trí bức tường gần nhất bên phải trên cùng hàng
+    row_segment = (columns + distance_forward(wall, 1)).astype(np.int32)
+    
+    return {
+        "open": is_open.ravel(),
+        "stops": tuple(table.ravel() for table in (stop_up, stop_right, stop_down, stop_left)),
+        "row_segment": row_segment.ravel(),
+        "width": width + 2,
+        "num_open": int(np.count_nonzero(is_open)),
+    }
+
+def jump_tables(maze_obj):
+    """
+    Bảng run-length của mê cung, được lưu trong cache của Maze và tự tạo lại khi lưới thay đổi
+    """
+    return maze_obj.cached("jump_tables", lambda m: build_jump_tables(np.asarray(m.maze)))
+
+def find_path(maze_obj, return_search_steps=False, stats=None):
+    """
+    Tìm đường đi ngắn nhất bằng Jump Point Search (biến thể 4 hướng)
+    
+    Thay vì mở rộng từng ô, A* chỉ mở rộng các điểm nhảy: từ mỗi điểm nhảy, đi thẳng theo các
+    hướng còn lại sau khi cắt tỉa đối xứng cho tới ô đích, ô có hàng xóm bắt buộc hoặc tường.
+    Độ dài mỗi bước nhảy được tra trong bảng run-length của build_jump_tables, các bảng này được
+    tính một lần cho mỗi mê cung (jump_tables) rồi dùng lại cho các truy vấn sau
+    
+    maze_obj: instance của lớp Maze
+    return_search_steps: bool - nếu True, hàm sẽ trả về thêm các bước tìm kiếm
+    stats: dict hoặc None - nếu là dict, hàm ghi số điểm nhảy đã mở rộng vào stats["expansions"]
+           (chỉ là một biến đếm, không cần ghi lại các bước)
+    
+    Trả về:
+    - path: list các tọa độ (x, y) thể hiện đường đi từ điểm bắt đầu đến điểm kết thúc
+           hoặc None nếu không tìm thấy đường đi
+    - search_steps: list các điểm nhảy (x, y) theo thứ tự được mở rộng (nếu return_search_steps=True)
+    - frontier_history: SearchTrace - vết sự kiện của hàng đợi, frontier_history[i] là list các điểm nhảy (x, y)
+      trong hàng đợi sau bước i (nếu return_search_steps=True)
+    """
+    start = tuple(maze_obj.start)
+    end = tuple(maze_obj.end)
+    
+    tables = jump_tables(maze_obj)
+    padded_width = tables["width"]
+    height, width = len(tables["open"]) // padded_width - 2, padded_width - 2
+    is_open = memoryview(tables["open"].view(np.uint8))
+    stops = tuple(memoryview(table) for table in tables["stops"])
+    row_segment = memoryview(tables["row_segment"])
+    offsets = tuple(dx*padded_width + dy for dx, dy in DIRECTIONS)
+    
+    start_index = (start[0] + 1)*padded_width + start[1] + 1
+    end_index = (end[0] + 1)*padded_width + end[1] + 1
+    end_row, end_col = end[0] + 1, end[1] + 1
+    end_segment = row_segment[end_index]
+    
+    def jump(index, direction):
+        """
+        Nhảy thẳng từ ô index theo hướng direction, trả về điểm nhảy hoặc -1
+        """
+        run = stops[direction][index]
+        target = index + run*offsets[direction]
+        row, col = divmod(index, padded_width)
+        if direction & 1:
+            # Đi ngang: đích nằm trên đoạn đã đi qua
+            if row == end_row and min(col, col + run*offsets[direction]) <= end_col <= max(col, col + run*offsets[direction]):
+                return end_index
+        else:
+            # Đi dọc: dừng ở hàng của đích nếu từ đó đi ngang tới được đích
+            step = DIRECTIONS[direction][0]
+            if min(row, row + run*step) <= end_row <= max(row, row + run*step):
+                cell = end_row*padded_width + col
+                if is_open[cell] and row_segment[cell] == end_segment:
+                    return cell
+        return target if is_open[target] else -1
+    
+    num_cells = len(is_open)
+    unreached = np.iinfo(np.int32).max
+    g_score = memoryview(np.full(num_cells, unreached, dtype=np.int32))
+    parent = memoryview(np.full(num_cells, -1, dtype=np.int32))
+    arrival = memoryview(np.full(num_cells, -1, dtype=np.int8))
+    closed = bytearray(num_cells)
+    
+    rows = np.abs(np.arange(-1, height + 1, dtype=np.int32) - end[0])
+    cols = np.abs(np.arange(-1, width + 1, dtype=np.int32) - end[1])
+    heuristic = memoryview((rows[:, None] + cols[None, :]).ravel())
+    
+    # Khóa hàng đợi nguyên (f << 2*bits) | (g << bits) | count như a_star_final.find_path
+    capacity = 4*tables["num_open"] + 1
+    pushed = memoryview(np.empty(capacity, dtype=np.int32))
+    bits = capacity.bit_length()
+    count_mask = (1 << bits) - 1
+    f_shift = 2*bits
+    
+    g_score[start_index] = 0
+    pushed[0] = start_index
+    count = 0
+    open_set = [heuristic[start_index] << f_shift]
+    
+    search_steps = [start] if return_search_steps else None
+    frontier_history = SearchTrace(padded_width) if return_search_steps else None
+    if return_search_steps:
+        frontier_history.push(start_index)
+        frontier_history.mark()
+    
+    def to_position(index):
+        x, y = divmod(index, padded_width)
+        return (x - 1, y - 1)
+    
+    found = False
+    expansions = 0
+    while open_set:
+        current = pushed[heapq.heappop(open_set) & count_mask]
+        if return_search_steps:
+            frontier_history.pop(current)
+        if closed[current]:
+            continue
+        closed[current] = 1
+        expansions += 1
+        
+        if return_search_steps:
+            frontier_history.visit(current)
+            if current != start_index:
+                search_steps.append(to_position(current))
+        
+        if current == end_index:
+            found = True
+            break
+        
+        direction_in = arrival[current]
+        directions = range(4) if direction_in < 0 else NEXT_DIRECTIONS[direction_in]
+        current_g = g_score[current]
+        current_row, current_col = divmod(current, padded_width)
+        for direction in directions:
+            neighbor = current + offsets[direction]
+            if not is_open[neighbor]:
+                continue
+            point = jump(neighbor, direction)
+            if point < 0 or closed[point]:
+                continue
+            point_row, point_col = divmod(point, padded_width)
+            tentative_g_score = current_g + abs(point_row - current_row) + abs(point_col - current_col)
+            if tentative_g_score < g_score[point]:
+                g_score[point] = tentative_g_score
+                parent[point] = current
+                arrival[point] = direction
+                count += 1
+                pushed[count] = point
+                heapq.heappush(open_set, ((tentative_g_score + heuristic[point]) << f_shift)
+                               | (tentative_g_score << bits) | count)
+                if return_search_steps:
+                    frontier_history.push(point)
+        
+        if return_search_steps:
+            frontier_history.mark()
+    
+    if stats is not None:
+        stats["expansions"] = expansions
+    
+    if found:
+        # Nối các điểm nhảy bằng các đoạn thẳng
+        path = [end]
+        current = end_index
+        while current != start_index:
+            previous = parent[current]
+            step = offsets[arrival[current]]
+            cell = current - step
+            while cell != previous:
+                path.append(to_position(cell))
+                cell -= step
+            path.append(to_position(previous))
+            current = previous
+        path.reverse()
+        
+        if return_search_steps:
+            return path, search_steps, frontier_history
+        return path
+    else:
+        if return_search_steps:
+            return None, search_steps, frontier_history
+        return None
+
+def print_maze_with_path(maze_obj, path):
+    """
+    In mê cung ra màn hình console với đường đi được biểu diễn bằng '-'
+    
+    maze_obj: instance của lớp Maze
+    path: list các tọa độ (x, y) thể hiện đường đi
+    """
+    if path is None:
+        print("Không tìm thấy đường đi!")
+        return
+        
+    maze = np.array(maze_obj.maze)
+    
+    # Đánh dấu đường đi bằng giá trị 2
+    for x, y in path:
+        maze[x, y] = 2
+    
+    # In mê cung với đường đi
+    for row in maze:
+        print(''.join('#' if cell == 1 else '-' if cell == 2 else ' ' for cell in row))
+
+if __name__ == "__main__":
+    # Import lớp Maze từ module maze
+    from maze.maze import Maze
+    
+    # Tạo mê cung mới với nhiều vòng lặp
+    maze = Maze(10, complexity=0.3, algorithm="dfs_backtrack")
+    
+    start_time = time.time()
+    path, search_steps, _ = find_path(maze, return_search_steps=True)
+    end_time = time.time()
+    
+    if path:
+        print(f"Tìm thấy đường đi với {len(path)} bước:")
+        print(f"Số điểm nhảy đã mở rộng: {len(search_steps)}")
+        print(f"Thời gian thực thi: {end_time - start_time:.5f} giây")
+        print_maze_with_path(maze, path)
+    else:
+        print("Không tìm thấy đường đi!")
@@ -0,0 +1,312 @@
+import numpy as np
+import heapq
+import time
+
+# Các hướng có thể di chuyển: lên, phải, xuống, trái
+DIRECTIONS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+class MazeSolver:
+    """
+    Bộ giải gắn với một Maze, dùng lại các mảng tìm kiếm giữa nhiều truy vấn
+
+    g_score, parent và hàng đợi được cấp phát một lần theo kích thước lưới. Thay vì xóa cả mảng
+    sau mỗi truy vấn, mỗi truy vấn có một số thế hệ (generation): ô chỉ được coi là đã gặp/đã đóng
+    khi tem của nó bằng thế hệ hiện tại, nên chi phí khởi tạo chỉ tỉ lệ với số ô đã chạm tới.
+    Khi lưới thay đổi (self.maze bị thay, hoặc grid_version tăng vì Maze.invalidate_cache được gọi sau
+    khi sửa tại chỗ), dữ liệu lưới được dựng lại; việc kiểm tra chỉ là O(1) nên mỗi truy vấn vẫn chỉ tốn
+    chi phí tỉ lệ với số ô đã chạm tới
+
+    Cách dùng:
+        solver = MazeSolver(maze)
+        path = solver.find_path((1, 1), (5, 7))
+        path, search_steps = solver.find_path(return_search_steps=True)  # dùng maze.start/maze.end
+    """
+
+    # Tem thế hệ là uint32; khi tràn thì xóa tem một lần rồi đếm lại
+    MAX_GENERATION = np.iinfo(np.uint32).max
+
+    def __init__(self, maze_obj):
+        self.maze_obj = maze_obj
+        self.grid_version = None
+        self.grid = None
+        self.shape = None
+        self.generation = 0
+
+    def _prepare(self):
+        """
+        Dựng lại dữ liệu lưới khi mê cung đã thay đổi kể từ lần gọi trước
+        """
+        maze_obj = self.maze_obj
+        if self.grid is maze_obj.maze and self.grid_version == maze_obj.grid_version:
+            return
+        grid = np.asarray(maze_obj.maze)
+        height, width = grid.shape
+        padded_width = width + 2
+
+        # blocked = 1 cho tường và viền
+        padded = np.ones((height + 2, padded_width), dtype=np.uint8)
+        padded[1:-1, 1:-1] = grid != 0
+        self.blocked = bytes(padded.tobytes())
+        num_cells = padded.size
+        num_open = height*width - int(np.count_nonzero(grid))
+
+        if self.shape != grid.shape:
+            self.shape = grid.shape
+            self.padded_width = padded_width
+            self.offsets = (-padded_width, 1, padded_width, -1)
+            index = np.arange(num_cells, dtype=np.int32)
+            self.row_of = memoryview(index // padded_width)
+            self.col_of = memoryview(index % padded_width)
+            self.g_score = memoryview(np.zeros(num_cells, dtype=np.int32))
+            self.parent = memoryview(np.zeros(num_cells, dtype=np.int32))
+            self.seen = memoryview(np.zeros(num_cells, dtype=np.uint32))
+            self.closed = memoryview(np.zeros(num_cells, dtype=np.uint32))
+            self.generation = 0
+
+        # Mỗi ô mở rộng nhiều nhất một lần và đẩy tối đa 4 hàng xóm
+        capacity = 4*num_open + 1
+        if self.grid is None or len(self.pushed) < capacity:
+            self.pushed = memoryview(np.empty(capacity, dtype=np.int32))
+        self.bits = capacity.bit_length()
+
+        self.grid = maze_obj.maze
+        self.grid_version = maze_obj.grid_version
+
+    def _next_generation(self):
+        """
+        Bắt đầu một truy vấn mới: mọi tem cũ tự động hết hiệu lực
+        """
+        if self.generation >= self.MAX_GENERATION:
+            np.asarray(self.seen)[:] = 0
+            np.asarray(self.closed)[:] = 0
+            self.generation = 0
+        self.generation += 1
+        return self.generation
+
+    def _index(self, position, name):
+        """
+        Đổi tọa độ (x, y) sang chỉ số trên lưới có viền, kiểm tra ô nằm trong lưới và không phải tường
+        """
+        height, width = self.shape
+        x, y = int(position[0]), int(position[1])
+        if not (0 <= x < height and 0 <= y < width):
+            raise ValueError(f"Điểm {name} {tuple(position)} nằm ngoài mê cung {height}x{width}")
+        index = (x + 1)*self.padded_width + y + 1
+        if self.blocked[index]:
+            raise ValueError(f"Điểm {name} {tuple(position)} là tường")
+        return index
+
+    def to_position(self, index):
+        x, y = divmod(index, self.padded_width)
+        return (x - 1, y - 1)
+
+    def find_path(self, start=None, end=None, return_search_steps=False):
+        """
+        Tìm đường đi ngắn nhất bằng A* (heuristic Manhattan) giữa hai ô bất kỳ
+
+        start, end: tuple (x, y) - mặc định là maze.start / maze.end
+        return_search_steps: bool - nếu True, hàm sẽ trả về thêm các bước tìm kiếm
+
+        Trả về:
+        - path: list các tọa độ (x, y) từ start đến end, hoặc None nếu không có đường đi
+        - search_steps: list các tọa độ (x, y) theo thứ tự được thăm (nếu return_search_steps=True)
+        """
+        self._prepare()
+        start = tuple(self.maze_obj.start if start is None else start)
+        end = tuple(self.maze_obj.end if end is None else end)
+        start_index = self._index(start, "bắt đầu")
+        end_index = self._index(end, "kết thúc")
+        generation = self._next_generation()
+
+        blocked = self.blocked
+        g_score = self.g_score
+        parent = self.parent
+        seen = self.seen
+        closed = self.closed
+        pushed = self.pushed
+        row_of = self.row_of
+        col_of = self.col_of
+        offsets = self.offsets
+        end_row = row_of[end_index]
+        end_col = col_of[end_index]
+
+        # Khóa hàng đợi nguyên (f << 2*bits) | (g << bits) | count như a_star_final.find_path
+        bits = self.bits
+        count_mask = (1 << bits) - 1
+        f_shift = 2*bits
+
+        g_score[start_index] = 0
+        parent[start_index] = start_index
+        seen[start_index] = generation
+        count = 0
+        pushed[0] = start_index
+        open_set = [(abs(row_of[start_index] - end_row) + abs(col_of[start_index] - end_col)) << f_shift]
+        search_steps = [] if return_search_steps else None
+
+        found = False
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+        while open_set:
+            current = pushed[heappop(open_set) & count_mask]
+            if closed[current] == generation:
+                continue
+            closed[current] = generation
+
+            if return_search_steps:
+                search_steps.append(self.to_position(current))
+
+            if current == end_index:
+                found = True
+                break
+
+            tentative_g_score = g_score[current] + 1
+            for offset in offsets:
+                next_index = current + offset
+                if blocked[next_index] or closed[next_index] == generation:
+                    continue
+                if seen[next_index] != generation or tentative_g_score < g_score[next_index]:
+                    seen[next_index] = generation
+                    g_score[next_index] = tentative_g_score
+                    parent[next_index] = current
+                    count += 1
+                    pushed[count] = next_index
+                    h = abs(row_of[next_index] - end_row) + abs(col_of[next_index] - end_col)
+                    heappush(open_set, ((tentative_g_score + h) << f_shift)
+                             | (tentative_g_score << bits) | count)
+
+        path = None
+        if found:
+            path = [self.to_position(end_index)]
+            current = end_index
+            while current != start_index:
+                current = parent[current]
+                path.append(self.to_position(current))
+            path.reverse()
+
+        if return_search_steps:
+            return path, search_steps
+        return path
+
+    def solve_many(self, start, targets, stop_early=True, return_search_steps=False):
+        """
+        Tìm đường đi ngắn nhất từ một điểm tới nhiều đích bằng một lần BFS duy nhất
+
+        Mọi đường đi được dựng lại từ cùng một mảng parent, nên chi phí là một lần lan tỏa
+        thay vì một lần tìm kiếm cho mỗi đích
+
+        start: tuple (x, y) - điểm bắt đầu (None: maze.start)
+        targets: list các tuple (x, y) - các đích, có thể trùng nhau
+        stop_early: bool - True thì dừng ngay khi mọi đích đã được thăm,
+                    False thì lan hết vùng liên thông chứa điểm bắt đầu
+        return_search_steps: bool - nếu True, hàm sẽ trả về thêm các bước tìm kiếm
+
+        Trả về:
+        - paths: list đường đi theo đúng thứ tự targets, None với đích không tới được
+        - search_steps: list các tọa độ (x, y) theo thứ tự được thăm (nếu return_search_steps=True)
+        """
+        self._prepare()
+        start = tuple(self.maze_obj.start if start is None else start)
+        start_index = self._index(start, "bắt đầu")
+        target_indices = [self._index(target, "đích") for target in targets]
+        generation = self._next_generation()
+
+        blocked = self.blocked
+        parent = self.parent
+        seen = self.seen
+        offsets = self.offsets
+
+        # Đánh dấu các đích bằng tem trong mảng closed (BFS không cần mảng closed riêng)
+        is_target = self.closed
+        for index in target_indices:
+            is_target[index] = generation
+        remaining = len(set(target_indices))
+
+        # Hàng đợi là bộ đệm pushed dùng lại, mỗi ô vào hàng đợi đúng một lần
+        queue = self.pushed
+        queue[0] = start_index
+        seen[start_index] = generation
+        parent[start_index] = start_index
+        head = 0
+        tail = 1
+
+        while head < tail:
+            current = queue[head]
+            head += 1
+            if is_target[current] == generation:
+                remaining -= 1
+                if stop_early and remaining == 0:
+                    break
+            for offset in offsets:
+                next_index = current + offset
+                if not blocked[next_index] and seen[next_index] != generation:
+                    seen[next_index] = generation
+                    parent[next_index] = current
+                    queue[tail] = next_index
+                    tail += 1
+
+        paths = []
+        for index in target_indices:
+            if seen[index] != generation:
+                paths.append(None)
+                continue
+            path = [self.to_position(index)]
+            while index != start_index:
+                index = parent[index]
+                path.append(self.to_position(index))
+            path.reverse()
+            paths.append(path)
+
+        if return_search_steps:
+            return paths, [self.to_position(index) for index in queue[:head]]
+        return paths
+
+def maze_solver(maze_obj):
+    """
+    MazeSolver dùng chung của một mê cung, lưu trong cache của Maze
+    """
+    return maze_obj.cached("maze_solver", MazeSolver)
+
+def find_path(maze_obj, return_search_steps=False):
+    """
+    Tìm đường đi từ maze.start đến maze.end bằng MazeSolver dùng chung của mê cung
+
+    Trả về giống MazeSolver.find_path
+    """
+    return maze_solver(maze_obj).find_path(return_search_steps=return_search_steps)
+
+def find_paths(maze_obj, targets, start=None, stop_early=True):
+    """
+    Tìm đường đi từ một điểm (mặc định maze.start) tới nhiều đích bằng một lần BFS
+
+    Trả về: list đường đi theo thứ tự targets (xem MazeSolver.solve_many)
+    """
+    return maze_solver(maze_obj).solve_many(start, targets, stop_early=stop_early)
+
+if __name__ == "__main__":
+    import sys
+    import os
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    # Import lớp Maze từ module maze
+    from maze.maze import Maze
+
+    maze = Maze(200, complexity=0.05, algorithm="prim", record="off")
+    solver = MazeSolver(maze)
+
+    # Nhiều truy vấn ngẫu nhiên trên cùng một mê cung
+    rng = np.random.default_rng(0)
+    cells = np.argwhere(np.asarray(maze.maze) == 0)
+    queries = [(tuple(cells[a]), tuple(cells[b])) for a, b in rng.integers(0, len(cells), size=(200, 2))]
+
+    start_time = time.time()
+    total_length = sum(len(solver.find_path(start, end)) for start, end in queries)
+    end_time = time.time()
+    print(f"{len(queries)} truy vấn, tổng độ dài đường đi: {total_length}")
+    print(f"Thời gian thực thi: {end_time - start_time:.5f} giây")
+
+    # Một lần BFS cho mọi đích từ cùng một điểm bắt đầu
+    targets = [end for _, end in queries]
+    start_time = time.time()
+    paths = solver.solve_many(maze.start, targets)
+    end_time = time.time()
+    print(f"solve_many: {len(targets)} đích, {sum(path is not None for path in paths)} tới được, "
+          f"thời gian: {end_time - start_time:.5f} giây")
@@ -0,0 +1,142 @@
+import numpy as np
+from array import array
+
+# Các loại sự kiện của vết tìm kiếm
+PUSH = 0   # ô được đưa vào hàng đợi / ngăn xếp / open set
+POP = 1    # ô được lấy ra (kể cả bản cũ bị bỏ qua của heap lười)
+VISIT = 2  # ô được mở rộng
+
+# Số trạng thái giữa hai checkpoint khi dựng lại frontier
+CHECKPOINT_INTERVAL = 256
+
+class SearchTrace:
+    """
+    Vết tìm kiếm dạng sự kiện thay cho việc chụp lại toàn bộ frontier sau mỗi bước
+
+    Solver chỉ ghi các sự kiện push/pop/visit vào hai mảng song song (loại sự kiện int8 và chỉ số ô
+    int32) và gọi mark() ở những chỗ trước đây chụp frontier. Bộ nhớ là O(số sự kiện) thay vì
+    O(số bước x kích thước frontier). Frontier tại trạng thái bất kỳ được dựng lại khi cần bằng cách
+    phát lại các sự kiện từ checkpoint gần nhất; checkpoint được tạo dần trong lúc phát lại,
+    nên duyệt tuần tự (như animation) chỉ tốn O(tổng số sự kiện)
+
+    Đối tượng dùng được như list các frontier cũ: len(trace) là số trạng thái đã mark,
+    trace[i] là list các tọa độ (x, y) trong frontier ở trạng thái i (theo thứ tự được đẩy vào)
+
+    width: chiều rộng của lưới có viền tường mà solver dùng để đánh chỉ số ô
+           (index = (x + 1)*width + y + 1, giống các solver khác trong algorithm/)
+    """
+
+    def __init__(self, width, checkpoint_interval=CHECKPOINT_INTERVAL):
+        self.width = width
+        self.checkpoint_interval = checkpoint_interval
+        self.kinds = array("b")
+        self.cells = array("i")
+        self.marks = array("q")
+        # checkpoints[j] là frontier (dict ô -> số bản trong frontier) ngay trước các sự kiện
+        # của trạng thái j*checkpoint_interval
+        self._checkpoints = [{}]
+
+    def push(self, index):
+        self.kinds.append(PUSH)
+        self.cells.append(index)
+
+    def pop(self, index):
+        self.kinds.append(POP)
+        self.cells.append(index)
+
+    def visit(self, index):
+        self.kinds.append(VISIT)
+        self.cells.append(index)
+
+    def mark(self):
+        """
+        Kết thúc một trạng thái: frontier của trạng thái này là kết quả của mọi sự kiện đã ghi
+        """
+        self.marks.append(len(self.kinds))
+
+    def to_position(self, index):
+        x, y = divmod(index, self.width)
+        return (x - 1, y - 1)
+
+    @property
+    def nbytes(self):
+        """
+        Số byte của các mảng sự kiện
+        """
+        return (len(self.kinds)*self.kinds.itemsize + len(self.cells)*self.cells.itemsize
+                + len(self.marks)*self.marks.itemsize)
+
+    def events(self):
+        """
+        Trả về (kinds, cells) dưới dạng mảng NumPy int8 / int32 (không sao chép)
+        """
+        return (np.frombuffer(self.kinds, dtype=np.int8) if self.kinds else np.empty(0, dtype=np.int8),
+                np.frombuffer(self.cells, dtype=np.int32) if self.cells else np.empty(0, dtype=np.int32))
+
+    def visits(self):
+        """
+        Trả về list các tọa độ (x, y) theo thứ tự được mở rộng
+        """
+        kinds, cells = self.events()
+        return [self.to_position(index) for index in cells[kinds == VISIT].tolist()]
+
+    def _replay(self, frontier, begin, end):
+        """
+        Áp dụng các sự kiện [begin, end) lên frontier (dict ô -> số bản)
+        """
+        kinds = self.kinds
+        cells = self.cells
+        for event in range(begin, end):
+            kind = kinds[event]
+            if kind == PUSH:
+                index = cells[event]
+                frontier[index] = frontier.get(index, 0) + 1
+            elif kind == POP:
+                index = cells[event]
+                count = frontier.get(index, 0) - 1
+                if count > 0:
+                    frontier[index] = count
+                else:
+                    frontier.pop(index, None)
+
+    def frontier(self, state):
+        """
+        Dựng lại frontier ở trạng thái state (0 <= state < len(self))
+
+        Trả về list các tọa độ (x, y) khác nhau trong frontier
+        """
+        if not 0 <= state < len(self.marks):
+            raise IndexError(f"Trạng thái {state} nằm ngoài vết tìm kiếm ({len(self.marks)} trạng thái)")
+        interval = self.checkpoint_interval
+        checkpoints = self._checkpoints
+
+        # Tạo thêm checkpoint cho tới checkpoint gần nhất trước state
+        while len(checkpoints) <= state // interval:
+            last = len(checkpoints) - 1
+            begin = self.marks[last*interval - 1] if last else 0
+            frontier = dict(checkpoints[last])
+            self._replay(frontier, begin, self.marks[(last + 1)*interval - 1])
+            checkpoints.append(frontier)
+
+        base = state // interval
+        begin = self.marks[base*interval - 1] if base else 0
+        frontier = dict(checkpoints[base])
+        self._replay(frontier, begin, self.marks[state])
+        return [self.to_position(index) for index in frontier]
+
+    def __len__(self):
+        return len(self.marks)
+
+    def __getitem__(self, state):
+        if state < 0:
+            state += len(self.marks)
+        return self.frontier(state)
+
+    def __iter__(self):
+        # Duyệt tuần tự: phát lại liên tục trên một frontier thay vì đi từ checkpoint mỗi lần
+        frontier = {}
+        begin = 0
+        for end in self.marks:
+            self._replay(frontier, begin, end)
+            begin = end
+            yield [self.to_position(index) for index in frontier]
@@ -0,0 +1,157 @@
+import time
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithm import a_star_final
+from algorithm import bfs_final
+from algorithm import bidirectional_a_star_final
+from algorithm import bidirectional_bfs_final
+from algorithm import corridor_graph_final
+from algorithm import dfs_final
+from algorithm import dijkstra_final
+from algorithm import ida_star_final
+from algorithm import jps_final
+
+# Thông báo lỗi khi không có đường đi (giống các module animation trước đây)
+NO_PATH_ERROR = "No path exists between start and end"
+
+# Bảng các thuật toán tìm đường: tên -> adapter run(maze_obj, name, record_steps, **options) -> SolveResult
+# Mỗi adapter biết đúng dạng trả về của find_path mà nó bọc (xem frontier_solver, steps_solver, sides_solver)
+REGISTRY = {}
+
+class SolveResult:
+    """
+    Kết quả thống nhất của một lần tìm đường, dùng chung cho animation, app.py và data.py
+
+    - name: tên thuật toán trong REGISTRY
+    - path: list các tọa độ (x, y) từ điểm bắt đầu đến điểm kết thúc, hoặc None
+    - expansions: số ô (hoặc điểm nhảy / nút hành lang) đã mở rộng, luôn có kể cả khi không ghi các bước
+    - search_steps: list các ô (x, y) theo thứ tự được mở rộng (None nếu không ghi lại các bước)
+    - trace: vết frontier, None nếu thuật toán không ghi frontier hoặc không ghi lại các bước.
+      Với mọi thuật toán có vết, trace là một dãy chỉ đọc (len(trace), trace[i], duyệt tuần tự) và
+      trace[i] là list các ô (x, y) nằm trong frontier (hàng đợi / stack / open set) ở bước i,
+      với mọi 0 <= i < len(search_steps)
+    - sides: với thuật toán hai chiều, list cùng độ dài với search_steps, phần tử là FORWARD (0) nếu ô
+      được phía điểm bắt đầu mở rộng, BACKWARD (1) nếu được phía điểm kết thúc mở rộng; None nếu
+      thuật toán một chiều hoặc không ghi lại các bước
+    - timings: dict thời gian (giây), "search" là thời gian chạy thuật toán
+    """
+
+    def __init__(self, name, path, expansions, search_steps=None, trace=None, timings=None, sides=None):
+        self.name = name
+        self.path = path
+        self.expansions = expansions
+        self.search_steps = search_steps
+        self.trace = trace
+        self.sides = sides
+        self.timings = timings if timings is not None else {}
+
+    @property
+    def found(self):
+        return self.path is not None
+
+    @property
+    def error(self):
+        return None if self.found else NO_PATH_ERROR
+
+    def __repr__(self):
+        return (f"SolveResult({self.name!r}, path={len(self.path) if self.found else None}, "
+                f"expansions={self.expansions}, search={self.timings.get('search', 0):.5f}s)")
+
+def frontier_solver(find_path):
+    """
+    Adapter cho find_path trả về (path, search_steps, frontier_history) khi ghi các bước;
+    frontier_history (SearchTrace / QueueFrontierHistory) trở thành trace
+    """
+    def run(maze_obj, name, record_steps, **options):
+        stats = {}
+        result = find_path(maze_obj, return_search_steps=record_steps, stats=stats, **options)
+        if not record_steps:
+            return SolveResult(name, result, stats["expansions"])
+        path, search_steps, frontier_history = result
+        return SolveResult(name, path, stats["expansions"], search_steps, frontier_history)
+    return run
+
+def steps_solver(find_path):
+    """
+    Adapter cho find_path trả về (path, search_steps) khi ghi các bước (không có vết frontier)
+    """
+    def run(maze_obj, name, record_steps, **options):
+        stats = {}
+        result = find_path(maze_obj, return_search_steps=record_steps, stats=stats, **options)
+        if not record_steps:
+            return SolveResult(name, result, stats["expansions"])
+        path, search_steps = result
+        return SolveResult(name, path, stats["expansions"], search_steps)
+    return run
+
+def sides_solver(find_path):
+    """
+    Adapter cho các thuật toán hai chiều: find_path trả về (path, search_steps, search_sides).
+    search_sides không phải vết frontier nên trace là None; phía của từng bước nằm trong sides
+    """
+    def run(maze_obj, name, record_steps, **options):
+        stats = {}
+        result = find_path(maze_obj, return_search_steps=record_steps, stats=stats, **options)
+        if not record_steps:
+            return SolveResult(name, result, stats["expansions"])
+        path, search_steps, search_sides = result
+        return SolveResult(name, path, stats["expansions"], search_steps, sides=search_sides)
+    return run
+
+def register_solver(name, run):
+    """
+    Thêm (hoặc thay thế) một thuật toán trong REGISTRY
+
+    run: adapter run(maze_obj, name, record_steps, **options) trả về SolveResult,
+         thường tạo bằng frontier_solver / steps_solver / sides_solver từ find_path của algorithm/*_final.py
+    """
+    REGISTRY[name] = run
+    return run
+
+def solver_names():
+    """
+    Danh sách tên các thuật toán theo thứ tự đăng ký
+    """
+    return list(REGISTRY)
+
+def get_solver(name):
+    """
+    Trả về adapter đã đăng ký với tên name
+    """
+    if name not in REGISTRY:
+        raise ValueError(f"Thuật toán không xác định: {name}. Các thuật toán có sẵn: {', '.join(REGISTRY)}")
+    return REGISTRY[name]
+
+def solve(maze_obj, name, record_steps=False, **options):
+    """
+    Chạy thuật toán name trên mê cung và trả về SolveResult
+
+    maze_obj: instance của lớp Maze
+    name: tên thuật toán trong REGISTRY
+    record_steps: bool - nếu True, ghi lại search_steps và trace (tốn thêm thời gian và bộ nhớ);
+                  expansions luôn được điền
+    options: tham số riêng của thuật toán, truyền thẳng cho find_path
+
+    Trả về: SolveResult
+    """
+    run = get_solver(name)
+    start_time = time.perf_counter()
+    result = run(maze_obj, name, record_steps, **options)
+    result.timings["search"] = time.perf_counter() - start_time
+    return result
+
+# Các thuật toán có sẵn
+register_solver("DFS", frontier_solver(dfs_final.find_path))
+register_solver("BFS", frontier_solver(bfs_final.find_path))
+register_solver("A*", frontier_solver(a_star_final.find_path))
+register_solver("A* Bucket", frontier_solver(a_star_final.find_path_bucket))
+register_solver("A* ALT", frontier_solver(a_star_final.find_path_alt))
+register_solver("IDA*", steps_solver(ida_star_final.find_path))
+register_solver("Bidirectional BFS", sides_solver(bidirectional_bfs_final.find_path))
+register_solver("Bidirectional A*", sides_solver(bidirectional_a_star_final.find_path))
+register_solver("JPS", frontier_solver(jps_final.find_path))
+register_solver("Corridor A*", steps_solver(corridor_graph_final.find_path))
+register_solver("Dijkstra", steps_solver(dijkstra_final.find_path))
+register_solver("Weighted A*", steps_solver(dijkstra_final.find_path_a_star))
@@ -2,73 +2,11 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle, Patch
 import matplotlib.animation as animation
-from collections import deque
 import sys
 import os
 
-def find_path(maze_obj, return_search_steps=False):
-    maze = maze_obj.maze
-    start_pos = maze_obj.start
-    end_pos = maze_obj.end
-    height, width = maze.shape
-
-    visited = np.zeros((height, width), dtype=bool)
-    parent = np.full((height, width, 2), -1, dtype=int)
-    queue = deque([start_pos])
-    visited[start_pos] = True
-
-    search_steps = [start_pos] if return_search_steps else None
-    queue_steps = [list(queue)] if return_search_steps else None
-    search_steps_set = {start_pos} if return_search_steps else None
-
-    directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-    found = False
-
-    while queue and not found:
-        current_pos = queue.popleft()
-        current_x, current_y = current_pos
-
-        if return_search_steps and current_pos not in search_steps_set:
-            search_steps.append(current_pos)
-            search_steps_set.add(current_pos)
-
-        if current_pos == end_pos:
-            found = True
-            if return_search_steps:
-                queue_steps.append(list(queue))
-            break
-
-        for dx, dy in directions:
-            next_x, next_y = current_x + dx, current_y + dy
-            next_pos = (next_x, next_y)
-            if (0 <= next_x < height and 0 <= next_y < width and
-                    maze[next_x, next_y] == 0 and not visited[next_x, next_y]):
-                queue.append(next_pos)
-                visited[next_x, next_y] = True
-                parent[next_x, next_y] = [current_x, current_y]
-
-        if return_search_steps:
-            queue_steps.append(list(queue))
-
-    if found:
-        path = []
-        current_pos = end_pos
-        while current_pos != start_pos:
-            path.append(current_pos)
-            curr_x, curr_y = current_pos
-            current_pos = tuple(parent[curr_x, curr_y])
-            if current_pos == (-1, -1):
-                break
-        path.append(start_pos)
-        path.reverse()
-        if return_search_steps:
-            return path, (search_steps, queue_steps), None
-        return path, None
-    else:
-        error = "No path exists between start and end"
-        if return_search_steps:
-            return None, (search_steps, queue_steps), error
-        return None, error
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithm.solvers import solve
 
 def print_maze_with_path(maze_obj, path):
     """
@@ -82,7 +20,7 @@ def print_maze_with_path(maze_obj, path):
         print("Không tìm thấy đường đi!")
         return
 
-    maze_display = maze_obj.maze.copy()
+    maze_display = np.array(maze_obj.maze)
     for x, y in path:
         maze_display[x, y] = 2
 
@@ -153,8 +91,9 @@ def visualize_maze_with_path(maze_obj, path):
     plt.show()
 
 def create_bfs_animation(maze_obj, interval=100, save_animation=False, show_plot=True):
-    result = find_path(maze_obj, return_search_steps=True)
-    path, (search_steps, queue_steps), error = result
+    # Chạy thuật toán qua bộ giải chung; queue_steps[i] là frontier khi mở rộng search_steps[i]
+    result = solve(maze_obj, "BFS", record_steps=True)
+    path, search_steps, queue_steps = result.path, result.search_steps, result.trace
 
     if not search_steps:
         if show_plot:
@@ -162,7 +101,7 @@ def create_bfs_animation(maze_obj, interval=100, save_animation=False, show_plot
             ax.text(0.5, 0.5, "No search steps to visualize!", ha='center', va='center', fontsize=12, color='red')
             ax.set_axis_off()
             plt.show()
-        return path, (search_steps, queue_steps), error
+        return result
 
     maze = maze_obj.maze
     height, width = maze.shape
@@ -305,12 +244,10 @@ def create_bfs_animation(maze_obj, interval=100, save_animation=False, show_plot
     else:
         plt.close()
 
-    return path, (search_steps, queue_steps), error
+    return result
 
 if __name__ == "__main__":
-    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from maze.maze import Maze
-    import time
 
     maze = Maze(10, complexity=0.03, algorithm="dfs_backtrack")
     print("Mê cung ban đầu:")
@@ -319,20 +256,19 @@ if __name__ == "__main__":
 
     show_animation = True
     if show_animation:
-        path, steps, error = create_bfs_animation(maze, interval=100, save_animation=False, show_plot=True)
-        if error:
-            print(f"Không tìm thấy đường đi! Lỗi: {error}")
+        result = create_bfs_animation(maze, interval=100, save_animation=False, show_plot=True)
+        if result.error:
+            print(f"Không tìm thấy đường đi! Lỗi: {result.error}")
     else:
-        start_time = time.time()
-        path, error = find_path(maze)
-        end_time = time.time()
+        result = solve(maze, "BFS")
+        path = result.path
 
         if path:
             print(f"Tìm thấy đường đi với {len(path)} bước:")
             print(f"Độ dài đường đi: {len(path) - 1}")
-            print(f"Thời gian thực thi: {end_time - start_time:.5f} giây")
+            print(f"Thời gian thực thi: {result.timings['search']:.5f} giây")
             print_maze_with_path(maze, path)
             visualize_maze_with_path(maze, path)
         else:
-            print(f"Không tìm thấy đường đi! Lỗi: {error}")
-            print(f"Thời gian thực thi: {end_time - start_time:.5f} giây")
\ No newline at end of file
+            print(f"Không tìm thấy đường đi! Lỗi: {result.error}")
+            print(f"Thời gian thực thi: {result.timings['search']:.5f} giây")
\ No newline at end of file
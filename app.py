@@ -311,7 +311,8 @@ class ModernMazeApp:
         algo_options = [
             ("Thuật Toán Prim", "prim"), 
             ("DFS Backtrack", "dfs_backtrack"),
-            ("Thuật Toán Kruskal", "kruskal")  # Thêm Kruskal
+            ("Thuật Toán Kruskal", "kruskal"),  # Thêm Kruskal
+            ("Recursive Division", "recursive_division")
         ]
         
         gen_combo = ttk.Combobox(gen_frame,
@@ -439,10 +440,11 @@ class ModernMazeApp:
             self.run_button.configure(state="disabled", text="⏳ Đang xử lý...")
             
             # Cập nhật thông báo tùy thuộc vào thuật toán tạo mê cung
-            algo_name = "Kruskal" if maze_gen_algo == "kruskal" else "Prim" if maze_gen_algo == "prim" else "DFS Backtrack"
+            algo_name = ("Kruskal" if maze_gen_algo == "kruskal" else "Prim" if maze_gen_algo == "prim"
+                         else "Recursive Division" if maze_gen_algo == "recursive_division" else "DFS Backtrack")
             self._update_status(f"Đang tạo mê cung {size}×{size} bằng thuật toán {algo_name}...")
             
-            maze_obj = Maze(size, complexity=complexity, algorithm=maze_gen_algo)
+            maze_obj = Maze(size, complexity=complexity, algorithm=maze_gen_algo, record="off")
             print(f"✅ Tạo mê cung thành công: {size}×{size}, độ phức tạp: {complexity}, thuật toán: {algo_name}")
             
             self._update_status(f"Đang trực quan hóa thuật toán {selected_algo}...")
@@ -453,16 +455,19 @@ class ModernMazeApp:
                 'show_plot': True
             }
             
+            # Các animation đều chạy thuật toán qua bộ giải chung (algorithm/solvers.py) và trả về SolveResult
             if selected_algo == "A*":
-                create_astar_animation(maze_obj, **animation_params)
+                result = create_astar_animation(maze_obj, **animation_params)
             elif selected_algo == "BFS": 
-                create_bfs_animation(maze_obj, **animation_params)
+                result = create_bfs_animation(maze_obj, **animation_params)
             elif selected_algo == "DFS":
-                create_dfs_animation(maze_obj, **animation_params)
+                result = create_dfs_animation(maze_obj, **animation_params)
             else:
                 raise ValueError(f"Thuật toán không xác định: {selected_algo}")
-                
-            self._update_status(f"✅ Hoàn thành trực quan hóa {selected_algo}!")
+            
+            summary = (f"đường đi {len(result.path)} ô" if result.found else "không tìm thấy đường đi")
+            self._update_status(f"✅ Hoàn thành trực quan hóa {selected_algo}: {summary}, "
+                                f"đã xét {result.expansions} ô, {result.timings['search']*1000:.1f} ms")
             
         except Exception as e:
             error_msg = f"Lỗi trực quan hóa: {str(e)}"
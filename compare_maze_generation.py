@@ -6,20 +6,32 @@ import os
 from maze.maze import Maze
 
 """
-File này dùng để so sánh thời gian tạo mê cung giữa hai thuật toán DFS Backtracker và Prim
+File này dùng để so sánh thời gian tạo mê cung giữa các thuật toán (DFS Backtracker, Prim, Eller, Recursive Division, Wilson, Aldous-Broder)
 - Tạo mê cung với nhiều kích thước khác nhau
 - Đo thời gian thực hiện của mỗi thuật toán
+- So sánh DFS Backtracker mới (mảng phẳng) với bản cũ (dfs_backtrack_classic)
 - Vẽ biểu đồ so sánh
 - Lưu kết quả vào file CSV
 """
 
+# Các thuật toán cần so sánh: (tên cột, tên thuật toán trong Maze)
+ALGORITHMS = [
+    ("DFS Backtracker (s)", "dfs_backtrack"),
+    ("DFS Backtracker bản cũ (s)", "dfs_backtrack_classic"),
+    ("Prim (s)", "prim"),
+    ("Eller (s)", "eller"),
+    ("Recursive Division (s)", "recursive_division"),
+    ("Wilson (s)", "wilson"),
+    ("Aldous-Broder (s)", "aldous_broder"),
+]
+
 def measure_maze_generation_time(size, algorithm, num_trials=5):
     """
     Đo thời gian trung bình để tạo mê cung với kích thước và thuật toán cho trước
     
     Args:
         size: Kích thước của mê cung
-        algorithm: Thuật toán tạo mê cung ("dfs_backtrack" hoặc "prim")
+        algorithm: Thuật toán tạo mê cung ("dfs_backtrack", "dfs_backtrack_classic", "prim", "eller", "recursive_division", "wilson" hoặc "aldous_broder")
         num_trials: Số lần lặp lại để tính trung bình
         
     Returns:
@@ -41,7 +53,7 @@ def measure_maze_generation_time(size, algorithm, num_trials=5):
         sys.stdout = StringIO()
         
         # Tạo mê cung
-        maze = Maze(size, complexity=0, algorithm=algorithm)
+        maze = Maze(size, complexity=0, algorithm=algorithm, record="off")
         
         # Khôi phục đầu ra tiêu chuẩn
         sys.stdout = old_stdout
@@ -53,7 +65,7 @@ def measure_maze_generation_time(size, algorithm, num_trials=5):
 
 def compare_algorithms(sizes):
     """
-    So sánh thời gian tạo mê cung của hai thuật toán với nhiều kích thước khác nhau
+    So sánh thời gian tạo mê cung của các thuật toán với nhiều kích thước khác nhau
     
     Args:
         sizes: Danh sách các kích thước mê cung cần đo
@@ -66,17 +78,11 @@ def compare_algorithms(sizes):
     for size in sizes:
         print(f"Đang so sánh với kích thước {size}x{size}...")
         
-        dfs_time = measure_maze_generation_time(size, "dfs_backtrack")
-        prim_time = measure_maze_generation_time(size, "prim")
-        
-        results.append({
-            "Kích thước": size,
-            "DFS Backtracker (s)": dfs_time,
-            "Prim (s)": prim_time
-        })
-        
-        print(f"  DFS Backtracker: {dfs_time:.4f}s")
-        print(f"  Prim: {prim_time:.4f}s")
+        row = {"Kích thước": size}
+        for column, algorithm in ALGORITHMS:
+            row[column] = measure_maze_generation_time(size, algorithm)
+            print(f"  {column[:-4]}: {row[column]:.4f}s")
+        results.append(row)
     
     return pd.DataFrame(results)
 
@@ -90,8 +96,8 @@ def plot_comparison(results):
     plt.figure(figsize=(10, 6))
     
     # Vẽ biểu đồ đường
-    plt.plot(results["Kích thước"], results["DFS Backtracker (s)"], marker='o', label="DFS Backtracker")
-    plt.plot(results["Kích thước"], results["Prim (s)"], marker='x', label="Prim")
+    for column, _ in ALGORITHMS:
+        plt.plot(results["Kích thước"], results[column], marker='o', label=column[:-4])
     
     plt.title("So sánh thời gian tạo mê cung")
     plt.xlabel("Kích thước mê cung")
@@ -110,11 +116,12 @@ def plot_comparison(results):
     plt.figure(figsize=(10, 6))
     
     # Tạo dữ liệu cho biểu đồ cột
-    bar_width = 0.35
+    bar_width = 0.8 / len(ALGORITHMS)
     x = np.arange(len(results["Kích thước"]))
     
-    plt.bar(x - bar_width/2, results["DFS Backtracker (s)"], bar_width, label="DFS Backtracker")
-    plt.bar(x + bar_width/2, results["Prim (s)"], bar_width, label="Prim")
+    for i, (column, _) in enumerate(ALGORITHMS):
+        offset = (i - (len(ALGORITHMS) - 1) / 2) * bar_width
+        plt.bar(x + offset, results[column], bar_width, label=column[:-4])
     
     plt.title("So sánh thời gian tạo mê cung")
     plt.xlabel("Kích thước mê cung")
@@ -131,7 +138,7 @@ def plot_comparison(results):
 
 if __name__ == "__main__":
     # Danh sách các kích thước mê cung cần đo
-    sizes = [10, 20, 50, 100]
+    sizes = [10, 20, 50, 100, 500]
     
     # So sánh thời gian tạo mê cung
     print("\nBắt đầu so sánh thời gian tạo mê cung...")
@@ -0,0 +1,143 @@
+import os
+import csv
+import sys
+import tracemalloc
+import numpy as np
+from io import StringIO
+from maze.maze import Maze, BitGrid
+from algorithm.bfs_final import find_path_frontier
+
+"""
+File này dùng để so sánh bộ nhớ của lưới mê cung giữa các kiểu lưu trữ
+- int64: cách lưu cũ (8 byte/ô), chỉ đo ở các kích thước <= INT64_MAX_SIZE
+- uint8: kiểu lưu mặc định hiện tại (1 byte/ô)
+- bitpacked: lưới nén BitGrid (1 bit/ô)
+- Mặc định đo thật bằng tracemalloc bộ nhớ đỉnh khi tạo mê cung và khi tìm đường (BFS theo tầng),
+  cùng kích thước lưới lúc lưu trữ; --storage-only chỉ tính nbytes của lưới
+- Kích thước mặc định là 1000 và 2000; --large thêm 5000 (chạy mất hàng chục phút)
+- Lưu kết quả vào file CSV
+
+Lưu ý: bit-packing chủ yếu thu nhỏ lưới lúc lưu trữ (at rest). Eller và Recursive Division ghi thẳng
+từng hàng/slice vào lưới nén nên bộ nhớ đỉnh khi tạo cũng giảm; các thuật toán tạo mê cung khác và
+mọi solver đều giải nén ra mảng uint8 đầy đủ (np.asarray(maze.maze)) trong lúc chạy, nên bộ nhớ đỉnh
+của chúng gần như không đổi giữa hai kiểu lưu trữ
+
+Mặc định dùng Eller và BFS theo tầng (vector hóa) vì tracemalloc làm chậm mạnh các vòng lặp tạo nhiều
+đối tượng Python: Kruskal hay BFS từng ô ở kích thước 5000 mất hàng giờ khi bị đo
+"""
+
+# Kích thước mặc định, và kích thước thêm vào khi chạy với --large
+DEFAULT_SIZES = [1000, 2000]
+LARGE_SIZES = [5000]
+
+# Lưới int64 (cách lưu cũ) chỉ được đo tới kích thước này: ở 5000 riêng lưới đã gần 800 MB
+INT64_MAX_SIZE = 2000
+
+def measure_grid_memory(size):
+    """
+    Đo số byte của lưới (2*size+1) x (2*size+1) với từng kiểu lưu trữ
+
+    Args:
+        size: Kích thước của mê cung
+
+    Returns:
+        dict chứa số byte của từng kiểu lưu trữ
+    """
+    side = 2*size + 1
+
+    # np.empty chỉ để lấy nbytes của cách lưu cũ mà không phải ghi 8 byte/ô
+    legacy = np.empty((side, side), dtype=int)
+    compact = np.ones((side, side), dtype=np.uint8)
+    packed = BitGrid(side, side)
+
+    return {
+        "Kích thước": size,
+        "int64 (MB)": legacy.nbytes / 2**20,
+        "uint8 (MB)": compact.nbytes / 2**20,
+        "bitpacked (MB)": packed.nbytes / 2**20,
+    }
+
+def measure_peaks(size, storage, algorithm="eller", seed=0):
+    """
+    Đo bộ nhớ đỉnh (tracemalloc) khi tạo hẳn một mê cung với kiểu lưu trữ cho trước,
+    rồi khi tìm đường trên mê cung đó (hai lần đo riêng)
+    Với "int64", mê cung được tạo ở dạng uint8 rồi chuyển sang int64 trong cùng lần đo,
+    giống cách lưu cũ (np.ones(..., dtype=int)) mà các thuật toán tạo mê cung từng dùng
+
+    Args:
+        size: Kích thước của mê cung
+        storage: Kiểu lưu trữ ("int64", "uint8" hoặc "bitpacked")
+        algorithm: Thuật toán tạo mê cung
+        seed: Hạt giống, cùng seed cho hai kiểu lưu trữ cùng một mê cung
+
+    Returns:
+        (số MB của lưới lúc lưu trữ, bộ nhớ đỉnh khi tạo (MB), bộ nhớ đỉnh khi tìm đường (MB))
+    """
+    old_stdout = sys.stdout
+    sys.stdout = StringIO()
+    tracemalloc.start()
+    try:
+        if storage == "int64":
+            maze = Maze(size, complexity=0, algorithm=algorithm, record="off", seed=seed)
+            maze.maze = maze.maze.astype(np.int64)
+            maze.invalidate_cache()
+        else:
+            maze = Maze(size, complexity=0, algorithm=algorithm, storage=storage, record="off", seed=seed)
+        _, build_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        sys.stdout = old_stdout
+
+    tracemalloc.start()
+    try:
+        find_path_frontier(maze)
+        _, solve_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return maze.maze.nbytes / 2**20, build_peak / 2**20, solve_peak / 2**20
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='So sánh bộ nhớ lưới mê cung giữa các kiểu lưu trữ')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Các kích thước mê cung cần đo (mặc định: 1000 2000)')
+    parser.add_argument('--large', action='store_true',
+                        help='Đo thêm kích thước 5000 (chậm, cần khoảng 1 GB bộ nhớ)')
+    parser.add_argument('--generator', default='eller',
+                        choices=['prim', 'dfs_backtrack', 'kruskal', 'eller', 'recursive_division',
+                                 'wilson', 'aldous_broder'],
+                        help='Thuật toán tạo mê cung (mặc định: eller, các thuật toán khác rất chậm khi bị đo)')
+    parser.add_argument('--storage-only', action='store_true',
+                        help='Chỉ tính nbytes của lưới, không tạo mê cung (nhanh, không đo bộ nhớ đỉnh)')
+    args = parser.parse_args()
+    sizes = args.sizes + [size for size in LARGE_SIZES if args.large and size not in args.sizes]
+
+    results = []
+    print("\nBắt đầu so sánh bộ nhớ lưới mê cung...")
+    for size in sizes:
+        if args.storage_only:
+            row = measure_grid_memory(size)
+            print(f"  {size}x{size}: int64 {row['int64 (MB)']:.1f} MB, "
+                  f"uint8 {row['uint8 (MB)']:.1f} MB ({row['int64 (MB)'] / row['uint8 (MB)']:.0f}x), "
+                  f"bitpacked {row['bitpacked (MB)']:.1f} MB ({row['int64 (MB)'] / row['bitpacked (MB)']:.0f}x)")
+        else:
+            row = {"Kích thước": size}
+            storages = ("int64", "uint8", "bitpacked") if size <= INT64_MAX_SIZE else ("uint8", "bitpacked")
+            for storage in storages:
+                grid_mb, build_peak, solve_peak = measure_peaks(size, storage, args.generator)
+                row[f"Lưới {storage} (MB)"] = grid_mb
+                row[f"Tạo {storage} đỉnh (MB)"] = build_peak
+                row[f"Giải {storage} đỉnh (MB)"] = solve_peak
+                print(f"  {size}x{size} ({storage}): lưới {grid_mb:.2f} MB, "
+                      f"tạo mê cung đỉnh {build_peak:.1f} MB, tìm đường đỉnh {solve_peak:.1f} MB")
+        results.append(row)
+
+    os.makedirs("results", exist_ok=True)
+    with open("results/maze_memory.csv", "w", newline='') as file:
+        # Các kích thước lớn không có cột int64 nên lấy hợp các cột, ô thiếu để trống
+        fieldnames = list(max(results, key=len).keys())
+        writer = csv.DictWriter(file, fieldnames=fieldnames, restval="")
+        writer.writeheader()
+        writer.writerows(results)
+    print("Đã lưu kết quả vào file results/maze_memory.csv")
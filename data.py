@@ -3,6 +3,7 @@ import os
 import csv
 import random
 import time
+import tracemalloc
 import numpy as np
 
 # Add module paths
@@ -10,18 +11,97 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Import maze and algorithm modules
 from maze.maze import Maze
-from algorithm.a_star_final import find_path as a_star_find_path
-from algorithm.bfs_final import find_path as bfs_find_path
-from algorithm.dfs_final import find_path as dfs_find_path
+from algorithm.dijkstra_final import path_cost
+from algorithm.jps_final import jump_tables
+from algorithm.solvers import solve
 
-def run_benchmarks(num_runs=10, maze_sizes=[15, 25, 50], complexity=0.05):
+# Pathfinding algorithms to benchmark, by their name in the solver registry (algorithm/solvers.py)
+# Corridor A* counts expanded junction nodes and includes building the graph, which the maze then caches;
+# A* ALT likewise includes the landmark BFS precomputation and JPS building its run-length tables
+SOLVERS = [
+    "DFS",
+    "BFS",
+    "A*",
+    "A* Bucket",
+    "A* ALT",
+    "Bidirectional BFS",
+    "Bidirectional A*",
+    "JPS",
+    "Corridor A*",
+]
+
+# Solvers compared by the complexity sweep (Jump Point Search against plain A*)
+SWEEP_SOLVERS = ["A*", "JPS"]
+SWEEP_COMPLEXITIES = [0.0, 0.05, 0.3]
+
+# IDA* re-expands every earlier iteration and blows up on mazes with loops, so it is left out of
+# SOLVERS and benchmarked only with --ida-star, against A*, on sizes up to IDA_STAR_MAX_SIZE
+IDA_STAR_SOLVERS = ["A*", "IDA*"]
+IDA_STAR_MAX_SIZE = 100
+
+# Solvers compared on weighted terrain; BFS ignores the costs and shows the price of cost-unaware routing
+WEIGHTED_SOLVERS = ["BFS", "Dijkstra", "Weighted A*"]
+
+def make_maze_seeds(count, seed=None):
+    """
+    Derive one independent 32-bit maze seed per configuration from a base seed.
+    With the same base seed the whole benchmark can be replayed maze by maze.
+    
+    Returns (base_entropy, list of maze seeds)
     """
-    Run benchmarks for all pathfinding algorithms using only Prim's maze generation
+    seed_sequence = np.random.SeedSequence(seed)
+    return seed_sequence.entropy, [int(s) for s in seed_sequence.generate_state(count)]
+
+def run_solver(name, maze):
+    """
+    Run one pathfinding algorithm from the solver registry on a maze
+    
+    Search steps are not recorded: every solver counts its expansions directly
+    
+    Returns (path, expansions, elapsed seconds)
+    """
+    result = solve(maze, name)
+    return result.path, result.expansions, result.timings["search"]
+
+def measure_peak(name, maze):
+    """
+    Measure the memory high-water mark of one pathfinding run with tracemalloc
+    
+    Runs without search steps (only the solver's own working set) and clears the
+    maze cache first so that cached preprocessing is counted
+    
+    Returns peak memory in MB
+    """
+    maze.invalidate_cache()
+    tracemalloc.start()
+    try:
+        solve(maze, name)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 2**20
+
+def print_solver_results(name, path, expansions, elapsed):
+    """
+    Print path length, cells explored and time of one algorithm
+    """
+    print(f"  {name + ':':<19}Path length: {len(path) if path else 'No path'}, "
+          f"Cells explored: {expansions}, "
+          f"Time: {elapsed:.5f}s")
+
+def run_benchmarks(num_runs=10, maze_sizes=[15, 25, 50], complexity=0.05, seed=None, generator="prim",
+                   measure_memory=True):
+    """
+    Run benchmarks for all pathfinding algorithms on mazes from one generator
     
     Parameters:
     - num_runs: Number of runs per configuration
     - maze_sizes: List of maze sizes to test
     - complexity: Maze complexity parameter
+    - seed: Base seed; each maze gets its own seed derived from it (random if None)
+    - generator: Maze generation algorithm; "wilson" or "aldous_broder" give unbiased
+      (uniform spanning tree) mazes, the default "prim" matches earlier result files
+    - measure_memory: Also run every solver once under tracemalloc and save its peak memory
     """
     print(f"Starting benchmark with {num_runs} runs per maze size...")
     
@@ -29,81 +109,53 @@ def run_benchmarks(num_runs=10, maze_sizes=[15, 25, 50], complexity=0.05):
     results_search = []  # Store number of cells explored
     results_time = []    # Store execution times
     results_path = []    # Store path lengths
+    results_memory = []  # Store peak memory (MB)
     
     # Add headers to results
-    results_search.append(["Maze Size", "DFS Cells", "BFS Cells", "A* Cells"])
-    results_time.append(["Maze Size", "DFS Time", "BFS Time", "A* Time"])
-    results_path.append(["Maze Size", "DFS Length", "BFS Length", "A* Length"])
+    names = SOLVERS
+    results_search.append(["Maze Size"] + [f"{name} Cells" for name in names])
+    results_time.append(["Maze Size"] + [f"{name} Time" for name in names])
+    results_path.append(["Maze Size"] + [f"{name} Length" for name in names])
+    results_memory.append(["Maze Size"] + [f"{name} Peak MB" for name in names])
     
     total_configs = len(maze_sizes) * num_runs
     current_config = 0
     
+    base_seed, maze_seeds = make_maze_seeds(total_configs, seed)
+    print(f"Base seed: {base_seed}")
+    results_seeds = [["Maze Size", "Run", "Maze Seed"]]
+    
     for size in maze_sizes:
         for run in range(num_runs):
+            maze_seed = maze_seeds[current_config]
             current_config += 1
-            print(f"\nProgress: {current_config}/{total_configs} - Running size={size}, run={run+1}")
+            print(f"\nProgress: {current_config}/{total_configs} - Running size={size}, run={run+1}, seed={maze_seed}")
+            results_seeds.append([size, run + 1, maze_seed])
             
-            # Create maze with specified parameters using only prim algorithm
+            # Create maze with specified parameters using the chosen generator
             try:
-                m = Maze(size, complexity=complexity, algorithm="prim")
+                m = Maze(size, complexity=complexity, algorithm=generator, record="off", seed=maze_seed)
                 
                 # Save maze details for results
                 search_results = [size]
                 time_results = [size]
                 path_results = [size]
+                runs = []
                 
-                # Run DFS algorithm
-                print("Running DFS algorithm...")
-                dfs_search_steps = []
-                start_time = time.time()
-                dfs_path, dfs_search_steps = dfs_find_path(m, return_search_steps=True)
-                end_time = time.time()
-                dfs_time = end_time - start_time
+                for name in SOLVERS:
+                    print(f"Running {name} algorithm...")
+                    path, expansions, elapsed = run_solver(name, m)
+                    runs.append((name, path, expansions, elapsed))
+                    
+                    # Store cells explored, execution time and path length
+                    search_results.append(expansions)
+                    time_results.append(elapsed)
+                    path_results.append(len(path) if path else 0)
                 
-                # Run BFS algorithm
-                print("Running BFS algorithm...")
-                bfs_search_steps = []
-                start_time = time.time()
-                bfs_result = bfs_find_path(m, return_search_steps=True)
-            
-                if isinstance(bfs_result, tuple) and len(bfs_result) == 3:
-                    bfs_path, bfs_search_steps, _ = bfs_result
-                else:
-                    bfs_path = bfs_result
-                    bfs_search_steps = []
-                end_time = time.time()
-                bfs_time = end_time - start_time
-                
-                # Run A* algorithm
-                print("Running A* algorithm...")
-                a_star_search_steps = []
-                start_time = time.time()
-                a_star_result = a_star_find_path(m, return_search_steps=True)
-                # A* also returns 3 values when return_search_steps=True
-                if isinstance(a_star_result, tuple) and len(a_star_result) == 3:
-                    a_star_path, a_star_search_steps, _ = a_star_result
-                else:
-                    a_star_path = a_star_result
-                    a_star_search_steps = []
-                end_time = time.time()
-                a_star_time = end_time - start_time
-                
-                # Store cells explored
-                search_results.extend([
-                    len(dfs_search_steps) if dfs_search_steps else 0,
-                    len(bfs_search_steps) if bfs_search_steps else 0,
-                    len(a_star_search_steps) if a_star_search_steps else 0
-                ])
-                
-                # Store execution times
-                time_results.extend([dfs_time, bfs_time, a_star_time])
-                
-                # Store path lengths
-                path_results.extend([
-                    len(dfs_path) if dfs_path else 0,
-                    len(bfs_path) if bfs_path else 0,
-                    len(a_star_path) if a_star_path else 0
-                ])
+                # Memory high-water marks in a separate pass so tracemalloc does not skew the timings
+                if measure_memory:
+                    peaks = [measure_peak(name, m) for name in SOLVERS]
+                    results_memory.append([size] + peaks)
                 
                 # Add results to collection
                 results_search.append(search_results)
@@ -112,22 +164,19 @@ def run_benchmarks(num_runs=10, maze_sizes=[15, 25, 50], complexity=0.05):
                 
                 # Print results for this run
                 print("\nResults for this run:")
-                print(f"  DFS:     Path length: {len(dfs_path) if dfs_path else 'No path'}, "
-                      f"Cells explored: {len(dfs_search_steps) if dfs_search_steps else 0}, "
-                      f"Time: {dfs_time:.5f}s")
-                print(f"  BFS:     Path length: {len(bfs_path) if bfs_path else 'No path'}, "
-                      f"Cells explored: {len(bfs_search_steps) if bfs_search_steps else 0}, "
-                      f"Time: {bfs_time:.5f}s")
-                print(f"  A*:      Path length: {len(a_star_path) if a_star_path else 'No path'}, "
-                      f"Cells explored: {len(a_star_search_steps) if a_star_search_steps else 0}, "
-                      f"Time: {a_star_time:.5f}s")
+                for i, run_result in enumerate(runs):
+                    print_solver_results(*run_result)
+                    if measure_memory:
+                        print(f"  {'':<19}Peak memory: {peaks[i]:.3f} MB")
                 
             except Exception as e:
                 print(f"Error in configuration size={size}, run={run+1}: {e}")
                 # Still add the configuration to results but with zeros
-                results_search.append([size, 0, 0, 0])
-                results_time.append([size, 0, 0, 0])
-                results_path.append([size, 0, 0, 0])
+                results_search.append([size] + [0]*len(SOLVERS))
+                results_time.append([size] + [0]*len(SOLVERS))
+                results_path.append([size] + [0]*len(SOLVERS))
+                if measure_memory:
+                    results_memory.append([size] + [0]*len(SOLVERS))
     
     # Save results to CSV files
     # Create results directory if it doesn't exist
@@ -148,62 +197,211 @@ def run_benchmarks(num_runs=10, maze_sizes=[15, 25, 50], complexity=0.05):
         writer = csv.writer(file)
         writer.writerows(results_path)
     
+    # Save peak memory
+    if measure_memory:
+        with open('results/memory_peaks.csv', 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerows(results_memory)
+    
+    # Save maze seeds so that any run can be replayed
+    with open('results/maze_seeds.csv', 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerows(results_seeds)
+    
     print("\nBenchmark completed.")
     print("Results saved to:")
     print("  - results/cells_explored.csv")
     print("  - results/execution_times.csv")
     print("  - results/path_lengths.csv")
+    if measure_memory:
+        print("  - results/memory_peaks.csv")
+    print("  - results/maze_seeds.csv")
 
-def run_single_benchmark(maze_size=25, complexity=0.05):
+def run_complexity_sweep(num_runs=10, maze_sizes=[15, 25, 50], complexities=SWEEP_COMPLEXITIES,
+                         seed=None, generator="prim"):
     """
-    Run a single benchmark for all pathfinding algorithms on one maze
+    Compare Jump Point Search with A* while the maze opens up: complexity 0.0 is a
+    perfect maze (only corridors), higher values add loops and open areas where
+    JPS can skip long straight runs
+    
+    Cells for JPS count expanded jump points, not every cell on the straight runs.
+    The JPS run-length tables are built (and cached on the maze) before the solvers run,
+    so both Time columns measure the search itself; the build is reported as "JPS Tables Time".
+    Results are saved to results/complexity_sweep.csv
     """
-    print(f"\nRunning single benchmark test with size={maze_size}, algorithm=prim, complexity={complexity}")
+    print(f"Starting complexity sweep with {num_runs} runs per configuration...")
     
-    # Create maze using only prim algorithm
-    m = Maze(maze_size, complexity=complexity, algorithm="prim")
+    names = SWEEP_SOLVERS
+    results = [["Complexity", "Maze Size", "Run", "Maze Seed"]
+               + [f"{name} Cells" for name in names]
+               + [f"{name} Time" for name in names]
+               + [f"{name} Length" for name in names]
+               + ["JPS Tables Time"]]
     
-    # Run DFS algorithm
-    print("Running DFS algorithm...")
-    start_time = time.time()
-    dfs_path, dfs_search_steps = dfs_find_path(m, return_search_steps=True)
-    dfs_time = time.time() - start_time
+    total_configs = len(complexities) * len(maze_sizes) * num_runs
+    base_seed, maze_seeds = make_maze_seeds(total_configs, seed)
+    print(f"Base seed: {base_seed}")
     
-    # Run BFS algorithm
-    print("Running BFS algorithm...")
-    start_time = time.time()
-    bfs_result = bfs_find_path(m, return_search_steps=True)
-    # BFS returns 3 values when return_search_steps=True
-    if isinstance(bfs_result, tuple) and len(bfs_result) == 3:
-        bfs_path, bfs_search_steps, _ = bfs_result
-    else:
-        bfs_path = bfs_result
-        bfs_search_steps = []
-    bfs_time = time.time() - start_time
-    
-    # Run A* algorithm
-    print("Running A* algorithm...")
-    start_time = time.time()
-    a_star_result = a_star_find_path(m, return_search_steps=True)
-    # A* also returns 3 values when return_search_steps=True
-    if isinstance(a_star_result, tuple) and len(a_star_result) == 3:
-        a_star_path, a_star_search_steps, _ = a_star_result
-    else:
-        a_star_path = a_star_result
-        a_star_search_steps = []
-    a_star_time = time.time() - start_time
+    current_config = 0
+    for complexity in complexities:
+        for size in maze_sizes:
+            for run in range(num_runs):
+                maze_seed = maze_seeds[current_config]
+                current_config += 1
+                print(f"\nProgress: {current_config}/{total_configs} - Running complexity={complexity}, "
+                      f"size={size}, run={run+1}, seed={maze_seed}")
+                
+                m = Maze(size, complexity=complexity, algorithm=generator, record="off", seed=maze_seed)
+                start_time = time.perf_counter()
+                jump_tables(m)
+                tables_time = time.perf_counter() - start_time
+                runs = [(name, *run_solver(name, m)) for name in SWEEP_SOLVERS]
+                
+                results.append([complexity, size, run + 1, maze_seed]
+                               + [expansions for _, _, expansions, _ in runs]
+                               + [elapsed for _, _, _, elapsed in runs]
+                               + [len(path) if path else 0 for _, path, _, _ in runs]
+                               + [tables_time])
+                
+                for run_result in runs:
+                    print_solver_results(*run_result)
+                print(f"  {'JPS tables:':<19}Time: {tables_time:.5f}s")
+    
+    os.makedirs('results', exist_ok=True)
+    with open('results/complexity_sweep.csv', 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerows(results)
+    
+    print("\nComplexity sweep completed.")
+    print("Results saved to:")
+    print("  - results/complexity_sweep.csv")
+
+def run_weighted_benchmark(num_runs=10, maze_sizes=[15, 25, 50], complexity=0.05, max_cost=9,
+                           seed=None, generator="prim"):
+    """
+    Benchmark cost-aware routing: every maze gets a random terrain layer with
+    per-cell costs in [1, max_cost] and each solver's path is scored by its total cost
+    
+    Results are saved to results/weighted_costs.csv
+    """
+    print(f"Starting weighted benchmark with {num_runs} runs per maze size (max cost {max_cost})...")
+    
+    names = WEIGHTED_SOLVERS
+    results = [["Maze Size", "Run", "Maze Seed"]
+               + [f"{name} Cells" for name in names]
+               + [f"{name} Time" for name in names]
+               + [f"{name} Cost" for name in names]]
+    
+    total_configs = len(maze_sizes) * num_runs
+    base_seed, maze_seeds = make_maze_seeds(total_configs, seed)
+    print(f"Base seed: {base_seed}")
+    
+    current_config = 0
+    for size in maze_sizes:
+        for run in range(num_runs):
+            maze_seed = maze_seeds[current_config]
+            current_config += 1
+            print(f"\nProgress: {current_config}/{total_configs} - Running size={size}, run={run+1}, seed={maze_seed}")
+            
+            m = Maze(size, complexity=complexity, algorithm=generator, record="off", seed=maze_seed)
+            m.random_costs(max_cost=max_cost, dtype="uint8" if max_cost <= 255 else "uint16")
+            runs = [(name, *run_solver(name, m)) for name in WEIGHTED_SOLVERS]
+            costs = [path_cost(m, path) for _, path, _, _ in runs]
+            
+            results.append([size, run + 1, maze_seed]
+                           + [expansions for _, _, expansions, _ in runs]
+                           + [elapsed for _, _, _, elapsed in runs]
+                           + [cost if cost is not None else 0 for cost in costs])
+            
+            for (name, path, expansions, elapsed), cost in zip(runs, costs):
+                print(f"  {name + ':':<19}Path cost: {cost if cost is not None else 'No path'}, "
+                      f"Cells explored: {expansions}, "
+                      f"Time: {elapsed:.5f}s")
+    
+    os.makedirs('results', exist_ok=True)
+    with open('results/weighted_costs.csv', 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerows(results)
+    
+    print("\nWeighted benchmark completed.")
+    print("Results saved to:")
+    print("  - results/weighted_costs.csv")
+
+def run_ida_star_benchmark(num_runs=10, maze_sizes=[15, 25, 50], complexity=0.05, seed=None, generator="prim",
+                           max_size=IDA_STAR_MAX_SIZE):
+    """
+    Benchmark IDA* against A*, including the tracemalloc peak of each solver
+    
+    Sizes above max_size are skipped: IDA* is only practical on near-perfect mazes
+    or small grids (see algorithm/ida_star_final.find_path).
+    Results are saved to results/ida_star.csv
+    """
+    skipped = [size for size in maze_sizes if size > max_size]
+    maze_sizes = [size for size in maze_sizes if size <= max_size]
+    if skipped:
+        print(f"Skipping sizes {skipped}: IDA* is capped at size {max_size}")
+    print(f"Starting IDA* benchmark with {num_runs} runs per maze size...")
+    
+    names = IDA_STAR_SOLVERS
+    results = [["Maze Size", "Run", "Maze Seed"]
+               + [f"{name} Cells" for name in names]
+               + [f"{name} Time" for name in names]
+               + [f"{name} Length" for name in names]
+               + [f"{name} Peak MB" for name in names]]
+    
+    total_configs = len(maze_sizes) * num_runs
+    base_seed, maze_seeds = make_maze_seeds(total_configs, seed)
+    print(f"Base seed: {base_seed}")
+    
+    current_config = 0
+    for size in maze_sizes:
+        for run in range(num_runs):
+            maze_seed = maze_seeds[current_config]
+            current_config += 1
+            print(f"\nProgress: {current_config}/{total_configs} - Running size={size}, run={run+1}, seed={maze_seed}")
+            
+            m = Maze(size, complexity=complexity, algorithm=generator, record="off", seed=maze_seed)
+            runs = [(name, *run_solver(name, m)) for name in IDA_STAR_SOLVERS]
+            peaks = [measure_peak(name, m) for name in IDA_STAR_SOLVERS]
+            
+            results.append([size, run + 1, maze_seed]
+                           + [expansions for _, _, expansions, _ in runs]
+                           + [elapsed for _, _, _, elapsed in runs]
+                           + [len(path) if path else 0 for _, path, _, _ in runs]
+                           + peaks)
+            
+            for run_result, peak in zip(runs, peaks):
+                print_solver_results(*run_result)
+                print(f"  {'':<19}Peak memory: {peak:.3f} MB")
+    
+    os.makedirs('results', exist_ok=True)
+    with open('results/ida_star.csv', 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerows(results)
+    
+    print("\nIDA* benchmark completed.")
+    print("Results saved to:")
+    print("  - results/ida_star.csv")
+
+def run_single_benchmark(maze_size=25, complexity=0.05, seed=None, generator="prim"):
+    """
+    Run a single benchmark for all pathfinding algorithms on one maze
+    """
+    _, (maze_seed,) = make_maze_seeds(1, seed)
+    print(f"\nRunning single benchmark test with size={maze_size}, algorithm={generator}, complexity={complexity}, seed={maze_seed}")
+    
+    # Create maze using the chosen generator
+    m = Maze(maze_size, complexity=complexity, algorithm=generator, record="off", seed=maze_seed)
+    
+    runs = []
+    for name in SOLVERS:
+        print(f"Running {name} algorithm...")
+        runs.append((name, *run_solver(name, m)))
     
     # Print results
     print("\nResults:")
-    print(f"  DFS:     Path length: {len(dfs_path) if dfs_path else 'No path'}, "
-          f"Cells explored: {len(dfs_search_steps) if dfs_search_steps else 0}, "
-          f"Time: {dfs_time:.5f}s")
-    print(f"  BFS:     Path length: {len(bfs_path) if bfs_path else 'No path'}, "
-          f"Cells explored: {len(bfs_search_steps) if bfs_search_steps else 0}, "
-          f"Time: {bfs_time:.5f}s")
-    print(f"  A*:      Path length: {len(a_star_path) if a_star_path else 'No path'}, "
-          f"Cells explored: {len(a_star_search_steps) if a_star_search_steps else 0}, "
-          f"Time: {a_star_time:.5f}s")
+    for run_result in runs:
+        print_solver_results(*run_result)
     
 if __name__ == "__main__":
     import argparse
@@ -217,14 +415,43 @@ if __name__ == "__main__":
                         help='Maze complexity (default: 0.05)')
     parser.add_argument('--single', action='store_true',
                         help='Run a single benchmark test with default parameters')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Base seed for reproducible mazes (default: random)')
+    parser.add_argument('--generator', default='prim',
+                        choices=['prim', 'dfs_backtrack', 'kruskal', 'eller', 'recursive_division',
+                                 'wilson', 'aldous_broder'],
+                        help='Maze generation algorithm (default: prim)')
+    parser.add_argument('--complexity-sweep', action='store_true',
+                        help='Compare JPS with A* at complexity 0.0, 0.05 and 0.3')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='Skip the tracemalloc pass that records peak memory per algorithm')
+    parser.add_argument('--weighted', action='store_true',
+                        help='Benchmark Dijkstra and weighted A* on random terrain costs')
+    parser.add_argument('--max-cost', type=int, default=9,
+                        help='Largest per-cell terrain cost for --weighted (default: 9)')
+    parser.add_argument('--ida-star', action='store_true',
+                        help=f'Benchmark IDA* against A* with peak memory (sizes up to {IDA_STAR_MAX_SIZE})')
     
     args = parser.parse_args()
     
-    if args.single:
-        run_single_benchmark(maze_size=1000, complexity=args.complexity)
+    if args.complexity_sweep:
+        run_complexity_sweep(num_runs=args.runs, maze_sizes=args.sizes, seed=args.seed,
+                             generator=args.generator)
+    elif args.weighted:
+        run_weighted_benchmark(num_runs=args.runs, maze_sizes=args.sizes, complexity=args.complexity,
+                               max_cost=args.max_cost, seed=args.seed, generator=args.generator)
+    elif args.ida_star:
+        run_ida_star_benchmark(num_runs=args.runs, maze_sizes=args.sizes, complexity=args.complexity,
+                               seed=args.seed, generator=args.generator)
+    elif args.single:
+        run_single_benchmark(maze_size=1000, complexity=args.complexity, seed=args.seed,
+                             generator=args.generator)
     else:
         run_benchmarks(
             num_runs=args.runs,
             maze_sizes=args.sizes,
-            complexity=args.complexity
+            complexity=args.complexity,
+            seed=args.seed,
+            generator=args.generator,
+            measure_memory=not args.no_memory
         )
\ No newline at end of file
@@ -8,7 +8,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from maze import Maze
 
 def animate_dfs_maze(size=15, interval=100):
-    maze_obj = Maze(size, algorithm="dfs_backtrack")
+    maze_obj = Maze(size, algorithm="dfs_backtrack", record="compact")
     height, width = maze_obj.maze.shape
     maze = np.ones((height, width), dtype=int) * 4  # Giá trị 4 cho tường
     fig, ax = plt.subplots(figsize=(10, 10))
@@ -48,11 +48,14 @@ def animate_dfs_maze(size=15, interval=100):
     steps = maze_obj.generation_path
     visited_cells = set()
     current_cell = None
+    # Stack được dựng lại từ các sự kiện push/pop nên dùng được cho cả chế độ ghi "compact" lẫn "full"
+    stack = []
 
     def update(frame):
         nonlocal current_cell, visited_cells
         if frame == 0:
             maze[:, :] = 4  # Toàn bộ là tường
+            stack.clear()
         else:
             step = steps[frame - 1]
             if step[0] == "start_cell":
@@ -82,10 +85,11 @@ def animate_dfs_maze(size=15, interval=100):
             elif step[0] == "push_stack":
                 maze[step[1], step[2]] = 2  # Ô hiện tại
                 current_cell = (step[1], step[2])
+                stack.append(current_cell)
             elif step[0] == "pop_stack":
                 if current_cell:
                     maze[current_cell[0], current_cell[1]] = 1  # Ô hiện tại trước đó thành đã thăm
-                stack = [(2*x+1, 2*y+1) for x, y in step[3]]  # Stack còn lại
+                stack.pop()  # Stack còn lại
                 if stack:
                     current_cell = stack[-1]
                     maze[current_cell[0], current_cell[1]] = 2
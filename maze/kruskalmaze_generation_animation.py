@@ -56,6 +56,9 @@ def animate_kruskal_maze(size=15, interval=100, save_animation=False):
             if step[0] == "cell":
                 maze[step[1], step[2]] = 1  # Ô đã thăm
                 visited_cells.add((step[1], step[2]))
+            elif step[0] == "all_cells":
+                maze[1::2, 1::2] = 1  # Tất cả các ô được mở cùng lúc
+                visited_cells.update((x, y) for x in range(1, height, 2) for y in range(1, width, 2))
             elif step[0] == "current_cells":
                 # Đặt lại các ô hiện tại trước đó
                 for x, y in current_cells:
@@ -1,40 +1,336 @@
-import random
 import numpy as np
 import time
+import zlib
 from collections import defaultdict
 
+# Số hướng đi ngẫu nhiên được rút trong mỗi lô của các bước đi ngẫu nhiên (Wilson, Aldous-Broder)
+WALK_BATCH = 65536
+
+# Các kiểu lưu trữ lưới mê cung được hỗ trợ
+GRID_STORAGES = ("uint8", "bitpacked")
+
+# Các chế độ ghi lại quá trình tạo mê cung (generation_path)
+# - "off": không ghi gì cả (dùng cho benchmark / sản xuất)
+# - "compact": chỉ ghi các sự kiện, stack được ghi dưới dạng thay đổi (push/pop) thay vì bản sao
+# - "full": ghi đầy đủ, kể cả bản sao stack và danh sách ô hàng xóm ở mỗi bước (dùng cho animation)
+RECORD_MODES = ("off", "compact", "full")
+
+# Các kiểu dữ liệu của lớp chi phí địa hình (chi phí đi vào mỗi ô, tối thiểu là 1)
+COST_DTYPES = ("uint8", "uint16")
+
+
+class BitGrid:
+    """
+    Lưới nhị phân nén 1 bit/ô (mỗi hàng được nén bằng np.packbits)
+    Hỗ trợ các thao tác mà các thuật toán tạo mê cung và tìm đường sử dụng:
+    grid[x, y], grid[x, y] = v, grid.shape, grid.copy(), duyệt từng hàng
+    và np.asarray(grid) (giải nén ra uint8 khi cần xử lý vector hóa)
+
+    Chủ yếu thu nhỏ lưới lúc lưu trữ (at rest): chỉ Eller và Recursive Division ghi thẳng vào lưới nén;
+    các thuật toán tạo mê cung khác và mọi solver trong algorithm/ giải nén ra một mảng uint8 đầy đủ
+    trong lúc chạy, nên bộ nhớ đỉnh của chúng gần như bằng kiểu "uint8" (xem compare_maze_memory.py)
+    """
+    def __init__(self, height, width, fill=1):
+        self.shape = (height, width)
+        self.dtype = np.dtype(np.uint8)
+        self.ndim = 2
+        self.bits = np.full((height, (width + 7) // 8), 0xFF if fill else 0, dtype=np.uint8)
+
+    @property
+    def nbytes(self):
+        return self.bits.nbytes
+
+    def __len__(self):
+        return self.shape[0]
+
+    def _row(self, x):
+        return np.unpackbits(self.bits[x], count=self.shape[1])
+
+    def unpack(self):
+        """
+        Giải nén toàn bộ lưới ra mảng uint8 (height, width)
+        """
+        return np.unpackbits(self.bits, axis=1, count=self.shape[1])
+
+    def copy(self):
+        grid = BitGrid.__new__(BitGrid)
+        grid.shape = self.shape
+        grid.dtype = self.dtype
+        grid.ndim = 2
+        grid.bits = self.bits.copy()
+        return grid
+
+    def __array__(self, dtype=None, copy=None):
+        grid = self.unpack()
+        return grid if dtype is None else grid.astype(dtype)
+
+    def __iter__(self):
+        for x in range(self.shape[0]):
+            yield self._row(x)
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple) and len(key) == 2:
+            x, y = key
+            if isinstance(x, (int, np.integer)) and isinstance(y, (int, np.integer)):
+                if y < 0:
+                    y += self.shape[1]
+                return (self.bits.item(x, y >> 3) >> (7 - (y & 7))) & 1
+            if isinstance(x, (int, np.integer)):
+                return self._row(x)[y]
+        elif isinstance(key, (int, np.integer)):
+            return self._row(key)
+        return self.unpack()[key]
+
+    def __setitem__(self, key, value):
+        if isinstance(key, tuple) and len(key) == 2:
+            x, y = key
+            if isinstance(x, (int, np.integer)) and isinstance(y, (int, np.integer)):
+                if y < 0:
+                    y += self.shape[1]
+                mask = 0x80 >> (y & 7)
+                byte = self.bits.item(x, y >> 3)
+                self.bits[x, y >> 3] = (byte | mask) if value else (byte & ~mask & 0xFF)
+                return
+            if isinstance(y, (int, np.integer)) and np.ndim(value) == 0:
+                # Ghi một cột (hoặc một phần cột) trực tiếp trên cột byte chứa bit đó
+                if y < 0:
+                    y += self.shape[1]
+                mask = 0x80 >> (y & 7)
+                if value:
+                    self.bits[x, y >> 3] |= mask
+                else:
+                    self.bits[x, y >> 3] &= ~mask & 0xFF
+                return
+            if isinstance(x, (int, np.integer)):
+                row = self._row(x)
+                row[y] = value
+                self.bits[x] = np.packbits(row)
+                return
+            if (isinstance(x, np.ndarray) and isinstance(y, np.ndarray)
+                    and x.dtype.kind in "iu" and y.dtype.kind in "iu" and np.ndim(value) == 0):
+                # Ghi hàng loạt theo chỉ số mà không cần giải nén toàn bộ lưới
+                y = np.where(y < 0, y + self.shape[1], y)
+                masks = (0x80 >> (y & 7)).astype(np.uint8)
+                if value:
+                    np.bitwise_or.at(self.bits, (x, y >> 3), masks)
+                else:
+                    np.bitwise_and.at(self.bits, (x, y >> 3), ~masks)
+                return
+        elif isinstance(key, (int, np.integer)):
+            self.bits[key] = np.packbits(np.broadcast_to(np.asarray(value, dtype=np.uint8), (self.shape[1],)))
+            return
+        grid = self.unpack()
+        grid[key] = value
+        self.bits = np.packbits(grid, axis=1)
+
+
+class RandomStream:
+    """
+    Luồng số ngẫu nhiên rút theo lô từ numpy.random.Generator
+    Mỗi lần hết bộ đệm sẽ rút một lô batch số thực trong [0, 1) bằng một lời gọi vector hóa,
+    tránh gọi Generator cho từng bước nhỏ trong vòng lặp Python
+    """
+    def __init__(self, rng, batch=4096):
+        self.rng = rng
+        self.batch = batch
+        self.buffer = []
+        self.pos = 0
+
+    def refill(self):
+        """
+        Rút một lô số ngẫu nhiên mới vào bộ đệm và trả về bộ đệm đó
+        """
+        self.buffer = self.rng.random(self.batch).tolist()
+        self.pos = 0
+        return self.buffer
+
+    def below(self, k):
+        """
+        Trả về số nguyên ngẫu nhiên trong [0, k)
+        """
+        if self.pos == len(self.buffer):
+            self.refill()
+        value = self.buffer[self.pos]
+        self.pos += 1
+        return int(value * k)
+
+
+def eller_rows(size, rng, height=None):
+    """
+    Thuật toán Eller: sinh mê cung từng hàng một, chỉ giữ trạng thái O(size) của hàng hiện tại
+    (nhãn tập hợp của từng ô), nên chiều cao mê cung có thể lớn tùy ý
+
+    Args:
+        size: Số ô theo chiều ngang (lưới rộng 2*size + 1)
+        rng: numpy.random.Generator dùng để tung đồng xu nối ô
+        height: Số ô theo chiều dọc (mặc định bằng size)
+
+    Yields:
+        Từng hàng của lưới mê cung (mảng uint8 dài 2*size + 1, 1 là tường, 0 là đường đi),
+        tổng cộng 2*height + 1 hàng
+    """
+    n = size
+    height = size if height is None else height
+    width = 2*n + 1
+
+    wall_row = np.ones(width, dtype=np.uint8)
+    yield wall_row.copy()
+
+    labels = np.arange(n)
+    for r in range(height):
+        last_row = r == height - 1
+
+        # Đánh lại nhãn các tập về 0..k-1 để union-find của hàng chỉ cần k phần tử
+        _, labels = np.unique(labels, return_inverse=True)
+        labels = labels.tolist()
+        parent = list(range(max(labels) + 1))
+
+        # Nối ngang các ô kề nhau thuộc hai tập khác nhau (hàng cuối nối tất cả)
+        cell_row = wall_row.copy()
+        cell_row[1::2] = 0
+        join = [True]*(n - 1) if last_row else (rng.random(n - 1) < 0.5).tolist()
+        for j in range(n - 1):
+            if not join[j]:
+                continue
+            a = labels[j]
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            b = labels[j + 1]
+            while parent[b] != b:
+                parent[b] = parent[parent[b]]
+                b = parent[b]
+            if a != b:
+                parent[b] = a
+                cell_row[2*j + 2] = 0
+        yield cell_row
+
+        if last_row:
+            break
+
+        # Gom nhãn về gốc của tập sau khi nối ngang
+        for a in range(len(parent)):
+            root = a
+            while parent[root] != root:
+                root = parent[root]
+            parent[a] = root
+        labels = np.asarray(parent)[labels]
+
+        # Nối dọc: mỗi ô có 50% đi xuống, mỗi tập bắt buộc có ít nhất một ô đi xuống
+        # (chọn ô có khóa ngẫu nhiên lớn nhất trong tập)
+        keys = rng.random(n)
+        down = keys < 0.5
+        has_down = np.zeros(len(parent), dtype=bool)
+        has_down[labels[down]] = True
+        best = np.full(len(parent), -1.0)
+        np.maximum.at(best, labels, keys)
+        down |= (keys == best[labels]) & ~has_down[labels]
+
+        drop_row = wall_row.copy()
+        drop_row[1::2][down] = 0
+        yield drop_row
+
+        # Ô không đi xuống sẽ thuộc một tập mới ở hàng sau
+        fresh = len(parent) + np.arange(n)
+        labels = np.where(down, labels, fresh)
+
+    yield wall_row.copy()
+
+
+def write_eller_maze(file, size, height=None, seed=None, rng=None):
+    """
+    Sinh mê cung Eller và ghi thẳng từng hàng ra file/stream văn bản (' ' là đường đi, '#' là tường,
+    giống print_maze) mà không giữ toàn bộ lưới trong bộ nhớ
+
+    Args:
+        file: Đối tượng file (hoặc stream) văn bản có phương thức write
+        size: Số ô theo chiều ngang
+        height: Số ô theo chiều dọc (mặc định bằng size)
+        seed: Hạt giống ngẫu nhiên
+        rng: numpy.random.Generator riêng (ưu tiên hơn seed nếu được truyền vào)
+
+    Returns:
+        Số hàng đã ghi
+    """
+    rng = rng if rng is not None else np.random.default_rng(seed)
+    symbols = np.array([ord(' '), ord('#')], dtype=np.uint8)
+    num_rows = 0
+    for row in eller_rows(size, rng, height):
+        file.write(symbols[row].tobytes().decode("ascii") + "\n")
+        num_rows += 1
+    return num_rows
+
+
 class Maze:
-    def __init__(self, size, complexity=0.05, algorithm="dfs_backtrack"):
+    def __init__(self, size, complexity=0.05, algorithm="dfs_backtrack", storage="uint8", record="full",
+                 seed=None, rng=None):
         """
         Khởi tạo mê cung với kích thước cho trước
         size: int - kích thước của mê cung (size x size)
         complexity: float - độ phức tạp của mê cung, số càng to càng nhiều ngã rẽ (nên để < 50)
         algorithm: str - thuật toán tạo mê cung
+        storage: str - kiểu lưu trữ lưới: "uint8" (1 byte/ô, mặc định) hoặc "bitpacked" (1 bit/ô,
+                 giảm bộ nhớ lúc lưu trữ; bộ nhớ đỉnh khi tìm đường và khi tạo bằng thuật toán
+                 khác Eller / Recursive Division thì không giảm)
+        record: str - chế độ ghi generation_path: "off", "compact" hoặc "full" (mặc định)
+        seed: int - hạt giống ngẫu nhiên, cùng seed cho ra cùng một mê cung (giống hệt từng bit)
+        rng: numpy.random.Generator - bộ sinh số ngẫu nhiên riêng (ưu tiên hơn seed nếu được truyền vào)
         """
+        if storage not in GRID_STORAGES:
+            raise ValueError(f"Kiểu lưu trữ không hợp lệ: {storage} (hỗ trợ: {', '.join(GRID_STORAGES)})")
+        if record not in RECORD_MODES:
+            raise ValueError(f"Chế độ ghi không hợp lệ: {record} (hỗ trợ: {', '.join(RECORD_MODES)})")
         self.size = size
         self.complexity = complexity
         self.algorithm = algorithm.lower()
-        self.maze = np.ones((1, 1), dtype=int)
+        self.storage = storage
+        self.record = record
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+        self.random = RandomStream(self.rng)
+        self.maze = self._new_grid(1, 1)
         self.start = (1, 1)
         self.end = (2*size - 1, 2*size - 1)
         self.generation_path = []
+        self.grid_version = 0
+        self._cache = {}
+        self._cache_grid = None
+        self._cache_checksum = None
+        self.costs = None
         self.generate_maze()
 
+    def _new_grid(self, height, width):
+        """
+        Cấp phát lưới toàn tường (1) theo kiểu lưu trữ đã chọn
+        """
+        if self.storage == "bitpacked":
+            return BitGrid(height, width, fill=1)
+        return np.ones((height, width), dtype=np.uint8)
+
     def generate_maze(self):
         """
         Tạo mê cung ngẫu nhiên dựa trên thuật toán đã chọn
         """
         width = 2*self.size + 1
         height = 2*self.size + 1
-        self.maze = np.ones((height, width), dtype=int)
+        self.maze = self._new_grid(height, width)
         self.generation_path = []
         
         if self.algorithm == "dfs_backtrack":
             self._dfs_backtrack_maze()
+        elif self.algorithm == "dfs_backtrack_classic":
+            self._dfs_backtrack_maze_classic()
         elif self.algorithm == "prim":
             self._prim_maze()
         elif self.algorithm == "kruskal":
             self._kruskal_maze()
+        elif self.algorithm == "eller":
+            self._eller_maze()
+        elif self.algorithm == "recursive_division":
+            self._recursive_division_maze()
+        elif self.algorithm == "wilson":
+            self._wilson_maze()
+        elif self.algorithm == "aldous_broder":
+            self._aldous_broder_maze()
         else:
             self._dfs_backtrack_maze()
             
@@ -44,21 +340,219 @@ class Maze:
         self.maze[self.end[0], self.end[1]] = 0
         if self.complexity > 0:
             self.add_random_paths()
+        self.invalidate_cache()
+
+    def set_costs(self, costs):
+        """
+        Gắn lớp chi phí địa hình: costs[x, y] là chi phí đi vào ô (x, y), chi phí của tường bị bỏ qua
+        costs: mảng (height, width) kiểu uint8 hoặc uint16 với mọi giá trị >= 1, hoặc None để bỏ lớp chi phí
+        (mọi ô có chi phí 1, giống mê cung không trọng số)
+        """
+        if costs is not None:
+            costs = np.asarray(costs)
+            if costs.dtype.name not in COST_DTYPES:
+                raise ValueError(f"Kiểu chi phí không hợp lệ: {costs.dtype} (hỗ trợ: {', '.join(COST_DTYPES)})")
+            if costs.shape != np.asarray(self.maze).shape:
+                raise ValueError(f"Kích thước lớp chi phí {costs.shape} khác kích thước mê cung {np.asarray(self.maze).shape}")
+            if costs.size and costs.min() < 1:
+                raise ValueError("Chi phí của mỗi ô phải lớn hơn hoặc bằng 1")
+        self.costs = costs
+        self.invalidate_cache()
+
+    def random_costs(self, max_cost=9, dtype="uint8"):
+        """
+        Tạo lớp chi phí địa hình ngẫu nhiên (đều trong [1, max_cost]) từ bộ sinh số của mê cung
+        max_cost: int - chi phí lớn nhất
+        dtype: str - "uint8" hoặc "uint16"
+        """
+        if dtype not in COST_DTYPES:
+            raise ValueError(f"Kiểu chi phí không hợp lệ: {dtype} (hỗ trợ: {', '.join(COST_DTYPES)})")
+        if not 1 <= max_cost <= np.iinfo(dtype).max:
+            raise ValueError(f"Chi phí lớn nhất phải nằm trong [1, {np.iinfo(dtype).max}] với kiểu {dtype}")
+        costs = self.rng.integers(1, max_cost, size=np.asarray(self.maze).shape, dtype=dtype, endpoint=True)
+        self.set_costs(costs)
+        return costs
+
+    def invalidate_cache(self):
+        """
+        Báo lưới đã thay đổi: tăng grid_version và xóa mọi dữ liệu tiền xử lý đã lưu
+        Mã bên ngoài sửa tại chỗ self.maze (m.maze[x, y] = 1) hoặc self.costs phải gọi hàm này;
+        cached() chỉ tự phát hiện việc gán self.maze sang mảng khác (set_costs đã tự gọi hàm này)
+        """
+        self.grid_version += 1
+        self._cache.clear()
+        self._cache_grid = self.maze
+        self._cache_checksum = None
+
+    def _grid_checksum(self):
+        """
+        CRC32 của dữ liệu lưới (mảng bit nén với BitGrid), dùng để phát hiện các thay đổi tại chỗ
+        """
+        data = self.maze.bits if isinstance(self.maze, BitGrid) else self.maze
+        return zlib.crc32(np.ascontiguousarray(data))
+
+    def check_grid(self, deep=False):
+        """
+        Xóa cache nếu lưới đã thay đổi: self.maze bị gán sang mảng khác
+        deep: bool - nếu True, so thêm CRC32 của lưới với CRC32 lúc dữ liệu trong cache được tạo để
+              phát hiện cả việc sửa tại chỗ mà quên gọi invalidate_cache (O(h*w), vài ms với lưới 2001x2001)
+        Lớp chi phí self.costs không được kiểm tra
+        Trả về grid_version hiện tại
+        """
+        if self._cache_grid is not self.maze:
+            self.invalidate_cache()
+        elif deep and self._cache_checksum is not None and self._grid_checksum() != self._cache_checksum:
+            self.invalidate_cache()
+        return self.grid_version
+
+    def cached(self, key, builder):
+        """
+        Lấy dữ liệu tiền xử lý (đồ thị hành lang, bảng khoảng cách, ...) gắn với lưới hiện tại
+        Chỉ so danh tính self.maze (O(1)); sau khi sửa lưới tại chỗ cần gọi invalidate_cache
+        key: khóa bất kỳ hashable
+        builder: hàm builder(maze_obj) tạo dữ liệu khi chưa có trong cache
+        """
+        self.check_grid()
+        if key not in self._cache:
+            # Ghi CRC32 của lưới khi tạo dữ liệu (builder vốn đã O(h*w)) để check_grid(deep=True) so sánh
+            if self._cache_checksum is None:
+                self._cache_checksum = self._grid_checksum()
+            self._cache[key] = builder(self)
+        return self._cache[key]
 
     def _dfs_backtrack_maze(self):
-            print("\nĐang tạo mê cung bằng thuật toán DFS Backtrack...")
+        """
+        DFS Backtrack trên các mảng phẳng được cấp phát trước:
+        - các ô được đánh chỉ số tuyến tính trên lưới ô có viền (size+2) x (size+2),
+          viền được đánh dấu đã thăm nên không cần kiểm tra biên
+        - visited là mảng đánh dấu bytearray, stack là mảng int32 cố định
+        - các hướng đi là độ lệch chỉ số tuyến tính tính trước
+        - các ô/tường cần mở được gom lại rồi ghi vào lưới bằng một phép gán chỉ số
+        """
+        print("\nĐang tạo mê cung bằng thuật toán DFS Backtrack...")
+        n = self.size
+        padded = n + 2
+        grid_width = 2*n + 1
+        tracing = self.record != "off"
+        full_trace = self.record == "full"
+
+        visited = bytearray(padded * padded)
+        visited[:padded] = b"\x01" * padded
+        visited[-padded:] = b"\x01" * padded
+        visited[::padded] = b"\x01" * padded
+        visited[padded - 1::padded] = b"\x01" * padded
+
+        # Thứ tự hướng giống bản cũ: (x+1, y), (x-1, y), (x, y+1), (x, y-1)
+        cell_offsets = (padded, -padded, 1, -1)
+        grid_offsets = (grid_width, -grid_width, 1, -1)
+
+        # Bảng tra: với mỗi mặt nạ 4 bit các hàng xóm chưa thăm -> các hướng có thể đi
+        choices_by_mask = [tuple(d for d in range(4) if mask >> d & 1) for mask in range(16)]
+
+        stack_arr = np.empty(n*n, dtype=np.int32)
+        stack = memoryview(stack_arr)
+        grid_stack_arr = np.empty(n*n, dtype=np.int32)
+        grid_stack = memoryview(grid_stack_arr)
+        opened_arr = np.empty(2*n*n, dtype=np.int32)
+        opened = memoryview(opened_arr)
+        stream = self.random
+
+        start_x = stream.below(n)
+        start_y = stream.below(n)
+        cell = (start_x + 1)*padded + start_y + 1
+        visited[cell] = 1
+        stack[0] = cell
+        grid_stack[0] = (2*start_x + 1)*grid_width + 2*start_y + 1
+        top = 0
+        opened[0] = grid_stack[0]
+        num_opened = 1
+        remaining = n*n - 1
+
+        if tracing:
+            self.generation_path.append(("start_cell", 2*start_x + 1, 2*start_y + 1))
+            self._trace_stack("push_stack", 2*start_x + 1, 2*start_y + 1,
+                              self._stack_cells(stack_arr, top, padded) if full_trace else None, full_trace)
+
+        # Đọc trực tiếp bộ đệm số ngẫu nhiên của RandomStream để tránh gọi hàm ở mỗi bước
+        buffer, pos = stream.buffer, stream.pos
+        while top >= 0 and remaining:
+            cell = stack[top]
+            mask = 15 ^ (visited[cell + padded] | visited[cell - padded] << 1
+                         | visited[cell + 1] << 2 | visited[cell - 1] << 3)
+
+            if mask:
+                choices = choices_by_mask[mask]
+                if tracing:
+                    neighbor_cells = []
+                    for d in choices:
+                        x, y = divmod(cell + cell_offsets[d], padded)
+                        neighbor_cells.append((2*x - 1, 2*y - 1))
+                    self.generation_path.append(("neighbors", neighbor_cells))
+
+                # Chọn ngẫu nhiên một trong các ô hàng xóm chưa thăm
+                if pos == len(buffer):
+                    buffer, pos = stream.refill(), 0
+                direction = choices[int(buffer[pos] * len(choices))]
+                pos += 1
+
+                wall_grid = grid_stack[top] + grid_offsets[direction]
+                next_grid = wall_grid + grid_offsets[direction]
+                opened[num_opened] = wall_grid
+                opened[num_opened + 1] = next_grid
+                num_opened += 2
+
+                next_cell = cell + cell_offsets[direction]
+                visited[next_cell] = 1
+                remaining -= 1
+                top += 1
+                stack[top] = next_cell
+                grid_stack[top] = next_grid
+
+                if tracing:
+                    self.generation_path.append(("break_wall", *divmod(wall_grid, grid_width)))
+                    self.generation_path.append(("new_cell", *divmod(next_grid, grid_width)))
+                    self._trace_stack("push_stack", *divmod(next_grid, grid_width),
+                                      self._stack_cells(stack_arr, top, padded) if full_trace else None, full_trace)
+            else:
+                top -= 1
+                if tracing:
+                    x, y = divmod(cell, padded)
+                    self._trace_stack("pop_stack", x - 1, y - 1,
+                                      self._stack_cells(stack_arr, top, padded) if full_trace else None, full_trace)
+        stream.buffer, stream.pos = buffer, pos
+
+        rows, cols = np.divmod(opened_arr[:num_opened], grid_width)
+        self.maze[rows, cols] = 0
+
+    @staticmethod
+    def _stack_cells(stack_arr, top, padded):
+        """
+        Chuyển stack chỉ số tuyến tính (có viền) về danh sách ô (x, y) như bản DFS cũ
+        """
+        rows, cols = np.divmod(stack_arr[:top + 1], padded)
+        return list(zip((rows - 1).tolist(), (cols - 1).tolist()))
+
+    def _dfs_backtrack_maze_classic(self):
+            """
+            DFS Backtrack bản cũ (duyệt từng ô bằng tuple và mảng visited 2 chiều),
+            giữ lại để so sánh hiệu năng trong compare_maze_generation.py
+            """
+            print("\nĐang tạo mê cung bằng thuật toán DFS Backtrack (bản cũ)...")
             visited = np.zeros((self.size, self.size), dtype=bool)
-            start_x = random.randint(0, self.size-1)
-            start_y = random.randint(0, self.size-1)
+            start_x = self.random.below(self.size)
+            start_y = self.random.below(self.size)
             visited[start_x, start_y] = True
+            tracing = self.record != "off"
+            full_trace = self.record == "full"
 
             cell_x = 2*start_x + 1
             cell_y = 2*start_y + 1
             self.maze[cell_x, cell_y] = 0
-            self.generation_path.append(("start_cell", cell_x, cell_y))
 
             stack = [(start_x, start_y)]
-            self.generation_path.append(("push_stack", cell_x, cell_y, stack.copy()))
+            if tracing:
+                self.generation_path.append(("start_cell", cell_x, cell_y))
+                self._trace_stack("push_stack", cell_x, cell_y, stack, full_trace)
             visit_counter = 1
 
             while stack and visit_counter < self.size * self.size:
@@ -70,10 +564,11 @@ class Maze:
 
                 if neighbors:
                     # Ghi lại các ô hàng xóm
-                    neighbor_cells = [(2*nx + 1, 2*ny + 1) for nx, ny in neighbors]
-                    self.generation_path.append(("neighbors", neighbor_cells))
+                    if tracing:
+                        neighbor_cells = [(2*nx + 1, 2*ny + 1) for nx, ny in neighbors]
+                        self.generation_path.append(("neighbors", neighbor_cells))
 
-                    next_x, next_y = random.choice(neighbors)
+                    next_x, next_y = neighbors[self.random.below(len(neighbors))]
                     visited[next_x, next_y] = True
                     visit_counter += 1
 
@@ -81,156 +576,452 @@ class Maze:
                     wall_x = 2*x + 1 + (next_x - x)
                     wall_y = 2*y + 1 + (next_y - y)
                     self.maze[wall_x, wall_y] = 0
-                    self.generation_path.append(("break_wall", wall_x, wall_y))
 
                     # Đánh dấu ô mới
                     cell_x = 2*next_x + 1
                     cell_y = 2*next_y + 1
                     self.maze[cell_x, cell_y] = 0
-                    self.generation_path.append(("new_cell", cell_x, cell_y))
 
                     stack.append((next_x, next_y))
-                    self.generation_path.append(("push_stack", cell_x, cell_y, stack.copy()))
+                    if tracing:
+                        self.generation_path.append(("break_wall", wall_x, wall_y))
+                        self.generation_path.append(("new_cell", cell_x, cell_y))
+                        self._trace_stack("push_stack", cell_x, cell_y, stack, full_trace)
                 else:
                     stack.pop()
-                    self.generation_path.append(("pop_stack", x, y, stack.copy()))
+                    if tracing:
+                        self._trace_stack("pop_stack", x, y, stack, full_trace)
+
+    def _trace_stack(self, event, x, y, stack, full_trace):
+        """
+        Ghi lại thao tác push/pop stack của DFS Backtrack
+        Chế độ "full" lưu thêm bản sao stack, chế độ "compact" chỉ lưu thay đổi (push/pop một ô)
+        """
+        if full_trace:
+            self.generation_path.append((event, x, y, list(stack)))
+        else:
+            self.generation_path.append((event, x, y))
 
     def _prim_maze(self):
+        """
+        Prim ngẫu nhiên trên các mảng phẳng:
+        - danh sách tường là các mảng int32 song song (tường, ô đích), lấy ngẫu nhiên
+          một tường rồi đổi chỗ với phần tử cuối nên mỗi lần lấy là O(1)
+        - các ô đã thuộc mê cung được đánh dấu bằng bytearray trên lưới ô có viền
+        - chỉ duyệt danh sách tường để ghi các ô hàng xóm khi ở chế độ ghi "full"
+        """
         print("\nĐang tạo mê cung bằng thuật toán Prim...")
-        width = 2*self.size + 1
-        height = 2*self.size + 1
-        self.maze = np.ones((height, width), dtype=int)
-
-        start_x = random.randrange(1, height, 2)
-        start_y = random.randrange(1, width, 2)
-        self.maze[start_x, start_y] = 0
-        self.generation_path.append(("start_cell", start_x, start_y))
-
-        walls = []
-        for dx, dy in [(-2, 0), (2, 0), (0, -2), (0, 2)]:
-            nx, ny = start_x + dx, start_y + dy
-            if 1 <= nx < height-1 and 1 <= ny < width-1:
-                walls.append((start_x + dx//2, start_y + dy//2, nx, ny))
-                self.generation_path.append(("wall_candidate", start_x + dx//2, start_y + dy//2, nx, ny))
-
-        visited_cells = {(start_x, start_y)}
-        while walls:
-            # Ghi lại các ô hàng xóm
-            neighbor_cells = [wall[2:] for wall in walls if wall[2:] not in visited_cells]
-            self.generation_path.append(("neighbors", neighbor_cells))
-
-            # Chọn bức tường ngẫu nhiên
-            wx, wy, nx, ny = walls.pop(random.randrange(len(walls)))
-            if self.maze[nx, ny] == 1:
-                self.maze[wx, wy] = 0
-                self.maze[nx, ny] = 0
-                self.generation_path.append(("break_wall", wx, wy))
-                self.generation_path.append(("new_cell", nx, ny))
-                visited_cells.add((nx, ny))
-
-                # Thêm các bức tường mới xung quanh ô mới
-                for dx, dy in [(-2, 0), (2, 0), (0, -2), (0, 2)]:
-                    nnx, nny = nx + dx, ny + dy
-                    if 1 <= nnx < height-1 and 1 <= nny < width-1 and self.maze[nnx, nny] == 1:
-                        walls.append((nx + dx//2, ny + dy//2, nnx, nny))
-                        self.generation_path.append(("wall_candidate", nx + dx//2, ny + dy//2, nnx, nny))
-    
+        n = self.size
+        padded = n + 2
+        width = 2*n + 1
+        height = 2*n + 1
+        self.maze = self._new_grid(height, width)
+        tracing = self.record != "off"
+        full_trace = self.record == "full"
+
+        in_maze = bytearray(padded * padded)
+        in_maze[:padded] = b"\x01" * padded
+        in_maze[-padded:] = b"\x01" * padded
+        in_maze[::padded] = b"\x01" * padded
+        in_maze[padded - 1::padded] = b"\x01" * padded
+
+        # Thứ tự hướng giống bản cũ: lên, xuống, trái, phải (độ lệch trên lưới ô, độ lệch trên lưới mê cung)
+        offsets = ((-padded, -width), (padded, width), (-1, -1), (1, 1))
+
+        # Mỗi tường chỉ được thêm một lần (khi ô thứ hai của nó chưa thuộc mê cung)
+        capacity = 2*n*(n - 1) + 1
+        wall_grid_arr = np.empty(capacity, dtype=np.int32)
+        target_cell_arr = np.empty(capacity, dtype=np.int32)
+        target_grid_arr = np.empty(capacity, dtype=np.int32)
+        wall_grid = memoryview(wall_grid_arr)
+        target_cell = memoryview(target_cell_arr)
+        target_grid = memoryview(target_grid_arr)
+        opened_arr = np.empty(2*n*n, dtype=np.int32)
+        opened = memoryview(opened_arr)
+        stream = self.random
+
+        start_x = 2*stream.below(n) + 1
+        start_y = 2*stream.below(n) + 1
+        opened[0] = start_x*width + start_y
+        num_opened = 1
+        if tracing:
+            self.generation_path.append(("start_cell", start_x, start_y))
+
+        cell = (start_x // 2 + 1)*padded + start_y // 2 + 1
+        cell_grid = start_x*width + start_y
+        in_maze[cell] = 1
+        num_walls = 0
+
+        buffer, pos = stream.buffer, stream.pos
+        while True:
+            # Thêm các bức tường xung quanh ô vừa được nối vào mê cung
+            for cell_offset, grid_offset in offsets:
+                if not in_maze[cell + cell_offset]:
+                    wall_grid[num_walls] = cell_grid + grid_offset
+                    target_cell[num_walls] = cell + cell_offset
+                    target_grid[num_walls] = cell_grid + 2*grid_offset
+                    num_walls += 1
+                    if tracing:
+                        wx, wy = divmod(cell_grid + grid_offset, width)
+                        nx, ny = divmod(cell_grid + 2*grid_offset, width)
+                        self.generation_path.append(("wall_candidate", wx, wy, nx, ny))
+
+            while num_walls:
+                # Ghi lại các ô hàng xóm
+                if full_trace:
+                    neighbor_cells = []
+                    for i in range(num_walls):
+                        if not in_maze[target_cell[i]]:
+                            neighbor_cells.append(divmod(target_grid[i], width))
+                    self.generation_path.append(("neighbors", neighbor_cells))
+
+                # Chọn bức tường ngẫu nhiên, đổi chỗ với tường cuối cùng rồi bỏ đi
+                if pos == len(buffer):
+                    buffer, pos = stream.refill(), 0
+                i = int(buffer[pos] * num_walls)
+                pos += 1
+                wall = wall_grid[i]
+                cell = target_cell[i]
+                cell_grid = target_grid[i]
+                num_walls -= 1
+                wall_grid[i] = wall_grid[num_walls]
+                target_cell[i] = target_cell[num_walls]
+                target_grid[i] = target_grid[num_walls]
+
+                if not in_maze[cell]:
+                    break
+            else:
+                break
+
+            in_maze[cell] = 1
+            opened[num_opened] = wall
+            opened[num_opened + 1] = cell_grid
+            num_opened += 2
+            if tracing:
+                self.generation_path.append(("break_wall", *divmod(wall, width)))
+                self.generation_path.append(("new_cell", *divmod(cell_grid, width)))
+        stream.buffer, stream.pos = buffer, pos
+
+        rows, cols = np.divmod(opened_arr[:num_opened], width)
+        self.maze[rows, cols] = 0
+
     def _kruskal_maze(self):
         print("\nĐang tạo mê cung bằng thuật toán Kruskal...")
         width = 2*self.size + 1
         height = 2*self.size + 1
-        self.maze = np.ones((height, width), dtype=int)
-        
-        # Đánh dấu các ô cell (vị trí lẻ, lẻ)
-        for i in range(1, height, 2):
-            for j in range(1, width, 2):
-                self.maze[i, j] = 0
-                self.generation_path.append(("cell", i, j))
-        
-        # Chuẩn bị các tập hợp cho Union-Find
-        parent = {}
-        rank = {}
-        
-        def make_set(x):
-            parent[x] = x
-            rank[x] = 0
-            
-        def find(x):
-            if parent[x] != x:
-                parent[x] = find(parent[x])
-            return parent[x]
-        
-        def union(x, y):
-            root_x = find(x)
-            root_y = find(y)
-            if root_x != root_y:
-                if rank[root_x] < rank[root_y]:
-                    parent[root_x] = root_y
-                else:
-                    parent[root_y] = root_x
-                    if rank[root_x] == rank[root_y]:
-                        rank[root_x] += 1
-                return True
-            return False
-        
-        # Tạo tập hợp cho mỗi ô
-        for i in range(self.size):
-            for j in range(self.size):
-                cell = (i, j)
-                make_set(cell)
-        
-        # Tạo danh sách các bức tường giữa các ô
-        walls = []
-        for i in range(self.size):
-            for j in range(self.size):
-                cell = (i, j)
-                cell_x, cell_y = 2*i + 1, 2*j + 1
-                
-                # Xem xét bức tường phía đông
-                if j < self.size - 1:
-                    east_cell = (i, j + 1)
-                    walls.append((cell, east_cell, cell_x, cell_y + 1))
-                
-                # Xem xét bức tường phía nam
-                if i < self.size - 1:
-                    south_cell = (i + 1, j)
-                    walls.append((cell, south_cell, cell_x + 1, cell_y))
-        
-        # Xáo trộn danh sách tường
-        random.shuffle(walls)
-        
-        # Áp dụng thuật toán Kruskal
-        for cell1, cell2, wall_x, wall_y in walls:
-            # Ghi lại các ô hiện tại (các ô vừa được hợp nhất)
-            current_cells = [(2*i + 1, 2*j + 1) for i, j in [cell1, cell2] if find(cell1) != find(cell2)]
-            if current_cells:
-                self.generation_path.append(("current_cells", current_cells))
-            if union(cell1, cell2):
-                self.maze[wall_x, wall_y] = 0
-                self.generation_path.append(("break_wall", wall_x, wall_y))
+        n = self.size
+        self.maze = self._new_grid(height, width)
+
+        # Đánh dấu tất cả các ô cell (vị trí lẻ, lẻ) bằng một phép gán slice
+        self.maze[1:height:2, 1:width:2] = 0
+        tracing = self.record != "off"
+        if tracing:
+            self.generation_path.append(("all_cells",))
+
+        # Liệt kê các bức tường giữa các ô theo đúng thứ tự (i, j): tường phía đông rồi phía nam
+        # cell_a, cell_b là chỉ số tuyến tính i*n + j của hai ô; wall_x, wall_y là tọa độ tường trên lưới
+        cell = np.arange(n*n, dtype=np.int32).reshape(n, n)
+        cell_a = np.stack([cell, cell], axis=-1)
+        cell_b = np.stack([cell + 1, cell + n], axis=-1)
+        rows, cols = np.divmod(cell, n)
+        wall_x = np.stack([2*rows + 1, 2*rows + 2], axis=-1)
+        wall_y = np.stack([2*cols + 2, 2*cols + 1], axis=-1)
+        valid = np.stack([cols < n - 1, rows < n - 1], axis=-1)
+        cell_a = cell_a[valid]
+        cell_b = cell_b[valid]
+        wall_x = wall_x[valid]
+        wall_y = wall_y[valid]
+
+        # Xáo trộn danh sách tường bằng một hoán vị vector hóa
+        order = self.rng.permutation(len(cell_a))
+        cell_a = cell_a[order]
+        cell_b = cell_b[order]
+        wall_x = wall_x[order]
+        wall_y = wall_y[order]
+
+        # Union-Find trên mảng int32 phẳng, find lặp với path halving
+        parent_arr = np.arange(n*n, dtype=np.int32)
+        rank_arr = np.zeros(n*n, dtype=np.int32)
+        parent = memoryview(parent_arr)
+        rank = memoryview(rank_arr)
+        opened = np.zeros(len(cell_a), dtype=bool)
+        opened_view = memoryview(opened)
+        trace = self.generation_path.append
+
+        for k, (a, b) in enumerate(zip(cell_a.tolist(), cell_b.tolist())):
+            root_a = a
+            while parent[root_a] != root_a:
+                parent[root_a] = parent[parent[root_a]]
+                root_a = parent[root_a]
+            root_b = b
+            while parent[root_b] != root_b:
+                parent[root_b] = parent[parent[root_b]]
+                root_b = parent[root_b]
+            if root_a == root_b:
+                continue
+
+            if rank[root_a] < rank[root_b]:
+                parent[root_a] = root_b
+            else:
+                parent[root_b] = root_a
+                if rank[root_a] == rank[root_b]:
+                    rank[root_a] += 1
+            opened_view[k] = True
+
+            # Ghi lại các ô hiện tại (các ô vừa được hợp nhất) và bức tường bị phá
+            if tracing:
+                a_x, a_y = divmod(a, n)
+                b_x, b_y = divmod(b, n)
+                trace(("current_cells", [(2*a_x + 1, 2*a_y + 1), (2*b_x + 1, 2*b_y + 1)]))
+                trace(("break_wall", a_x + b_x + 1, a_y + b_y + 1))
+
+        # Phá tất cả các bức tường đã chọn bằng một phép gán chỉ số
+        self.maze[wall_x[opened], wall_y[opened]] = 0
+
+    def _eller_maze(self):
+        """
+        Thuật toán Eller: ghi lần lượt từng hàng do eller_rows sinh ra vào lưới
+        """
+        print("\nĐang tạo mê cung bằng thuật toán Eller...")
+        tracing = self.record != "off"
+        for x, row in enumerate(eller_rows(self.size, self.rng)):
+            self.maze[x] = row
+            if tracing:
+                self.generation_path.append(("row", x, row.tolist()))
+
+    def _recursive_division_maze(self):
+        """
+        Phân chia đệ quy (dùng stack công việc thay cho đệ quy Python):
+        - mở toàn bộ phần bên trong lưới, sau đó chia mỗi vùng bằng một bức tường ngang hoặc dọc
+          (vẽ bằng một phép gán slice) và chừa lại một lối đi
+        - mỗi vùng được lưu theo tọa độ ô (hàng đầu, cột đầu, hàng cuối, cột cuối) nửa mở,
+          vùng chỉ còn rộng hoặc cao 1 ô là hành lang, không chia nữa
+        """
+        print("\nĐang tạo mê cung bằng thuật toán Recursive Division...")
+        n = self.size
+        width = 2*n + 1
+        height = 2*n + 1
+        maze = self.maze
+        tracing = self.record != "off"
+        trace = self.generation_path.append
+        stream = self.random
+
+        maze[1:height - 1, 1:width - 1] = 0
+        if tracing:
+            trace(("open_area", 1, 1, height - 2, width - 2))
+
+        # Chỉ đưa vào stack các vùng còn chia được (cao và rộng ít nhất 2 ô)
+        stack = [(0, 0, n, n)] if n > 1 else []
+        buffer, pos = stream.buffer, stream.pos
+        while stack:
+            r0, c0, r1, c1 = stack.pop()
+            rows = r1 - r0
+            cols = c1 - c0
+
+            # Mỗi lần chia dùng 2 số ngẫu nhiên (vị trí tường, vị trí lối đi),
+            # vùng vuông dùng thêm 1 số để chọn hướng; chia theo chiều dài hơn
+            if pos + 3 > len(buffer):
+                buffer, pos = buffer[pos:] + stream.refill(), 0
+            if rows == cols:
+                horizontal = buffer[pos] < 0.5
+                pos += 1
+            else:
+                horizontal = rows > cols
+            if horizontal:
+                k = r0 + int(buffer[pos]*(rows - 1))
+                gap = c0 + int(buffer[pos + 1]*cols)
+                pos += 2
+                wall_x = 2*k + 2
+                maze[wall_x, 2*c0:2*c1 + 1] = 1
+                maze[wall_x, 2*gap + 1] = 0
+                if tracing:
+                    trace(("division_wall", wall_x, 2*c0, wall_x, 2*c1))
+                    trace(("break_wall", wall_x, 2*gap + 1))
+                if r1 - k > 2:
+                    stack.append((k + 1, c0, r1, c1))
+                if k > r0:
+                    stack.append((r0, c0, k + 1, c1))
+            else:
+                k = c0 + int(buffer[pos]*(cols - 1))
+                gap = r0 + int(buffer[pos + 1]*rows)
+                pos += 2
+                wall_y = 2*k + 2
+                maze[2*r0:2*r1 + 1, wall_y] = 1
+                maze[2*gap + 1, wall_y] = 0
+                if tracing:
+                    trace(("division_wall", 2*r0, wall_y, 2*r1, wall_y))
+                    trace(("break_wall", 2*gap + 1, wall_y))
+                if c1 - k > 2:
+                    stack.append((r0, k + 1, r1, c1))
+                if k > c0:
+                    stack.append((r0, c0, r1, k + 1))
+        stream.buffer, stream.pos = buffer, pos
+
+    def _walk_grid(self):
+        """
+        Chuẩn bị lưới ô có viền dùng chung cho các thuật toán đi ngẫu nhiên:
+        trả về (mảng đánh dấu bytearray với viền = 2, độ lệch 4 hướng trên lưới ô,
+        độ lệch 4 hướng trên lưới mê cung)
+        """
+        n = self.size
+        padded = n + 2
+        grid_width = 2*n + 1
+        marks = bytearray(padded * padded)
+        marks[:padded] = b"\x02" * padded
+        marks[-padded:] = b"\x02" * padded
+        marks[::padded] = b"\x02" * padded
+        marks[padded - 1::padded] = b"\x02" * padded
+        return marks, (padded, -padded, 1, -1), (grid_width, -grid_width, 1, -1)
+
+    def _cell_to_grid(self, cell):
+        """
+        Đổi chỉ số ô trên lưới ô có viền sang chỉ số tuyến tính trên lưới mê cung
+        """
+        row, col = divmod(cell, self.size + 2)
+        return (2*row - 1)*(2*self.size + 1) + 2*col - 1
+
+    def _wilson_maze(self):
+        """
+        Thuật toán Wilson: cây khung đều (uniform spanning tree) bằng các bước đi ngẫu nhiên xóa vòng
+        - mỗi lần đi ngẫu nhiên từ một ô chưa thuộc cây cho tới khi chạm cây, ghi lại hướng rời đi
+          cuối cùng của mỗi ô vào mảng int8 (ghi đè hướng cũ chính là xóa vòng)
+        - sau đó đi lại theo các hướng đã ghi để nối đường đi đã xóa vòng vào cây
+        - hướng đi được rút theo lô bằng một lời gọi vector hóa; bước đi ra viền bị loại và rút lại
+          nên mỗi ô chọn đều trong các hàng xóm hợp lệ (không làm lệch phân phối)
+        """
+        print("\nĐang tạo mê cung bằng thuật toán Wilson...")
+        n = self.size
+        padded = n + 2
+        grid_width = 2*n + 1
+        tracing = self.record != "off"
+        trace = self.generation_path.append
+        in_tree, cell_offsets, grid_offsets = self._walk_grid()
+        exit_dir_arr = np.zeros(padded * padded, dtype=np.int8)
+        exit_dir = memoryview(exit_dir_arr)
+        opened_arr = np.empty(2*n*n, dtype=np.int32)
+        opened = memoryview(opened_arr)
+
+        root_row, root_col = self.rng.integers(1, n + 1, size=2).tolist()
+        root = root_row*padded + root_col
+        in_tree[root] = 1
+        opened[0] = self._cell_to_grid(root)
+        num_opened = 1
+        if tracing:
+            trace(("start_cell", *divmod(opened[0], grid_width)))
+
+        directions, pos = [], 0
+        for start in range(padded + 1, padded*(n + 1) - 1):
+            if in_tree[start]:
+                continue
+
+            # Đi ngẫu nhiên cho tới khi chạm cây
+            cell = start
+            while not in_tree[cell]:
+                if pos == len(directions):
+                    directions, pos = self.rng.integers(0, 4, size=WALK_BATCH, dtype=np.int8).tolist(), 0
+                d = directions[pos]
+                pos += 1
+                if in_tree[cell + cell_offsets[d]] == 2:
+                    continue
+                exit_dir[cell] = d
+                cell += cell_offsets[d]
+
+            # Nối đường đi đã xóa vòng vào cây
+            cell = start
+            while not in_tree[cell]:
+                in_tree[cell] = 1
+                d = exit_dir[cell]
+                cell_grid = self._cell_to_grid(cell)
+                opened[num_opened] = cell_grid
+                opened[num_opened + 1] = cell_grid + grid_offsets[d]
+                num_opened += 2
+                if tracing:
+                    trace(("new_cell", *divmod(cell_grid, grid_width)))
+                    trace(("break_wall", *divmod(cell_grid + grid_offsets[d], grid_width)))
+                cell += cell_offsets[d]
+
+        rows, cols = np.divmod(opened_arr[:num_opened], grid_width)
+        self.maze[rows, cols] = 0
+
+    def _aldous_broder_maze(self):
+        """
+        Thuật toán Aldous-Broder: đi ngẫu nhiên trên toàn lưới, mỗi khi bước vào một ô chưa thăm
+        thì phá tường giữa ô trước và ô đó; dừng khi đã thăm hết các ô (cây khung đều)
+        - hướng đi được rút theo lô bằng một lời gọi vector hóa; bước đi ra viền bị loại và rút lại
+        """
+        print("\nĐang tạo mê cung bằng thuật toán Aldous-Broder...")
+        n = self.size
+        padded = n + 2
+        grid_width = 2*n + 1
+        tracing = self.record != "off"
+        trace = self.generation_path.append
+        visited, cell_offsets, grid_offsets = self._walk_grid()
+        opened_arr = np.empty(2*n*n, dtype=np.int32)
+        opened = memoryview(opened_arr)
+
+        start_row, start_col = self.rng.integers(1, n + 1, size=2).tolist()
+        cell = start_row*padded + start_col
+        visited[cell] = 1
+        opened[0] = self._cell_to_grid(cell)
+        num_opened = 1
+        remaining = n*n - 1
+        if tracing:
+            trace(("start_cell", *divmod(opened[0], grid_width)))
+
+        while remaining:
+            for d in self.rng.integers(0, 4, size=WALK_BATCH, dtype=np.int8).tolist():
+                next_cell = cell + cell_offsets[d]
+                mark = visited[next_cell]
+                if mark == 2:
+                    continue
+                if not mark:
+                    visited[next_cell] = 1
+                    cell_grid = self._cell_to_grid(next_cell)
+                    opened[num_opened] = cell_grid - grid_offsets[d]
+                    opened[num_opened + 1] = cell_grid
+                    num_opened += 2
+                    if tracing:
+                        trace(("break_wall", *divmod(cell_grid - grid_offsets[d], grid_width)))
+                        trace(("new_cell", *divmod(cell_grid, grid_width)))
+                    remaining -= 1
+                    if not remaining:
+                        break
+                cell = next_cell
+
+        rows, cols = np.divmod(opened_arr[:num_opened], grid_width)
+        self.maze[rows, cols] = 0
 
     def add_random_paths(self):
         """
         Thêm đường đi ngẫu nhiên để tăng ngã rẽ
+        Các bức tường có thể phá (tường nằm giữa hai ô, có ít nhất 2 ô kề là đường đi)
+        được tìm bằng phép so sánh các lát cắt dịch chuyển trên toàn lưới thay cho vòng lặp từng ô
         """
         num_extra_paths = int(self.size * self.size * self.complexity)
-        width = 2*self.size + 1
-        height = 2*self.size + 1
+        grid = np.asarray(self.maze)
+        passage = (grid == 0).view(np.uint8)
+
+        # Tường nằm giữa hai ô có dạng (lẻ, chẵn) hoặc (chẵn, lẻ); xét từng dạng bằng lát cắt bước 2
+        # và đếm số ô kề là đường đi bằng 4 lát cắt dịch lên/xuống/trái/phải
+        wall_x, wall_y = [], []
+        for row0, col0 in ((1, 2), (2, 1)):
+            walls = grid[row0:-1:2, col0:-1:2]
+            path_count = (passage[row0 - 1:-2:2, col0:-1:2] + passage[row0 + 1::2, col0:-1:2]
+                          + passage[row0:-1:2, col0 - 1:-2:2] + passage[row0:-1:2, col0 + 1::2])
+            rows, cols = np.nonzero((walls == 1) & (path_count >= 2))
+            wall_x.append(rows*2 + row0)
+            wall_y.append(cols*2 + col0)
+        wall_x = np.concatenate(wall_x)
+        wall_y = np.concatenate(wall_y)
 
-        walls = []
-        for x in range(1, height-1):
-            for y in range(1, width-1):
-                if self.maze[x, y] == 1 and ((x % 2 == 1 and y % 2 == 0) or (x % 2 == 0 and y % 2 == 1)):
-                    path_count = sum(1 for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]
-                                     if 0 <= x + dx < height and 0 <= y + dy < width and self.maze[x + dx, y + dy] == 0)
-                    if path_count >= 2:
-                        walls.append((x, y))
-
-        random.shuffle(walls)
-        for i in range(min(num_extra_paths, len(walls))):
-            x, y = walls[i]
-            self.maze[x, y] = 0
-            self.generation_path.append(("wall", x, y))
+        # Chọn ngẫu nhiên các bức tường cần phá bằng một lần gọi rng rồi phá bằng một phép gán chỉ số
+        chosen = self.rng.choice(len(wall_x), size=min(num_extra_paths, len(wall_x)), replace=False)
+        wall_x = wall_x[chosen]
+        wall_y = wall_y[chosen]
+        self.maze[wall_x, wall_y] = 0
+        self.invalidate_cache()
+        if self.record != "off":
+            self.generation_path.extend(("wall", x, y) for x, y in zip(wall_x.tolist(), wall_y.tolist()))
 
     def get_maze(self):
         """
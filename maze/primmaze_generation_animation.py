@@ -60,8 +60,10 @@ def animate_prim_maze(size=15, interval=100):
                 current_cell = (step[1], step[2])
                 visited_cells.add(current_cell)
             elif step[0] == "wall_candidate":
-                # Không làm gì ở đây vì các ô hàng xóm sẽ được xử lý trong bước "neighbors"
-                pass
+                # Đánh dấu ô hàng xóm ngay khi được thêm vào danh sách tường
+                # (ở chế độ ghi "compact" không có bước "neighbors")
+                if (step[3], step[4]) not in visited_cells:
+                    maze[step[3], step[4]] = 3  # Ô hàng xóm
             elif step[0] == "neighbors":
                 # Đặt lại các ô hàng xóm trước đó thành trạng thái phù hợp
                 for x, y in [(i, j) for i in range(height) for j in range(width) if maze[i, j] == 3]:
@@ -0,0 +1,54 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from maze.maze import Maze
+from algorithm import corridor_graph_final
+
+
+def assert_valid_path(maze, path):
+    grid = np.asarray(maze.maze)
+    assert path[0] == tuple(maze.start)
+    assert path[-1] == tuple(maze.end)
+    for x, y in path:
+        assert grid[x, y] == 0, f"đường đi xuyên tường tại {(x, y)}"
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        assert abs(x1 - x2) + abs(y1 - y2) == 1
+
+
+def test_corridor_path_after_in_place_edit():
+    maze = Maze(30, complexity=0.3, algorithm="prim", record="off", seed=7)
+    path = corridor_graph_final.find_path(maze)
+    assert_valid_path(maze, path)
+    graph = corridor_graph_final.corridor_graph(maze)
+
+    # Chặn một ô giữa đường đi bằng cách sửa tại chỗ: cache chỉ so danh tính lưới nên vẫn giữ đồ thị cũ
+    x, y = path[len(path) // 2]
+    maze.maze[x, y] = 1
+    assert corridor_graph_final.corridor_graph(maze) is graph
+
+    # Sửa tại chỗ phải đi kèm invalidate_cache
+    maze.invalidate_cache()
+    path = corridor_graph_final.find_path(maze)
+    if path is not None:
+        assert (x, y) not in path
+        assert_valid_path(maze, path)
+
+
+def test_corridor_path_after_in_place_edit_deep_check():
+    maze = Maze(30, complexity=0.3, algorithm="prim", storage="bitpacked", record="off", seed=7)
+    path = corridor_graph_final.find_path(maze)
+    version = maze.grid_version
+    assert maze.check_grid(deep=True) == version
+
+    # Quên invalidate_cache: check_grid(deep=True) phát hiện qua CRC32
+    x, y = path[len(path) // 2]
+    maze.maze[x, y] = 1
+    assert maze.check_grid(deep=True) > version
+
+    path = corridor_graph_final.find_path(maze)
+    if path is not None:
+        assert (x, y) not in path
+        assert_valid_path(maze, path)
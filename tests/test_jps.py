@@ -0,0 +1,26 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from maze.maze import Maze
+from algorithm import bfs_final
+from algorithm import jps_final
+
+
+def test_jump_tables_cached_between_queries():
+    maze = Maze(30, complexity=0.3, algorithm="prim", record="off", seed=3)
+    tables = jps_final.jump_tables(maze)
+    path = jps_final.find_path(maze)
+    assert jps_final.jump_tables(maze) is tables
+    assert len(path) == len(bfs_final.find_path(maze))
+
+    # Sửa lưới tại chỗ rồi báo cho cache: bảng phải được tính lại
+    x, y = path[len(path) // 2]
+    maze.maze[x, y] = 1
+    maze.invalidate_cache()
+    assert jps_final.jump_tables(maze) is not tables
+    path = jps_final.find_path(maze)
+    expected = bfs_final.find_path(maze)
+    assert (path is None) == (expected is None)
+    if path is not None:
+        assert len(path) == len(expected)
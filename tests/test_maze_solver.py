@@ -0,0 +1,63 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from maze.maze import Maze
+from algorithm import bfs_final
+from algorithm.maze_solver import MazeSolver
+
+
+def bfs_length(maze, target):
+    end = maze.end
+    maze.end = target
+    try:
+        path = bfs_final.find_path(maze)
+    finally:
+        maze.end = end
+    return None if path is None else len(path)
+
+
+def random_targets(maze, count, seed):
+    cells = np.argwhere(np.asarray(maze.maze) == 0)
+    rng = np.random.default_rng(seed)
+    return [tuple(int(v) for v in cells[i]) for i in rng.integers(0, len(cells), size=count)]
+
+
+def test_solve_many_matches_bfs_lengths():
+    maze = Maze(25, complexity=0.3, algorithm="prim", record="off", seed=21)
+    targets = random_targets(maze, 20, seed=1) + [maze.start, maze.end]
+    paths = MazeSolver(maze).solve_many(maze.start, targets)
+    for target, path in zip(targets, paths):
+        assert path[0] == maze.start and path[-1] == target
+        assert len(path) == bfs_length(maze, target)
+
+
+def test_solve_many_stops_when_targets_settled():
+    maze = Maze(25, complexity=0.3, algorithm="prim", record="off", seed=22)
+    solver = MazeSolver(maze)
+    targets = random_targets(maze, 3, seed=2)
+    early, early_steps = solver.solve_many(maze.start, targets, return_search_steps=True)
+    full, full_steps = solver.solve_many(maze.start, targets, stop_early=False, return_search_steps=True)
+    assert [len(path) for path in early] == [len(path) for path in full]
+    # Dừng ngay sau khi thăm đích cuối cùng, trước khi lan hết vùng liên thông
+    assert len(early_steps) < len(full_steps)
+    assert early_steps[-1] in targets
+    assert set(targets) <= set(early_steps)
+
+
+def test_solve_many_unreachable_target():
+    maze = Maze(25, complexity=0.3, algorithm="prim", record="off", seed=23)
+    grid = np.asarray(maze.maze)
+    # Cô lập một ô trống bằng cách xây tường quanh nó
+    x, y = 9, 9
+    grid[x, y] = 0
+    grid[x - 1, y] = grid[x + 1, y] = grid[x, y - 1] = grid[x, y + 1] = 1
+    maze.invalidate_cache()
+    reachable = random_targets(maze, 1, seed=3)[0]
+    if bfs_length(maze, reachable) is None:
+        reachable = maze.start
+    paths = MazeSolver(maze).solve_many(maze.start, [(x, y), reachable])
+    assert paths[0] is None
+    assert paths[1] is not None and len(paths[1]) == bfs_length(maze, reachable)
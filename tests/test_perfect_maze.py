@@ -0,0 +1,36 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from maze.maze import Maze, GRID_STORAGES
+from algorithm import bfs_final
+
+GENERATORS = ["dfs_backtrack", "dfs_backtrack_classic", "prim", "kruskal", "eller",
+              "recursive_division", "wilson", "aldous_broder"]
+
+
+@pytest.mark.parametrize("storage", GRID_STORAGES)
+@pytest.mark.parametrize("algorithm", GENERATORS)
+def test_generator_builds_perfect_maze(algorithm, storage):
+    maze = Maze(20, complexity=0, algorithm=algorithm, storage=storage, record="off", seed=7)
+    grid = np.asarray(maze.maze, dtype=np.uint8)
+    open_cells = grid == 0
+
+    # Liên thông: từ ô bắt đầu đi được tới mọi ô trống
+    distances, _ = bfs_final.distance_field(maze)
+    assert np.all(distances[open_cells] >= 0)
+
+    # Không có chu trình: đồ thị các ô trống là một cây, số ô = số cạnh + 1
+    edges = np.count_nonzero(open_cells[1:, :] & open_cells[:-1, :]) \
+        + np.count_nonzero(open_cells[:, 1:] & open_cells[:, :-1])
+    assert np.count_nonzero(open_cells) == edges + 1
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_fast_dfs_matches_classic(seed):
+    fast = Maze(25, complexity=0, algorithm="dfs_backtrack", record="off", seed=seed)
+    classic = Maze(25, complexity=0, algorithm="dfs_backtrack_classic", record="off", seed=seed)
+    assert np.array_equal(np.asarray(fast.maze), np.asarray(classic.maze))
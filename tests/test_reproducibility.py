@@ -0,0 +1,24 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from maze.maze import Maze, GRID_STORAGES, RECORD_MODES
+
+GENERATORS = ["dfs_backtrack", "dfs_backtrack_classic", "prim", "kruskal", "eller",
+              "recursive_division", "wilson", "aldous_broder"]
+
+
+@pytest.mark.parametrize("algorithm", GENERATORS)
+def test_same_seed_same_grid_across_storage_and_record(algorithm):
+    reference = None
+    for storage in GRID_STORAGES:
+        for record in RECORD_MODES:
+            maze = Maze(12, complexity=2, algorithm=algorithm, storage=storage, record=record, seed=1234)
+            grid = np.asarray(maze.maze, dtype=np.uint8)
+            if reference is None:
+                reference = grid
+            # Kiểu lưu trữ và chế độ ghi không được làm lệch dãy số ngẫu nhiên
+            assert np.array_equal(grid, reference), (storage, record)
@@ -0,0 +1,69 @@
+import heapq
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from maze.maze import Maze
+from algorithm.search_trace import SearchTrace, CHECKPOINT_INTERVAL
+
+
+def traced_search(maze):
+    """
+    A* heap lười trên lưới có viền: ghi đồng thời SearchTrace và bản chụp frontier đầy đủ sau mỗi bước
+    """
+    grid = np.asarray(maze.maze)
+    height, width = grid.shape
+    padded_width = width + 2
+    padded = np.ones((height + 2, padded_width), dtype=np.uint8)
+    padded[1:-1, 1:-1] = grid != 0
+    blocked = bytearray(padded.tobytes())
+    start = (maze.start[0] + 1)*padded_width + maze.start[1] + 1
+    end_x, end_y = maze.end[0] + 1, maze.end[1] + 1
+
+    def h(index):
+        x, y = divmod(index, padded_width)
+        return abs(x - end_x) + abs(y - end_y)
+
+    trace = SearchTrace(padded_width)
+    snapshots = []
+    heap = [(h(start), 0, start)]
+    g = {start: 0}
+    count = 0
+    trace.push(start)
+    trace.mark()
+    snapshots.append({(i // padded_width - 1, i % padded_width - 1) for _, _, i in heap})
+    while heap:
+        _, _, current = heapq.heappop(heap)
+        trace.pop(current)
+        if blocked[current]:
+            continue
+        blocked[current] = 1
+        trace.visit(current)
+        for offset in (-padded_width, 1, padded_width, -1):
+            neighbor = current + offset
+            if not blocked[neighbor] and g[current] + 1 < g.get(neighbor, 1 << 30):
+                g[neighbor] = g[current] + 1
+                count += 1
+                heapq.heappush(heap, (g[neighbor] + h(neighbor), count, neighbor))
+                trace.push(neighbor)
+        trace.mark()
+        snapshots.append({(i // padded_width - 1, i % padded_width - 1) for _, _, i in heap})
+    return trace, snapshots
+
+
+def test_replayed_frontier_matches_snapshots():
+    maze = Maze(30, complexity=0.3, algorithm="prim", record="off", seed=4)
+    trace, snapshots = traced_search(maze)
+    assert len(trace) == len(snapshots) > 3*CHECKPOINT_INTERVAL
+
+    # Truy cập ngẫu nhiên từ cuối về đầu: checkpoint được tạo lười khi cần
+    for state in reversed(range(len(snapshots))):
+        frontier = trace[state]
+        assert len(frontier) == len(set(frontier))
+        assert set(frontier) == snapshots[state], state
+
+    # Duyệt tuần tự cho cùng kết quả
+    for frontier, snapshot in zip(trace, snapshots):
+        assert set(frontier) == snapshot
@@ -0,0 +1,37 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from maze.maze import Maze
+from algorithm.solvers import solve, solver_names
+
+
+def test_expansions_without_recording_steps():
+    maze = Maze(25, complexity=0.2, algorithm="prim", record="off", seed=11)
+    for name in solver_names():
+        recorded = solve(maze, name, record_steps=True)
+        plain = solve(maze, name)
+        assert plain.search_steps is None and plain.trace is None
+        assert plain.expansions == recorded.expansions == len(recorded.search_steps), name
+        assert plain.path == recorded.path, name
+
+
+def test_trace_is_frontier_per_step():
+    maze = Maze(15, complexity=0.2, algorithm="prim", record="off", seed=5)
+    for name in solver_names():
+        result = solve(maze, name, record_steps=True)
+        if result.trace is None:
+            continue
+        assert len(result.trace) >= len(result.search_steps), name
+        for frontier in (result.trace[0], result.trace[len(result.search_steps) - 1]):
+            assert all(isinstance(cell, tuple) and len(cell) == 2 for cell in frontier), name
+
+
+def test_bidirectional_sides_per_step():
+    maze = Maze(15, complexity=0.2, algorithm="prim", record="off", seed=8)
+    for name in ("Bidirectional BFS", "Bidirectional A*"):
+        result = solve(maze, name, record_steps=True)
+        assert len(result.sides) == len(result.search_steps), name
+        assert set(result.sides) == {0, 1}, name
+        assert solve(maze, name).sides is None
+    assert solve(maze, "BFS", record_steps=True).sides is None
@@ -0,0 +1,56 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from maze.maze import Maze
+from algorithm import bfs_final, dijkstra_final
+
+
+def corridor_maze():
+    """
+    Mê cung 7x7 có hai đường từ (1, 1) tới (5, 5):
+    đường ngắn dọc cột 1 (8 bước) và đường vòng qua hàng 1 (12 bước)
+    """
+    maze = Maze(3, complexity=0, algorithm="dfs_backtrack", record="off", seed=0)
+    maze.maze = np.array([
+        [1, 1, 1, 1, 1, 1, 1],
+        [1, 0, 0, 0, 0, 0, 1],
+        [1, 0, 1, 1, 1, 0, 1],
+        [1, 0, 1, 0, 0, 0, 1],
+        [1, 0, 1, 0, 1, 1, 1],
+        [1, 0, 0, 0, 0, 0, 1],
+        [1, 1, 1, 1, 1, 1, 1],
+    ], dtype=np.uint8)
+    maze.invalidate_cache()
+    return maze
+
+
+def test_weighted_paths_avoid_expensive_cells():
+    maze = corridor_maze()
+    costs = np.ones(maze.maze.shape, dtype=np.uint8)
+    costs[2:5, 1] = 50  # đường ngắn đi qua ba ô đắt
+    maze.set_costs(costs)
+
+    bfs_path = bfs_final.find_path(maze)
+    dijkstra_path = dijkstra_final.find_path(maze)
+    a_star_path = dijkstra_final.find_path_a_star(maze)
+
+    assert len(bfs_path) == 9
+    assert dijkstra_final.path_cost(maze, dijkstra_path) == 12
+    assert dijkstra_final.path_cost(maze, a_star_path) == dijkstra_final.path_cost(maze, dijkstra_path)
+    assert dijkstra_final.path_cost(maze, dijkstra_path) < dijkstra_final.path_cost(maze, bfs_path)
+
+
+@pytest.mark.parametrize("costs", [
+    np.ones((6, 7), dtype=np.uint8),
+    np.ones((7, 7), dtype=np.int64),
+    np.ones((7, 7), dtype=np.float32),
+])
+def test_set_costs_rejects_bad_layer(costs):
+    maze = corridor_maze()
+    with pytest.raises(ValueError):
+        maze.set_costs(costs)
+    assert maze.costs is None
@@ -26,12 +26,16 @@ def analyze_cells_explored():
         # First row contains headers
         df = pd.read_csv(filepath)
         
-        # Rename columns for clarity if needed
-        if len(df.columns) >= 5:  # Expected number of columns
-            df.columns = ['Maze Size', 'Generation Algorithm', 'DFS Cells', 'BFS Cells', 
-                          'A* Cells']
-        elif len(df.columns) == 4:  # Structure from updated data.py
-            df.columns = ['Maze Size', 'DFS Cells', 'BFS Cells', 'A* Cells']
+        # Algorithm columns come from the header written by data.py (one per solver)
+        algorithm_columns = [col for col in df.columns if str(col).endswith(' Cells')]
+        if not algorithm_columns:
+            # Rename columns of older result files
+            if len(df.columns) >= 5:  # Expected number of columns
+                df.columns = ['Maze Size', 'Generation Algorithm', 'DFS Cells', 'BFS Cells', 
+                              'A* Cells']
+            elif len(df.columns) == 4:  # Structure from updated data.py
+                df.columns = ['Maze Size', 'DFS Cells', 'BFS Cells', 'A* Cells']
+            algorithm_columns = ['DFS Cells', 'BFS Cells', 'A* Cells']
         
         # Skip the header row if it was already in the CSV
         if df.iloc[0, 0] == 'Maze Size' or str(df.iloc[0, 0]).lower() == 'maze size':
@@ -40,7 +44,7 @@ def analyze_cells_explored():
             
         # Convert numeric columns to appropriate types
         df['Maze Size'] = pd.to_numeric(df['Maze Size'], errors='coerce')
-        for col in ['DFS Cells', 'BFS Cells', 'A* Cells']:
+        for col in algorithm_columns:
             df[col] = pd.to_numeric(df[col], errors='coerce')
             
         # Remove any rows with NaN values
@@ -51,12 +55,12 @@ def analyze_cells_explored():
         
         # Plot average cells explored by maze size
         plt.figure(figsize=(12, 8))
-        width = 0.25  # width of the bars
+        width = 0.8 / len(algorithm_columns)  # width of the bars
         x = np.arange(len(grouped_by_size['Maze Size']))
         
-        plt.bar(x - width, grouped_by_size['DFS Cells'], width, label='DFS')
-        plt.bar(x, grouped_by_size['BFS Cells'], width, label='BFS')
-        plt.bar(x + width, grouped_by_size['A* Cells'], width, label='A*')
+        for i, col in enumerate(algorithm_columns):
+            offset = (i - (len(algorithm_columns) - 1) / 2) * width
+            plt.bar(x + offset, grouped_by_size[col], width, label=col[:-len(' Cells')])
         
         plt.xlabel('Maze Size')
         plt.ylabel('Average Cells Explored')
@@ -69,7 +73,7 @@ def analyze_cells_explored():
         
         print("Visualization created and saved to results directory.")
         print("\nAverage cells explored by maze size:")
-        print(grouped_by_size[['Maze Size', 'DFS Cells', 'BFS Cells', 'A* Cells']])
+        print(grouped_by_size[['Maze Size'] + algorithm_columns])
         
     except Exception as e:
         print(f"Error analyzing cells explored: {e}")
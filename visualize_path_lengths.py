@@ -26,12 +26,16 @@ def analyze_path_lengths():
         # First row contains headers
         df = pd.read_csv(filepath)
         
-        # Rename columns for clarity if needed
-        if len(df.columns) >= 5:  # Expected number of columns
-            df.columns = ['Maze Size', 'Generation Algorithm', 'DFS Length', 'BFS Length', 
-                          'A* Length']
-        elif len(df.columns) >= 4:  # Expected number of columns when only using prim algorithm
-            df.columns = ['Maze Size', 'DFS Length', 'BFS Length', 'A* Length']
+        # Algorithm columns come from the header written by data.py (one per solver)
+        algorithm_columns = [col for col in df.columns if str(col).endswith(' Length')]
+        if not algorithm_columns:
+            # Rename columns of older result files
+            if len(df.columns) >= 5:  # Expected number of columns
+                df.columns = ['Maze Size', 'Generation Algorithm', 'DFS Length', 'BFS Length', 
+                              'A* Length']
+            elif len(df.columns) >= 4:  # Expected number of columns when only using prim algorithm
+                df.columns = ['Maze Size', 'DFS Length', 'BFS Length', 'A* Length']
+            algorithm_columns = ['DFS Length', 'BFS Length', 'A* Length']
         
         # Skip the header row if it was already in the CSV
         if df.iloc[0, 0] == 'Maze Size' or str(df.iloc[0, 0]).lower() == 'maze size':
@@ -40,7 +44,7 @@ def analyze_path_lengths():
             
         # Convert numeric columns to appropriate types
         df['Maze Size'] = pd.to_numeric(df['Maze Size'], errors='coerce')
-        for col in ['DFS Length', 'BFS Length', 'A* Length']:
+        for col in algorithm_columns:
             df[col] = pd.to_numeric(df[col], errors='coerce')
             
         # Remove any rows with NaN values
@@ -51,12 +55,12 @@ def analyze_path_lengths():
         
         # Plot average path length by maze size
         plt.figure(figsize=(12, 8))
-        width = 0.25  # width of the bars
+        width = 0.8 / len(algorithm_columns)  # width of the bars
         x = np.arange(len(grouped_by_size['Maze Size']))
         
-        plt.bar(x - width, grouped_by_size['DFS Length'], width, label='DFS')
-        plt.bar(x, grouped_by_size['BFS Length'], width, label='BFS')
-        plt.bar(x + width, grouped_by_size['A* Length'], width, label='A*')
+        for i, col in enumerate(algorithm_columns):
+            offset = (i - (len(algorithm_columns) - 1) / 2) * width
+            plt.bar(x + offset, grouped_by_size[col], width, label=col[:-len(' Length')])
         
         plt.xlabel('Maze Size')
         plt.ylabel('Average Path Length (steps)')
@@ -69,7 +73,7 @@ def analyze_path_lengths():
         
         print("Visualization created and saved to results directory.")
         print("\nAverage path length by maze size:")
-        print(grouped_by_size[['Maze Size', 'DFS Length', 'BFS Length', 'A* Length']])
+        print(grouped_by_size[['Maze Size'] + algorithm_columns])
         
     except Exception as e:
         print(f"Error analyzing path lengths: {e}")